@@ -64,7 +64,9 @@ class Bot(socket.WSClient, global_client.Global):
         "_generate",
         "_intents",
         "_is_ready",
+        "_media_cache",
         "_proxy",
+        "_rate_limiter",
         "_request",
         "_sid",
         "_userId",
@@ -323,6 +325,8 @@ class Bot(socket.WSClient, global_client.Global):
         self.device_id = device_id or self.generate.device_id()
         self.request = utilities.RequestHandler(self, self.generate)
         self.account = account.Account(session=self.request)
+        self.media_cache = utilities.MediaCache()
+        self.rate_limiter = utilities.RateLimiter()
         if debug_log:
             utilities.enable_file_logging()
         super().__init__()
@@ -386,6 +390,40 @@ class Bot(socket.WSClient, global_client.Global):
     def proxy(self, value: Optional[str]) -> None:
         self._proxy = value
 
+    @property
+    def media_cache(self) -> utilities.MediaCache:
+        """
+        The cache of uploaded media.
+
+        :return: The media cache.
+        :rtype: MediaCache
+
+        Uploads are keyed by their content, so a bot that sends the same image repeatedly only uploads it once.
+        Set a `MediaCache` with a `directory` to keep the uploads across restarts.
+        """
+        return self._media_cache
+
+    @media_cache.setter
+    def media_cache(self, value: utilities.MediaCache) -> None:
+        self._media_cache = value
+
+    @property
+    def rate_limiter(self) -> utilities.RateLimiter:
+        """
+        The rate limiter shared by the bulk operations.
+
+        :return: The rate limiter.
+        :rtype: RateLimiter
+
+        Bulk fetches, moderation and broadcasts acquire it before every request, so they are bounded by its rate
+        instead of by round trip latency. Defaults to 5 requests per second.
+        """
+        return self._rate_limiter
+
+    @rate_limiter.setter
+    def rate_limiter(self, value: utilities.RateLimiter) -> None:
+        self._rate_limiter = value
+
     @property
     def generate(self) -> utilities.Generator:
         return self._generate
@@ -790,6 +828,32 @@ class Bot(socket.WSClient, global_client.Global):
         self.request.password = password
         return response
 
+    def refresh_login(self) -> None:
+        """
+        Logs in again with the stored email and password to replace an expiring session.
+
+        :raises LoginFailed: If the server rejected the login.
+        :return: None
+        :rtype: None
+
+        Only the session ID and secret are replaced. Unlike `run`, this does not restart the console,
+        the websocket or the certificate, and it never prompts for input, so it is safe to call from
+        the background session refresh thread. Requests sent meanwhile keep using the current session,
+        which is also kept if the login fails.
+        """
+        response = self.authenticate(
+            email=self.request.email,
+            password=self.request.password,
+        )
+        if response.get("api:statuscode") != 0:
+            raise entities.LoginFailed
+        self.sid = response["sid"]
+        self.secret = response.get("secret")
+        if self.request.email and self._cached:
+            entities.cache_login(
+                email=self.request.email, device=self.device_id, sid=response["sid"]
+            )
+
     def call_amino_certificate(self) -> None:
         response = self.request.http_handler.get(
             "https://app.pymino.site/amino_certificate",
@@ -916,6 +980,8 @@ class Bot(socket.WSClient, global_client.Global):
 
         self.__set_keys__()
         self.call_amino_certificate()
+        if self.request.session.can_refresh:
+            self.request.session.start()
         return response
 
     def __set_keys__(self):
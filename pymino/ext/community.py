@@ -1,11 +1,12 @@
 import base64
+import functools
 import random
 import time
 import uuid
-from collections.abc import Sequence
-from typing import Any, Literal, Optional, Union
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from typing import Any, Literal, Optional, Union, cast
 
-from pymino.ext import entities, global_client
+from pymino.ext import entities, global_client, utilities
 
 __all__ = ("Community",)
 
@@ -1118,6 +1119,94 @@ class Community:
             )
         )
 
+    def iter_users(
+        self,
+        userType: entities.UserTypes = entities.UserTypes.RECENT,
+        start: int = 0,
+        size: int = 25,
+        limit: Optional[int] = None,
+        prefetch: bool = True,
+        comId: Optional[int] = None,
+    ) -> "utilities.Paginator[entities.UserProfile]":
+        """
+        Iterates over the users of the community based on the specified user type.
+
+        :param userType: The type of users to iterate. Defaults to `UserTypes.RECENT`.
+        :type userType: UserTypes
+        :param start: The offset to start from (or resume at, see `Paginator.cursor`). Defaults to `0`.
+        :type start: int
+        :param size: The number of users fetched per request. Defaults to `25`.
+        :type size: int
+        :param limit: The maximum number of users to yield. Defaults to `None` (all of them).
+        :type limit: Optional[int]
+        :param prefetch: Whether or not to fetch the next page in the background. Defaults to `True`.
+        :type prefetch: bool
+        :param comId: The ID of the community. If not provided, the current community ID is used.
+        :type comId: Optional[int]
+        :return: A `Paginator` that yields `UserProfile` objects.
+        :rtype: Paginator[UserProfile]
+
+        Pages are fetched lazily and the next one is requested while the current one is consumed.
+
+        **Example usage:**
+
+        >>> for user in client.community.iter_users(limit=100):
+        ...     print(user.nickname)
+        """
+        comId = comId or self.community_id
+        return utilities.Paginator[entities.UserProfile].from_offset(
+            lambda start, size: self.fetch_users(userType, start, size, comId),
+            start,
+            size,
+            limit,
+            prefetch,
+        )
+
+    def bulk_fetch_users(
+        self,
+        userType: entities.UserTypes = entities.UserTypes.RECENT,
+        start: int = 0,
+        size: int = 25,
+        parallelism: int = 4,
+        limit: Optional[int] = None,
+        comId: Optional[int] = None,
+    ) -> "Iterator[entities.UserProfile]":
+        """
+        Fetches every user of the community based on the specified user type, several pages at a time.
+
+        :param userType: The type of users to fetch. Defaults to `UserTypes.RECENT`.
+        :type userType: UserTypes
+        :param start: The offset to start from. Defaults to `0`.
+        :type start: int
+        :param size: The number of users fetched per request. Defaults to `25`.
+        :type size: int
+        :param parallelism: The maximum number of requests in flight. Defaults to `4`.
+        :type parallelism: int
+        :param limit: The maximum number of users to yield. Defaults to `None` (all of them).
+        :type limit: Optional[int]
+        :param comId: The ID of the community. If not provided, the current community ID is used.
+        :type comId: Optional[int]
+        :return: An iterator of `UserProfile` objects, in listing order and without duplicates.
+        :rtype: Iterator[UserProfile]
+
+        Unlike `iter_users`, several offset windows are requested at once, so large scans are bounded by
+        `bot.rate_limiter` instead of by round trip latency. The scan ends at the first short window.
+
+        **Example usage:**
+
+        >>> members = list(client.community.bulk_fetch_users(size=100, parallelism=8))
+        """
+        comId = comId or self.community_id
+        return utilities.bulk_fetch(
+            lambda start, size: self.fetch_users(userType, start, size, comId),
+            start,
+            size,
+            parallelism,
+            limit,
+            key=lambda user: user.userId,
+            rate_limiter=self.bot.rate_limiter,
+        )
+
     def fetch_online_users(
         self,
         start: Optional[int] = 0,
@@ -1198,6 +1287,88 @@ class Community:
             )
         )
 
+    def iter_online_users(
+        self,
+        start: int = 0,
+        size: int = 25,
+        limit: Optional[int] = None,
+        prefetch: bool = True,
+        comId: Optional[int] = None,
+    ) -> "utilities.Paginator[entities.UserProfile]":
+        """
+        Iterates over the online users of the community.
+
+        :param start: The offset to start from (or resume at, see `Paginator.cursor`). Defaults to `0`.
+        :type start: int
+        :param size: The number of users fetched per request. Defaults to `25`.
+        :type size: int
+        :param limit: The maximum number of users to yield. Defaults to `None` (all of them).
+        :type limit: Optional[int]
+        :param prefetch: Whether or not to fetch the next page in the background. Defaults to `True`.
+        :type prefetch: bool
+        :param comId: The ID of the community. If not provided, the current community ID is used.
+        :type comId: Optional[int]
+        :return: A `Paginator` that yields `UserProfile` objects.
+        :rtype: Paginator[UserProfile]
+
+        Pages are fetched lazily and the next one is requested while the current one is consumed.
+
+        **Example usage:**
+
+        >>> for user in client.community.iter_online_users():
+        ...     print(user.nickname)
+        """
+        comId = comId or self.community_id
+        return utilities.Paginator[entities.UserProfile].from_offset(
+            lambda start, size: self.fetch_online_users(start, size, comId),
+            start,
+            size,
+            limit,
+            prefetch,
+        )
+
+    def bulk_fetch_online_users(
+        self,
+        start: int = 0,
+        size: int = 25,
+        parallelism: int = 4,
+        limit: Optional[int] = None,
+        comId: Optional[int] = None,
+    ) -> "Iterator[entities.UserProfile]":
+        """
+        Fetches every online user of the community, several pages at a time.
+
+        :param start: The offset to start from. Defaults to `0`.
+        :type start: int
+        :param size: The number of users fetched per request. Defaults to `25`.
+        :type size: int
+        :param parallelism: The maximum number of requests in flight. Defaults to `4`.
+        :type parallelism: int
+        :param limit: The maximum number of users to yield. Defaults to `None` (all of them).
+        :type limit: Optional[int]
+        :param comId: The ID of the community. If not provided, the current community ID is used.
+        :type comId: Optional[int]
+        :return: An iterator of `UserProfile` objects, in listing order and without duplicates.
+        :rtype: Iterator[UserProfile]
+
+        Unlike `iter_online_users`, several offset windows are requested at once, so large scans are bounded by
+        `bot.rate_limiter` instead of by round trip latency. The scan ends at the first short window.
+
+        **Example usage:**
+
+        >>> online = list(client.community.bulk_fetch_online_users())
+        """
+        comId = comId or self.community_id
+        return utilities.bulk_fetch(
+            lambda start, size: self.fetch_online_users(start, size, comId),
+            start,
+            size,
+            parallelism,
+            limit,
+            key=lambda user: user.userId,
+            rate_limiter=self.bot.rate_limiter,
+        )
+
     def fetch_followers(
         self,
         userId: str,
@@ -1575,6 +1746,46 @@ class Community:
             )
         )
 
+    def iter_chats(
+        self,
+        start: int = 0,
+        size: int = 25,
+        limit: Optional[int] = None,
+        prefetch: bool = True,
+        comId: Optional[int] = None,
+    ) -> "utilities.Paginator[entities.ChatThread]":
+        """
+        Iterates over the chat threads the user has joined in the community.
+
+        :param start: The offset to start from (or resume at, see `Paginator.cursor`). Defaults to `0`.
+        :type start: int
+        :param size: The number of chats fetched per request. Defaults to `25`.
+        :type size: int
+        :param limit: The maximum number of chats to yield. Defaults to `None` (all of them).
+        :type limit: Optional[int]
+        :param prefetch: Whether or not to fetch the next page in the background. Defaults to `True`.
+        :type prefetch: bool
+        :param comId: The ID of the community. If not provided, the current community ID is used.
+        :type comId: Optional[int]
+        :return: A `Paginator` that yields `ChatThread` objects.
+        :rtype: Paginator[ChatThread]
+
+        Pages are fetched lazily and the next one is requested while the current one is consumed.
+
+        **Example usage:**
+
+        >>> for chat in client.community.iter_chats():
+        ...     print(chat.title)
+        """
+        comId = comId or self.community_id
+        return utilities.Paginator[entities.ChatThread].from_offset(
+            lambda start, size: self.fetch_chats(start, size, comId).parser(),
+            start,
+            size,
+            limit,
+            prefetch,
+        )
+
     def fetch_live_chats(
         self,
         start: int = 0,
@@ -1830,6 +2041,94 @@ class Community:
             )
         )
 
+    def iter_chat_members(
+        self,
+        chatId: str,
+        start: int = 0,
+        size: int = 25,
+        limit: Optional[int] = None,
+        prefetch: bool = True,
+        comId: Optional[int] = None,
+    ) -> "utilities.Paginator[entities.UserProfile]":
+        """
+        Iterates over the members of a chat thread.
+
+        :param chatId: The ID of the chat thread.
+        :type chatId: str
+        :param start: The offset to start from (or resume at, see `Paginator.cursor`). Defaults to `0`.
+        :type start: int
+        :param size: The number of members fetched per request. Defaults to `25`.
+        :type size: int
+        :param limit: The maximum number of members to yield. Defaults to `None` (all of them).
+        :type limit: Optional[int]
+        :param prefetch: Whether or not to fetch the next page in the background. Defaults to `True`.
+        :type prefetch: bool
+        :param comId: The ID of the community. If not provided, the current community ID is used.
+        :type comId: Optional[int]
+        :return: A `Paginator` that yields `UserProfile` objects.
+        :rtype: Paginator[UserProfile]
+
+        Pages are fetched lazily and the next one is requested while the current one is consumed.
+
+        **Example usage:**
+
+        >>> for member in client.community.iter_chat_members(chatId="0000-0000-0000-0000"):
+        ...     print(member.nickname)
+        """
+        comId = comId or self.community_id
+        return utilities.Paginator[entities.UserProfile].from_offset(
+            lambda start, size: self.fetch_chat_members(chatId, start, size, comId).members,
+            start,
+            size,
+            limit,
+            prefetch,
+        )
+
+    def bulk_fetch_chat_members(
+        self,
+        chatId: str,
+        start: int = 0,
+        size: int = 25,
+        parallelism: int = 4,
+        limit: Optional[int] = None,
+        comId: Optional[int] = None,
+    ) -> "Iterator[entities.UserProfile]":
+        """
+        Fetches every member of a chat thread, several pages at a time.
+
+        :param chatId: The ID of the chat thread.
+        :type chatId: str
+        :param start: The offset to start from. Defaults to `0`.
+        :type start: int
+        :param size: The number of members fetched per request. Defaults to `25`.
+        :type size: int
+        :param parallelism: The maximum number of requests in flight. Defaults to `4`.
+        :type parallelism: int
+        :param limit: The maximum number of members to yield. Defaults to `None` (all of them).
+        :type limit: Optional[int]
+        :param comId: The ID of the community. If not provided, the current community ID is used.
+        :type comId: Optional[int]
+        :return: An iterator of `UserProfile` objects, in listing order and without duplicates.
+        :rtype: Iterator[UserProfile]
+
+        Unlike `iter_chat_members`, several offset windows are requested at once, so large scans are bounded by
+        `bot.rate_limiter` instead of by round trip latency. The scan ends at the first short window.
+
+        **Example usage:**
+
+        >>> members = list(client.community.bulk_fetch_chat_members(chatId="0000-0000-0000-0000"))
+        """
+        comId = comId or self.community_id
+        return utilities.bulk_fetch(
+            lambda start, size: self.fetch_chat_members(chatId, start, size, comId).members,
+            start,
+            size,
+            parallelism,
+            limit,
+            key=lambda user: user.userId,
+            rate_limiter=self.bot.rate_limiter,
+        )
+
     def fetch_messages(
         self,
         chatId: str,
@@ -1900,6 +2199,49 @@ class Community:
             )
         )
 
+    def iter_messages(
+        self,
+        chatId: str,
+        start: int = 0,
+        size: int = 25,
+        limit: Optional[int] = None,
+        prefetch: bool = True,
+        comId: Optional[int] = None,
+    ) -> "utilities.Paginator[entities.CMessage]":
+        """
+        Iterates over the messages of a chat thread, newest first.
+
+        :param chatId: The ID of the chat thread.
+        :type chatId: str
+        :param start: The offset to start from (or resume at, see `Paginator.cursor`). Defaults to `0`.
+        :type start: int
+        :param size: The number of messages fetched per request. Defaults to `25`.
+        :type size: int
+        :param limit: The maximum number of messages to yield. Defaults to `None` (all of them).
+        :type limit: Optional[int]
+        :param prefetch: Whether or not to fetch the next page in the background. Defaults to `True`.
+        :type prefetch: bool
+        :param comId: The ID of the community. If not provided, the current community ID is used.
+        :type comId: Optional[int]
+        :return: A `Paginator` that yields `CMessage` objects.
+        :rtype: Paginator[CMessage]
+
+        Pages are fetched lazily and the next one is requested while the current one is consumed.
+
+        **Example usage:**
+
+        >>> for message in client.community.iter_messages(chatId="0000-0000-0000-0000", limit=200):
+        ...     print(message.content)
+        """
+        comId = comId or self.community_id
+        return utilities.Paginator[entities.CMessage].from_offset(
+            lambda start, size: map(entities.CMessage, self.fetch_messages(chatId, start, size, comId).data),
+            start,
+            size,
+            limit,
+            prefetch,
+        )
+
     def fetch_blogs(
         self,
         size: int = 25,
@@ -2147,6 +2489,49 @@ class Community:
             )
         )
 
+    def iter_leaderboard(
+        self,
+        leaderboardType: entities.LeaderboardTypes = entities.LeaderboardTypes.HALL_OF_FAME,
+        start: int = 0,
+        size: int = 20,
+        limit: Optional[int] = None,
+        prefetch: bool = True,
+        comId: Optional[int] = None,
+    ) -> "utilities.Paginator[entities.UserProfile]":
+        """
+        Iterates over the leaderboard of the community.
+
+        :param leaderboardType: The type of leaderboard. Defaults to `LeaderboardTypes.HALL_OF_FAME`.
+        :type leaderboardType: LeaderboardTypes
+        :param start: The offset to start from (or resume at, see `Paginator.cursor`). Defaults to `0`.
+        :type start: int
+        :param size: The number of users fetched per request. Defaults to `20`.
+        :type size: int
+        :param limit: The maximum number of users to yield. Defaults to `None` (all of them).
+        :type limit: Optional[int]
+        :param prefetch: Whether or not to fetch the next page in the background. Defaults to `True`.
+        :type prefetch: bool
+        :param comId: The ID of the community. If not provided, the current community ID is used.
+        :type comId: Optional[int]
+        :return: A `Paginator` that yields `UserProfile` objects.
+        :rtype: Paginator[UserProfile]
+
+        Pages are fetched lazily and the next one is requested while the current one is consumed.
+
+        **Example usage:**
+
+        >>> for user in client.community.iter_leaderboard(limit=50):
+        ...     print(user.nickname)
+        """
+        comId = comId or self.community_id
+        return utilities.Paginator[entities.UserProfile].from_offset(
+            lambda start, size: self.fetch_leaderboard(leaderboardType, start, size, comId),
+            start,
+            size,
+            limit,
+            prefetch,
+        )
+
     def fetch_comments(
         self,
         userId: Optional[str] = None,
@@ -2231,6 +2616,55 @@ class Community:
         else:
             raise entities.NoDataProvided
 
+    def iter_comments(
+        self,
+        userId: Optional[str] = None,
+        blogId: Optional[str] = None,
+        wikiId: Optional[str] = None,
+        start: int = 0,
+        size: int = 25,
+        limit: Optional[int] = None,
+        prefetch: bool = True,
+        comId: Optional[int] = None,
+    ) -> "utilities.Paginator[entities.Comment]":
+        """
+        Iterates over the comments of a user, blog or wiki.
+
+        :param userId: The ID of the user whose wall comments to iterate.
+        :type userId: Optional[str]
+        :param blogId: The ID of the blog whose comments to iterate.
+        :type blogId: Optional[str]
+        :param wikiId: The ID of the wiki whose comments to iterate.
+        :type wikiId: Optional[str]
+        :param start: The offset to start from (or resume at, see `Paginator.cursor`). Defaults to `0`.
+        :type start: int
+        :param size: The number of comments fetched per request. Defaults to `25`.
+        :type size: int
+        :param limit: The maximum number of comments to yield. Defaults to `None` (all of them).
+        :type limit: Optional[int]
+        :param prefetch: Whether or not to fetch the next page in the background. Defaults to `True`.
+        :type prefetch: bool
+        :param comId: The ID of the community. If not provided, the current community ID is used.
+        :type comId: Optional[int]
+        :return: A `Paginator` that yields `Comment` objects.
+        :rtype: Paginator[Comment]
+
+        Pages are fetched lazily and the next one is requested while the current one is consumed.
+
+        **Example usage:**
+
+        >>> for comment in client.community.iter_comments(blogId="0000-0000-0000-0000"):
+        ...     print(comment.content)
+        """
+        comId = comId or self.community_id
+        return utilities.Paginator[entities.Comment].from_offset(
+            lambda start, size: self.fetch_comments(userId, blogId, wikiId, start, size, comId),
+            start,
+            size,
+            limit,
+            prefetch,
+        )
+
     def set_cohost(
         self,
         chatId: str,
@@ -2619,13 +3053,15 @@ class Community:
             "timestamp": int(time.time() * 1000),
         }
         extensions: dict[str, Any] = {}
-        if imageList:
-            data["mediaList"] = [
-                [100, self.__handle_media__(image, "image/jpg"), None]
-                for image in imageList
-            ]
-        if icon:
-            data["icon"] = self.__handle_media__(icon, "image/jpg")
+        if imageList or icon:
+            uploads = list(imageList or [])
+            if icon:
+                uploads.append(icon)
+            values = self.__upload_media_list__(uploads, "image/jpg")
+            if icon:
+                data["icon"] = values.pop()
+            if values:
+                data["mediaList"] = [[100, value, None] for value in values]
         if keywords:
             data["keywords"] = keywords
         if fansOnly:
@@ -4351,7 +4787,10 @@ class Community:
                         "title": title,
                         "content": content,
                         "mediaList": [
-                            [100, self.__handle_media__(image, "image/jpg"), None]
+                            [100, value, None]
+                            for value in self.__upload_media_list__(
+                                [image], "image/jpg"
+                            )
                         ],
                         "link": link,
                     },
@@ -4421,6 +4860,78 @@ class Community:
             )
         )
 
+    def broadcast(
+        self,
+        content: str,
+        chatIds: Optional[Sequence[str]] = None,
+        mentioned: Optional[Union[Sequence[str], str]] = None,
+        parallelism: int = 8,
+        retries: int = 2,
+        progress: Optional[
+            Callable[[int, int, "utilities.BroadcastResult"], Any]
+        ] = None,
+        comId: Optional[int] = None,
+    ) -> "utilities.BroadcastReport":
+        """
+        Sends the same message to many chats.
+
+        :param content: The content of the message.
+        :type content: str
+        :param chatIds: The IDs of the chats to send to. If not provided, the message is sent to every joined chat.
+        :type chatIds: Optional[Sequence[str]]
+        :param mentioned: The user ID or user IDs to mention. Defaults to `None`.
+        :type mentioned: Optional[Union[Sequence[str], str]]
+        :param parallelism: The maximum number of messages in flight. Defaults to `8`.
+        :type parallelism: int
+        :param retries: The number of times a transient failure is retried. Defaults to `2`.
+        :type retries: int
+        :param progress: Called with the number of finished chats, the total and the `BroadcastResult` of the chat that just finished.
+        :type progress: Optional[Callable[[int, int, BroadcastResult], Any]]
+        :param comId: The ID of the community. If not provided, the current community ID is used.
+        :type comId: Optional[int]
+        :return: A `BroadcastReport` with the outcome of every chat.
+        :rtype: BroadcastReport
+
+        Every chat gets its own message body, so each message has its own `clientRefId` and timestamp. Sends run
+        concurrently under `bot.rate_limiter`, and failures are collected in `report.failed` instead of aborting
+        the broadcast.
+
+        **Example usage:**
+
+        >>> report = client.community.broadcast(
+        ...     "Server maintenance in 10 minutes!",
+        ...     progress=lambda done, total, result: print(f"{done}/{total} {result}"),
+        ... )
+        ... print(report)
+        """
+        comId = comId or self.community_id
+        if chatIds is None:
+            chatIds = [chat.chatId for chat in self.iter_chats(size=100, comId=comId)]
+        if isinstance(mentioned, str):
+            mentioned = [mentioned]
+        mentionedArray = [{"uid": userId} for userId in mentioned] if mentioned else None
+
+        def send(chatId: str) -> entities.CMessage:
+            return entities.CMessage(
+                self.bot.request.handler(
+                    "POST",
+                    f"/x{comId}/s/chat/thread/{chatId}/message",
+                    data=entities.PrepareMessage(
+                        content=content,
+                        extensions={"mentionedArray": mentionedArray},
+                    ).json(),
+                )
+            )
+
+        return utilities.broadcast(
+            send,
+            chatIds,
+            parallelism,
+            retries,
+            rate_limiter=self.bot.rate_limiter,
+            progress=progress,
+        )
+
     def reply_message(
         self,
         chatId: str,
@@ -4557,11 +5068,53 @@ class Community:
         content_type: Optional[str] = None,
     ) -> str:
         """Handles media files."""
-        media = entities.read_media(media)
         if content_type:
             return self.upload_media(media, content_type)
 
-        return base64.b64encode(media).decode()
+        return base64.b64encode(entities.read_media(media)).decode()
+
+    def __upload_media_list__(
+        self,
+        mediaList: Sequence["entities.Media"],
+        content_type: Optional[str] = None,
+    ) -> list[str]:
+        """Uploads media files concurrently, keeping their order.
+
+        A single media raises its original error, a batch raises `MediaUploadFailed`.
+        """
+        results, errors = utilities.map_concurrent(
+            lambda media: self.__handle_media__(media, content_type), mediaList
+        )
+        if len(mediaList) == 1 and errors:
+            raise errors[0]
+        if errors:
+            raise entities.MediaUploadFailed(results, errors)
+        return cast(list[str], results)
+
+    def __handle_media_list__(
+        self,
+        imageList: Sequence[
+            Union[
+                "entities.Media",
+                tuple["entities.Media"],
+                tuple["entities.Media", Optional[str]],
+            ]
+        ],
+    ) -> list[list[Any]]:
+        """Uploads images with optional captions into a `mediaList`."""
+        images: list[entities.Media] = []
+        captions: list[Optional[str]] = []
+        for image in imageList:
+            caption = None
+            if not isinstance(image, (bytes, str)) and isinstance(image, Sequence):
+                if len(image) == 1:
+                    image = image[0]
+                else:
+                    image, caption = image
+            images.append(image)
+            captions.append(caption)
+        values = self.__upload_media_list__(images, "image/jpg")
+        return [[100, value, caption] for value, caption in zip(values, captions)]
 
     def upload_media(
         self,
@@ -4805,6 +5358,71 @@ class Community:
             self.bot.request.handler(method, endpoint, data=data)
         )
 
+    def bulk_moderate(
+        self,
+        actions: Iterable[tuple[str, Union[str, tuple[Any, ...], Mapping[str, Any]]]],
+        rates: Optional[Mapping[str, float]] = None,
+        parallelism: int = 8,
+        retries: int = 3,
+        progress: Optional[Callable[["utilities.ModerationResult"], Any]] = None,
+        comId: Optional[int] = None,
+    ) -> "utilities.ModerationReport":
+        """
+        Runs many moderation actions concurrently.
+
+        :param actions: `(action, target)` pairs. `action` is one of `kick`, `ban`, `unban`, `strike`, `warn`,
+            `hide_user` or `delete_message`. `target` holds the arguments of the matching method: a dict of
+            keyword arguments or a tuple of positional arguments. `strike`, `warn` and `hide_user` also accept
+            a single userId; `ban` and `unban` need a `reason` and `kick` a `chatId`.
+        :type actions: Iterable[tuple[str, Union[str, tuple, dict]]]
+        :param rates: Calls per second allowed for each action, merged over `MODERATION_RATES`. Defaults to `None`.
+        :type rates: Optional[Mapping[str, float]]
+        :param parallelism: The maximum number of actions in flight. Defaults to `8`.
+        :type parallelism: int
+        :param retries: The number of times a transient failure (5xx, cooldown or network error) is retried. Defaults to `3`.
+        :type retries: int
+        :param progress: Called with each `ModerationResult` as soon as it finishes. Defaults to `None`.
+        :type progress: Optional[Callable[[ModerationResult], Any]]
+        :param comId: The ID of the community. If not provided, the current community ID is used.
+        :type comId: Optional[int]
+        :return: A `ModerationReport` with the result of every action, in input order.
+        :rtype: ModerationReport
+
+        Failures never abort the run; they are collected in `report.failed`.
+
+        **Example usage:**
+
+        To purge a spam raid:
+
+        >>> report = client.community.bulk_moderate(
+        ...     [("delete_message", {"chatId": chatId, "messageId": messageId, "asStaff": True}) for messageId in spam]
+        ...     + [("ban", {"userId": userId, "reason": "Spam"}) for userId in raiders]
+        ... )
+        ... print(report)
+        ... for result in report.failed:
+        ...     print(result.action, result.target, result.error)
+        """
+        comId = comId or self.community_id
+        handlers: dict[str, Callable[..., Any]] = {
+            "ban": self.ban,
+            "delete_message": self.delete_message,
+            "hide_user": self.hide_user,
+            "kick": self.kick,
+            "strike": self.strike,
+            "unban": self.unban,
+            "warn": self.warn,
+        }
+        moderator = utilities.BulkModerator(
+            {
+                action: functools.partial(handler, comId=comId)
+                for action, handler in handlers.items()
+            },
+            rates,
+            parallelism,
+            retries,
+        )
+        return moderator.run(actions, progress)
+
     def transfer_host(
         self,
         chatId: str,
@@ -6714,18 +7332,7 @@ class Community:
         data: dict[str, Any] = {"timestamp": int(time.time() * 1000)}
         extensions: dict[str, Any] = {}
         if imageList is not None:
-            mediaList: list[Any] = []
-            for image in imageList:
-                caption = None
-                if not isinstance(image, (bytes, str)) and isinstance(image, Sequence):
-                    if len(image) == 1:
-                        image = image[0]
-                    else:
-                        image, caption = image
-                mediaList.append(
-                    [100, self.__handle_media__(image, "image/jpg"), caption]
-                )
-            data["mediaList"] = mediaList
+            data["mediaList"] = self.__handle_media_list__(imageList)
         if nickname:
             data["nickname"] = nickname
         if icon:
@@ -7017,18 +7624,7 @@ class Community:
         )
         extensions: dict[str, Any] = {}
         if imageList is not None:
-            mediaList: list[Any] = []
-            for image in imageList:
-                caption = None
-                if not isinstance(image, (bytes, str)) and isinstance(image, Sequence):
-                    if len(image) == 1:
-                        image = image[0]
-                    else:
-                        image, caption = image
-                mediaList.append(
-                    [100, self.__handle_media__(image, "image/jpg"), caption]
-                )
-            data["mediaList"] = mediaList
+            data["mediaList"] = self.__handle_media_list__(imageList)
         if fansOnly:
             extensions["fansOnly"] = fansOnly
         if backgroundColor:
@@ -7383,18 +7979,7 @@ class Community:
         }
         extensions: dict[str, Any] = {}
         if imageList is not None:
-            mediaList: list[Any] = []
-            for image in imageList:
-                caption = None
-                if not isinstance(image, (bytes, str)) and isinstance(image, Sequence):
-                    if len(image) == 1:
-                        image = image[0]
-                    else:
-                        image, caption = image
-                mediaList.append(
-                    [100, self.__handle_media__(image, "image/jpg"), caption]
-                )
-            data["mediaList"] = mediaList
+            data["mediaList"] = self.__handle_media_list__(imageList)
         if title:
             data["title"] = title
         if content:
@@ -7708,6 +8293,49 @@ class Community:
             )
         )
 
+    def iter_search_users(
+        self,
+        nickname: str,
+        start: int = 0,
+        size: int = 25,
+        limit: Optional[int] = None,
+        prefetch: bool = True,
+        comId: Optional[int] = None,
+    ) -> "utilities.Paginator[entities.UserProfile]":
+        """
+        Iterates over the users matching a nickname.
+
+        :param nickname: The nickname to search for.
+        :type nickname: str
+        :param start: The offset to start from (or resume at, see `Paginator.cursor`). Defaults to `0`.
+        :type start: int
+        :param size: The number of users fetched per request. Defaults to `25`.
+        :type size: int
+        :param limit: The maximum number of users to yield. Defaults to `None` (all of them).
+        :type limit: Optional[int]
+        :param prefetch: Whether or not to fetch the next page in the background. Defaults to `True`.
+        :type prefetch: bool
+        :param comId: The ID of the community. If not provided, the current community ID is used.
+        :type comId: Optional[int]
+        :return: A `Paginator` that yields `UserProfile` objects.
+        :rtype: Paginator[UserProfile]
+
+        Pages are fetched lazily and the next one is requested while the current one is consumed.
+
+        **Example usage:**
+
+        >>> for user in client.community.iter_search_users("John"):
+        ...     print(user.nickname)
+        """
+        comId = comId or self.community_id
+        return utilities.Paginator[entities.UserProfile].from_offset(
+            lambda start, size: self.search_users(nickname, start, size, comId),
+            start,
+            size,
+            limit,
+            prefetch,
+        )
+
     def fetch_message(
         self,
         chatId: str,
@@ -8062,6 +8690,62 @@ class Community:
             )
         )
 
+    def iter_admin_log(
+        self,
+        userId: Optional[str] = None,
+        blogId: Optional[str] = None,
+        wikiId: Optional[str] = None,
+        quizId: Optional[str] = None,
+        fileId: Optional[str] = None,
+        pageToken: Optional[str] = None,
+        size: int = 25,
+        limit: Optional[int] = None,
+        prefetch: bool = True,
+        comId: Optional[int] = None,
+    ) -> "utilities.Paginator[entities.AdminLog]":
+        """
+        Iterates over the admin log entries for the specified parameters.
+
+        :param userId: The ID of the user to filter the entries by.
+        :type userId: Optional[str]
+        :param blogId: The ID of the blog to filter the entries by.
+        :type blogId: Optional[str]
+        :param wikiId: The ID of the wiki to filter the entries by.
+        :type wikiId: Optional[str]
+        :param quizId: The ID of the quiz to filter the entries by.
+        :type quizId: Optional[str]
+        :param fileId: The ID of the file to filter the entries by.
+        :type fileId: Optional[str]
+        :param pageToken: The token of the page to start from (or resume at, see `Paginator.cursor`).
+        :type pageToken: Optional[str]
+        :param size: The number of entries fetched per request. Defaults to `25`.
+        :type size: int
+        :param limit: The maximum number of entries to yield. Defaults to `None` (all of them).
+        :type limit: Optional[int]
+        :param prefetch: Whether or not to fetch the next page in the background. Defaults to `True`.
+        :type prefetch: bool
+        :param comId: The ID of the community. If not provided, the current community ID is used.
+        :type comId: Optional[int]
+        :return: A `Paginator` that yields `AdminLog` objects.
+        :rtype: Paginator[AdminLog]
+
+        **Example usage:**
+
+        >>> for entry in client.community.iter_admin_log(limit=100):
+        ...     print(entry.operation_name)
+        """
+        comId = comId or self.community_id
+
+        def fetch(
+            pageToken: Optional[str], size: int
+        ) -> tuple[list[entities.AdminLog], Optional[str]]:
+            log = self.fetch_admin_log(
+                userId, blogId, wikiId, quizId, fileId, pageToken, size, comId
+            )
+            return log.parser(), log.next_page_token
+
+        return utilities.Paginator[entities.AdminLog].from_token(fetch, pageToken, size, limit, prefetch)
+
     def fetch_user_moderation_history(
         self,
         userId: str,
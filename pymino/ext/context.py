@@ -4,10 +4,13 @@ import contextlib
 import functools
 import inspect
 import logging
+import math
 import random
+import re
 import threading
 import time
-from collections.abc import Callable, Iterator, Sequence
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import (
     Any,
     Optional,
@@ -17,7 +20,7 @@ from typing import (
 )
 
 import colorama
-from typing_extensions import ParamSpec, Concatenate
+from typing_extensions import ParamSpec, Concatenate, Unpack
 
 from pymino.ext import community, entities, utilities
 from pymino import bot
@@ -32,6 +35,7 @@ P = ParamSpec("P")
 R = TypeVar("R")
 CallableT = TypeVar("CallableT", bound=Callable[..., Any])
 CommandCallbackT = TypeVar("CommandCallbackT", bound=utilities.CommandCallback)
+MiddlewareT = TypeVar("MiddlewareT", bound=utilities.Middleware)
 TaskT = TypeVar("TaskT", bound="Task")
 
 Task = Union[
@@ -138,11 +142,20 @@ class Context:
     __slots__ = (
         "message",
         "bot",
+        "_token",
     )
 
     def __init__(self, message: "entities.Message", bot: "bot.Bot") -> None:
         self.message = message
         self.bot = bot
+        self._token: Optional[utilities.CancellationToken] = None
+
+    @property
+    def token(self) -> utilities.CancellationToken:
+        """The cancellation token of the command, cancelled when its `timeout` passes."""
+        if self._token is None:
+            self._token = utilities.CancellationToken()
+        return self._token
 
     @property
     def request(self) -> utilities.RequestHandler:
@@ -218,6 +231,16 @@ class Context:
             )
         )
 
+    def __queue_message__(self, **kwargs: Any) -> "entities.CMessage":
+        return self.bot.outbound.submit(
+            self.chatId, self.__send_message__, **kwargs
+        ).result()
+
+    def __send_text__(self, content: str) -> "entities.CMessage":
+        return self.__send_message__(
+            content=content, extensions={"mentionedArray": None}
+        )
+
     @contextlib.contextmanager
     def typing(self) -> Iterator[None]:
         payload: dict[str, Any] = {
@@ -231,12 +254,13 @@ class Context:
             "id": time.monotonic() + random.randint(0, 100),
         }
         start = time.time()
+        writer = self.bot.websocket_writer
         try:
-            self.bot.send_websocket_message({"o": payload, "t": 304})
+            writer.typing(payload["target"], {"o": payload, "t": 304}, active=True)
             yield None
         finally:
             payload["params"]["duration"] = int(time.time() - start)
-            self.bot.send_websocket_message({"o": payload, "t": 306})
+            writer.typing(payload["target"], {"o": payload, "t": 306}, active=False)
 
     def _delete(
         self,
@@ -303,20 +327,12 @@ class Context:
         """
         if not self.intents:
             raise entities.IntentsNotEnabled
-        start = time.time()
-        with entities.cache as cache:
-            key = f"{self.message.chatId}_{self.message.author.userId}"
-            while (time.time() - start) < timeout:
-                cached_message = cache.get(key)
-
-                if cached_message == message:
-                    cache.pop(key)
-                    return WaitForMessage(status_code=200)
-                if all([cached_message is not None, cached_message != message]):
-                    cache.pop(key)
-                    return WaitForMessage(status_code=404)
-            cache.pop(key)
+        content = self.bot.wait_for_reply(
+            self.message.chatId, self.message.author.userId, timeout
+        )
+        if content is None:
             return WaitForMessage(status_code=500)
+        return WaitForMessage(status_code=200 if content == message else 404)
 
     @with_typing
     def send(
@@ -343,14 +359,19 @@ class Context:
         """
         if isinstance(mentioned, str):
             mentioned = [mentioned]
-        message = self.__send_message__(
-            content=content,
-            extensions={
-                "mentionedArray": (
-                    [{"uid": user} for user in mentioned] if mentioned else None
-                )
-            },
-        )
+        if mentioned or delete_after:
+            message = self.__queue_message__(
+                content=content,
+                extensions={
+                    "mentionedArray": (
+                        [{"uid": user} for user in mentioned] if mentioned else None
+                    )
+                },
+            )
+        else:
+            message = self.bot.outbound.submit_text(
+                self.chatId, self.__send_text__, content
+            ).result()
         if delete_after:
             threading.Thread(target=self._delete, args=(message, delete_after)).start()
         return message
@@ -380,7 +401,7 @@ class Context:
         """
         if isinstance(mentioned, str):
             mentioned = [mentioned]
-        message = self.__send_message__(
+        message = self.__queue_message__(
             content=content,
             replyMessageId=self.message.messageId,
             extensions={
@@ -395,6 +416,68 @@ class Context:
 
         return message
 
+    def send_nowait(
+        self,
+        content: str,
+        delete_after: Optional[float] = None,
+        mentioned: Optional[Union[Sequence[str], str]] = None,
+    ) -> "Future[entities.CMessage]":
+        """This queues a message and returns without waiting for it to be sent.
+
+        Messages queued for the same chat are sent in order, one at a time. When
+        `bot.outbound.coalesce_window` is set, texts queued together without
+        `delete_after` or `mentioned` may be merged into one message.
+
+        `**Parameters**``
+        - `content` - The message you want to send.
+        - `delete_after` - The time in seconds before the message is deleted. [Optional]
+        - `mentioned` - The user(s) you want to mention. [Optional]
+
+        `**Returns**`` - Future resolved with the CMessage object.
+
+        `**Example**``
+        ```py
+        @bot.on_text_message()
+        def on_text_message(ctx: Context):
+            ctx.send_nowait(content="Hello")
+            ctx.send_nowait(content="World!")
+        ```
+        """
+        if not delete_after and not mentioned:
+            return self.bot.outbound.submit_text(
+                self.chatId, self.__send_text__, content
+            )
+        return self.bot.outbound.submit(
+            self.chatId, self.send, content, delete_after, mentioned
+        )
+
+    def reply_nowait(
+        self,
+        content: str,
+        delete_after: Optional[float] = None,
+        mentioned: Optional[Union[Sequence[str], str]] = None,
+    ) -> "Future[entities.CMessage]":
+        """This queues a reply to the message and returns without waiting for it to be sent.
+
+        `**Parameters**``
+        - `content` - The message you want to send.
+        - `delete_after` - The time in seconds before the message is deleted. [Optional]
+        - `mentioned` - The user(s) you want to mention. [Optional]
+
+        `**Returns**`` - Future resolved with the CMessage object.
+
+        `**Example**``
+        ```py
+        @bot.on_text_message()
+        def on_text_message(ctx: Context):
+            future = ctx.reply_nowait(content="Hello World!")
+            future.add_done_callback(lambda future: print(future.result().messageId))
+        ```
+        """
+        return self.bot.outbound.submit(
+            self.chatId, self.reply, content, delete_after, mentioned
+        )
+
     def prepare_mentions(self, mentioned: Sequence[str]) -> list[str]:
         """This prepares the mentions for the message.
 
@@ -449,7 +532,7 @@ class Context:
         """
         if isinstance(mentioned, str):
             mentioned = [mentioned]
-        return self.__send_message__(
+        return self.__queue_message__(
             content=message,
             extensions={
                 "linkSnippetList": [
@@ -502,7 +585,7 @@ class Context:
         """
         if isinstance(mentioned, str):
             mentioned = [mentioned]
-        return self.__send_message__(
+        return self.__queue_message__(
             content=message,
             attachedObject={
                 "title": title,
@@ -552,12 +635,22 @@ class Context:
         ```
         """
         sticker_id = sticker_id.removeprefix("ndcsticker://")
-        return self.__send_message__(
+        return self.__queue_message__(
             type=3,
             stickerId=sticker_id,
             mediaValue=f"ndcsticker://{sticker_id}",
         )
 
+    def send_sticker_nowait(self, sticker_id: str) -> "Future[entities.CMessage]":
+        """This queues a sticker and returns without waiting for it to be sent.
+
+        `**Parameters**``
+        - `sticker_id` - The sticker ID you want to send.
+
+        `**Returns**`` - Future resolved with the CMessage object.
+        """
+        return self.bot.outbound.submit(self.chatId, self.send_sticker, sticker_id)
+
     def send_image(self, image: "entities.Media") -> "entities.CMessage":
         """This sends an image.
 
@@ -573,11 +666,23 @@ class Context:
             ctx.send_image(image="https://i.imgur.com/image.jpg")
         ```
         """
-        return self.__send_message__(
+        return self.__queue_message__(
             mediaType=100,
             mediaUploadValue=self.__handle_media__(image),
         )
 
+    def send_image_nowait(self, image: "entities.Media") -> "Future[entities.CMessage]":
+        """This queues an image and returns without waiting for it to be sent.
+
+        The image is read and uploaded on the outbound queue, not in the handler.
+
+        `**Parameters**``
+        - `image` - The image link or file you want to send.
+
+        `**Returns**`` - Future resolved with the CMessage object.
+        """
+        return self.bot.outbound.submit(self.chatId, self.send_image, image)
+
     def send_gif(self, gif: "entities.Media") -> "entities.CMessage":
         """This sends a gif.
 
@@ -593,7 +698,7 @@ class Context:
             ctx.send_gif(gif="https://i.imgur.com/image.gif")
         ```
         """
-        return self.__send_message__(
+        return self.__queue_message__(
             mediaType=100,
             mediaUploadValueContentType="image/gif",
             mediaUploadValue=self.__handle_media__(gif),
@@ -614,7 +719,7 @@ class Context:
             ctx.send_audio(audio="output.mp3")
         ```
         """
-        return self.__send_message__(
+        return self.__queue_message__(
             type=2,
             mediaType=110,
             mediaUploadValue=self.__handle_media__(audio),
@@ -675,18 +780,369 @@ class EventHandler(abc.ABC):
     def command_prefix(self) -> str: ...
 
     def __init__(self) -> None:
-        self._events: dict[str, Callable[..., Any]] = {}
+        self._events: dict[str, list[utilities.Listener]] = {}
         self._commands = utilities.Commands()
         self._tasks: list[tuple[Task, float]] = []
         self._cooldown_message: Optional[str] = None
+        self._event_keys: Optional[frozenset[str]] = None
+        self._middleware: list[utilities.Middleware] = []
+        self._triggers: utilities.TriggerEngine[utilities.Listener] = (
+            utilities.TriggerEngine()
+        )
+        self._fanout: Optional[ThreadPoolExecutor] = None
+        self._fanout_lock = threading.Lock()
+        self.fanout_workers: int = utilities.MAX_WORKERS
+        self.event_loop = utilities.EventLoopThread()
+        self.handler_stats = utilities.HandlerStats()
+        self.profiler: Optional[utilities.SamplingProfiler] = None
+        self.command_timeouts = utilities.TimeoutWatchdog(self._command_timed_out)
+        self.outbound = utilities.OutboundQueue()
+        self._message_waiters: dict[str, list[tuple[threading.Event, list[str]]]] = {}
+        self._waiters_lock = threading.Lock()
+
+    def stats(self, top: int = 20) -> dict[str, Any]:
+        """
+        Returns a report of the time spent in handlers, commands and tasks.
+
+        `**Parameters**``
+        - `top` - The number of profiler locations included. `Defaults` to `20`.
+
+        `**Returns**``
+        - `dict` - `handlers`, ranked by total time, the recent command `timeouts`,
+          the `outbound` message queue and `profile` if the profiler was started.
+
+        `**Example**``
+        ```py
+        bot.start_profiler()
+        ...
+        for handler in bot.stats()["handlers"]:
+            print(handler["name"], handler["calls"], handler["p95"])
+        ```
+        """
+        report: dict[str, Any] = {
+            "handlers": self.handler_stats.report(),
+            "timeouts": self.command_timeouts.report(),
+            "outbound": self.outbound.stats(),
+        }
+        if self.profiler is not None:
+            report["profile"] = self.profiler.report(top)
+        return report
+
+    def start_profiler(self, interval: float = 0.005, depth: int = 1) -> utilities.SamplingProfiler:
+        """
+        Starts sampling the stacks of every thread for `stats()`.
+
+        `**Parameters**``
+        - `interval` - The number of seconds between samples. `Defaults` to `0.005`.
+        - `depth` - The number of innermost frames kept per sample. `Defaults` to `1`.
+
+        `**Returns**``
+        - `SamplingProfiler` - The running profiler.
+        """
+        if self.profiler is None or not self.profiler.running:
+            self.profiler = utilities.SamplingProfiler(interval, depth)
+            self.profiler.start()
+        return self.profiler
+
+    def stop_profiler(self) -> None:
+        """Stops the sampling profiler. Its report stays in `stats()` until it is started again."""
+        if self.profiler is not None:
+            self.profiler.stop()
+
+    @property
+    def cooldown_store(self) -> utilities.CooldownStore:
+        """The store that keeps the command cooldowns and rate limits."""
+        return self._commands.cooldowns
+
+    @cooldown_store.setter
+    def cooldown_store(self, value: utilities.CooldownStore) -> None:
+        self._commands.cooldowns = value
+
+    def register_event(
+        self,
+        event_name: str,
+        priority: int = 0,
+        concurrent: bool = False,
+        **filters: Unpack[utilities.EventFilters],
+    ) -> Callable[[CallableT], CallableT]:
+        predicate = utilities.compile_filters(**filters)
 
-    def register_event(self, event_name: str) -> Callable[[CallableT], CallableT]:
         def decorator(event_handler: CallableT) -> CallableT:
-            self._events[event_name] = event_handler
+            listeners = self._events.setdefault(event_name, [])
+            listeners.append(
+                utilities.Listener(event_handler, priority, concurrent, predicate)
+            )
+            listeners.sort(key=lambda listener: listener.sort_key)
+            self._event_keys = None
             return event_handler
 
         return decorator
 
+    def on_keyword(
+        self,
+        keywords: Union[str, Iterable[str]],
+        case_sensitive: bool = False,
+        whole_word: bool = False,
+        priority: int = 0,
+        concurrent: bool = False,
+        **filters: Unpack[utilities.EventFilters],
+    ) -> Callable[[CallableT], CallableT]:
+        """
+        This is an event that is called when a text message contains any of the keywords.
+
+        All keywords of all handlers are compiled into one Aho-Corasick automaton that runs
+        once per message, so adding rules does not slow down matching.
+        The handler can take a `keywords` parameter with the keywords that were found.
+
+        `**Parameters**``
+        - `keywords` - The keyword, or keywords, to look for.
+        - `case_sensitive` - Whether or not the keywords are case sensitive. `Defaults` to `False`.
+        - `whole_word` - Whether or not the keywords only match whole words. `Defaults` to `False`.
+
+        `**Example**``
+        ```py
+        @bot.on_keyword(["badword", "otherbadword"], whole_word=True, priority=10)
+        def censor(ctx: Context, keywords: list[str]):
+            bot.community.delete_message(chatId=ctx.chatId, messageId=ctx.message.messageId, comId=ctx.comId)
+            return STOP_PROPAGATION
+        ```
+        """
+        predicate = utilities.compile_filters(**filters)
+
+        def decorator(event_handler: CallableT) -> CallableT:
+            self._triggers.add_keywords(
+                [keywords] if isinstance(keywords, str) else keywords,
+                utilities.Listener(event_handler, priority, concurrent, predicate),
+                case_sensitive=case_sensitive,
+                whole_word=whole_word,
+            )
+            return event_handler
+
+        return decorator
+
+    def on_pattern(
+        self,
+        pattern: Union[str, "re.Pattern[str]"],
+        flags: int = 0,
+        priority: int = 0,
+        concurrent: bool = False,
+        **filters: Unpack[utilities.EventFilters],
+    ) -> Callable[[CallableT], CallableT]:
+        """
+        This is an event that is called when a text message matches a regular expression.
+
+        All patterns are merged into one regex that is searched first, so messages that match
+        none of them cost a single search. The handler can take a `match` parameter with the `re.Match`.
+
+        `**Parameters**``
+        - `pattern` - The regular expression to search for.
+        - `flags` - The regex flags used if `pattern` is a string. `Defaults` to `0`.
+
+        `**Example**``
+        ```py
+        @bot.on_pattern(r"roll (\\d+)d(\\d+)")
+        def roll(ctx: Context, match: re.Match):
+            ctx.reply(content=f"Rolling {match[1]} dice with {match[2]} sides")
+        ```
+        """
+        predicate = utilities.compile_filters(**filters)
+
+        def decorator(event_handler: CallableT) -> CallableT:
+            self._triggers.add_pattern(
+                pattern,
+                utilities.Listener(event_handler, priority, concurrent, predicate),
+                flags,
+            )
+            return event_handler
+
+        return decorator
+
+    def _match_triggers(
+        self, data: "entities.Message"
+    ) -> dict[utilities.Listener, dict[str, Any]]:
+        """Matches the keyword and pattern triggers against a text message, once."""
+        if not len(self._triggers) or not data.content:
+            return {}
+        return {
+            listener: arguments
+            for listener, arguments in self._triggers.match(data.content).items()
+            if listener.accepts(data.data)
+        }
+
+    def middleware(self) -> Callable[[MiddlewareT], MiddlewareT]:
+        """
+        This registers a middleware that runs before the handlers of every event.
+
+        A middleware receives the event name, the event data (the `Context` for messages)
+        and a `call_next` function. Not calling `call_next` stops the event.
+
+        `**Example**``
+        ```py
+        @bot.middleware()
+        def ignore_banned(event: str, data: Any, call_next: Callable[[], None]):
+            if isinstance(data, Context) and data.author.userId in banned:
+                return
+            call_next()
+        ```
+        """
+
+        def decorator(func: MiddlewareT) -> MiddlewareT:
+            self._middleware.append(func)
+            return func
+
+        return decorator
+
+    def _matching_listeners(
+        self,
+        event: str,
+        data: Union[
+            "entities.Message", "entities.OnlineMembers", entities.Notification, Context
+        ],
+    ) -> list[utilities.Listener]:
+        """Returns the handlers of an event whose filters accept the raw event data."""
+        listeners = self._events.get(event)
+        if not listeners:
+            return []
+        raw = data.message.data if isinstance(data, Context) else data.data
+        return [listener for listener in listeners if listener.accepts(raw)]
+
+    def _run_middleware(self, event: str, data: Any, handler: Callable[[], None]) -> None:
+        chain = self._middleware
+
+        def call(index: int) -> None:
+            if index == len(chain):
+                handler()
+            else:
+                chain[index](event, data, lambda: call(index + 1))
+
+        call(0)
+
+    def _run_listeners(
+        self,
+        event: str,
+        listeners: Sequence[utilities.Listener],
+        arguments: Callable[[utilities.Listener], list[Any]],
+    ) -> bool:
+        """
+        Runs the handlers of an event in priority order.
+
+        Concurrent handlers are submitted to the fan-out pool and the rest run inline.
+        An inline handler returning `STOP_PROPAGATION` stops the handlers after it.
+        A handler that raises is reported to the `error` handlers and the next one still runs.
+        Coroutine handlers are scheduled on the event loop and cannot stop propagation.
+
+        Returns whether or not propagation was stopped.
+        """
+        for listener in listeners:
+            args = arguments(listener)
+            if listener.concurrent:
+                self._fanout_pool().submit(
+                    self._run_concurrent, event, listener.callback, args
+                )
+                continue
+            try:
+                result = self._call(event, listener.callback, args)
+            except Exception as e:
+                self._route_error(event, e)
+                continue
+            if result is utilities.STOP_PROPAGATION:
+                return True
+        return False
+
+    def _run_concurrent(
+        self, event: str, callback: Callable[..., Any], args: list[Any]
+    ) -> None:
+        try:
+            self._call(event, callback, args)
+        except Exception as e:
+            self._route_error(event, e)
+
+    def _call(
+        self,
+        event: str,
+        callback: Callable[..., Any],
+        args: Sequence[Any],
+        name: Optional[str] = None,
+    ) -> Any:
+        """
+        Calls a handler, recording its latency in `handler_stats`.
+
+        Awaitable results are scheduled on the event loop and timed until they complete.
+
+        `**Parameters**``
+        - `event` - The event the handler was called for.
+        - `callback` - The handler.
+        - `args` - The arguments of the handler.
+        - `name` - The name the call is recorded under. `Defaults` to `event:qualname`.
+
+        `**Returns**``
+        - `Future` - The future of the coroutine, or the handler's return value if it is not awaitable.
+
+        """
+        name = name or f"{event}:{getattr(callback, '__qualname__', repr(callback))}"
+        started = time.perf_counter()
+        try:
+            result = callback(*args)
+        except Exception:
+            self.handler_stats.record(name, time.perf_counter() - started, error=True)
+            raise
+        if not inspect.isawaitable(result):
+            self.handler_stats.record(name, time.perf_counter() - started)
+            return result
+        future = self.event_loop.submit(result)
+        future.add_done_callback(
+            functools.partial(self._coroutine_done, event, name, started)
+        )
+        return future
+
+    def _coroutine_done(
+        self, event: str, name: str, started: float, future: "Future[Any]"
+    ) -> None:
+        error = None if future.cancelled() else future.exception()
+        self.handler_stats.record(
+            name, time.perf_counter() - started, error=error is not None
+        )
+        if isinstance(error, Exception) and not isinstance(
+            error, entities.CommandCancelled
+        ):
+            self._route_error(event, error)
+
+    def _command_timed_out(self, record: utilities.TimeoutRecord) -> None:
+        """Is called by `command_timeouts` once a command runs past its timeout."""
+        logger.warning(
+            f"Command {record.name} exceeded its {record.timeout}s timeout in {record.chatId}"
+        )
+
+    def _route_error(self, event: str, error: Exception) -> None:
+        """Passes a handler error to the `error` handlers, or logs it if there are none."""
+        if event == "error" or "error" not in self._events:
+            logger.error(f"Event handler error in {event}: {error}", exc_info=error)
+        else:
+            self.emit("error", error)
+
+    def _fanout_pool(self) -> ThreadPoolExecutor:
+        with self._fanout_lock:
+            if self._fanout is None:
+                self._fanout = ThreadPoolExecutor(
+                    max_workers=self.fanout_workers, thread_name_prefix="pymino-fanout"
+                )
+            return self._fanout
+
+    def _interesting_keys(self) -> frozenset[str]:
+        """
+        Returns the `type:mediaType` keys of the chat messages that have a handler.
+
+        Text messages are always included because commands and the built-in help command are parsed from them.
+        The result is cached until another event is registered.
+        """
+        if self._event_keys is None:
+            self._event_keys = frozenset(
+                key
+                for key, event in entities.EVENT_TYPES.items()
+                if event in self._events or event == "text_message"
+            )
+        return self._event_keys
+
     def _handle_task(self, callback: Task, interval: float) -> None:
         """
         This handles the task.
@@ -698,10 +1154,14 @@ class EventHandler(abc.ABC):
         `**Returns**`` - None
         """
         community_required = len(inspect.signature(callback).parameters) != 0
+        name = f"task:{getattr(callback, '__qualname__', repr(callback))}"
         while True:
             args = [self.community] if community_required else []
             try:
-                callback(*args)
+                with self.handler_stats.measure(name):
+                    result = callback(*args)
+                    if inspect.isawaitable(result):
+                        self.event_loop.submit(result).result()
             except Exception as e:
                 logger.debug(f"Task error: {e}")
             finally:
@@ -739,6 +1199,7 @@ class EventHandler(abc.ABC):
         context: Context,
         func: utilities.CommandCallback,
         message: Optional[str] = None,
+        **extra: Any,
     ) -> list[Any]:
         potential_parameters = {
             "ctx": context,
@@ -746,6 +1207,7 @@ class EventHandler(abc.ABC):
             "message": message if isinstance(message, str) else context.message.content,
             "username": context.author.username,
             "userId": context.author.userId,
+            **extra,
         }
 
         return [
@@ -755,8 +1217,9 @@ class EventHandler(abc.ABC):
 
     def emit(self, name: str, *args: Any) -> None:
         """`emit` is a function that emits an event."""
-        if name in self._events:
-            self._events[name](*args)
+        listeners = self._events.get(name)
+        if listeners:
+            self._run_listeners(name, listeners, lambda listener: list(args))
 
     def command(
         self,
@@ -765,6 +1228,9 @@ class EventHandler(abc.ABC):
         usage: Optional[str] = None,
         aliases: Optional[Sequence[str]] = None,
         cooldown: float = 0.0,
+        rate: Optional[tuple[int, float]] = None,
+        scope: utilities.CooldownScope = "user",
+        timeout: Optional[float] = None,
         **kwargs: Any,
     ) -> Callable[[CommandCallbackT], CommandCallbackT]:
         """This creates a command.
@@ -774,6 +1240,9 @@ class EventHandler(abc.ABC):
         - `command_description` - The description of the command.
         - `aliases` - The other names the command can be called by.
         - `cooldown` - The cooldown of the command in seconds.
+        - `rate` - The number of uses allowed per sliding window, as `(uses, seconds)`.
+        - `scope` - Whether the cooldown and rate apply per `user`, `chat` or `community`.
+        - `timeout` - The number of seconds after which `ctx.token` is cancelled.
 
         `**Function Parameters**``
         - `ctx` - The context of the command.
@@ -792,6 +1261,11 @@ class EventHandler(abc.ABC):
         Is `cooldown` required?
             - No, you don't need a cooldown however it is recommended to avoid spam.
 
+        What is the difference between `cooldown` and `rate`?
+            - `cooldown=5` allows one use every 5 seconds.
+            - `rate=(5, 60)` allows 5 uses in any 60 seconds.
+            - Limits are kept in `bot.cooldown_store`, which can be a `SQLiteCooldownStore` shared by several bots.
+
         What is the difference between `message` and `ctx.message.content`?
             - `ctx.message.content` contains the entire message.
             - `message` contains the message without the command prefix.
@@ -799,6 +1273,15 @@ class EventHandler(abc.ABC):
         Do I need to supply all the parameters?
             - No, you only need to supply the parameters you want to use however `ctx` is required.
 
+        How does `timeout` stop a command?
+            - Once it passes, `ctx.token` is cancelled and the call is listed in `bot.stats()["timeouts"]`.
+            - Coroutines are cancelled; regular functions should check `ctx.token.cancelled`,
+              call `ctx.token.raise_if_cancelled()` or sleep with `ctx.token.wait(seconds)`.
+
+        Can a command be an `async def` function?
+            - Yes, coroutines are run on the bot's event loop thread (`bot.event_loop`).
+            - Errors raised by them are passed to the `on_error` handlers.
+
         `**Example**``
         ```py
         @bot.command(command_name="ping") # Command parameters.
@@ -816,6 +1299,11 @@ class EventHandler(abc.ABC):
             # This command can only be called every 5 seconds.
             return ctx.send(content="Pong!")
 
+        @bot.command(name="ping", rate=(5, 60), scope="chat") # Command parameters.
+        def ping(ctx: Context): # Function parameters.
+            # This command can be called 5 times per minute in each chat.
+            return ctx.send(content="Pong!")
+
         @bot.command(command_name="say", command_description="This is a command that says something.") # Command parameters.
         def say(ctx: Context, message: str, username: str, userId: str): # Function parameters.
             bot.community.delete_message(chatId=ctx.chatId, messageId=ctx.message.chatId, comId=ctx.comId)
@@ -842,6 +1330,9 @@ class EventHandler(abc.ABC):
                     usage=usage,
                     aliases=aliases,
                     cooldown=cooldown,
+                    rate=rate,
+                    scope=scope,
+                    timeout=timeout,
                 )
             )
             return func
@@ -866,13 +1357,19 @@ class EventHandler(abc.ABC):
     def fetch_command(self, command_name: str) -> Optional[utilities.Command]:
         return self._commands.fetch_command(command_name)
 
-    def _handle_command(self, data: "entities.Message", context: Context):
+    def _handle_command(
+        self,
+        data: "entities.Message",
+        context: Context,
+        listeners: Optional[Sequence[utilities.Listener]] = None,
+    ):
         """Handles commands.
 
         Args:
             self: The instance of the class.
             data (Message): The message data containing the command.
             context (Context): The context of the command.
+            listeners (list[Listener], optional): The text message handlers that accept the message.
 
         Returns:
             None or the response from the command function.
@@ -881,9 +1378,14 @@ class EventHandler(abc.ABC):
             This function is internally called and does not have direct usage examples.
         """
         if not data.content.startswith(self.command_prefix):
-            if self._events.get("text_message"):
+            if listeners is None:
+                listeners = self._matching_listeners("text_message", context)
+            if listeners:
                 self._handle_all_events(
-                    event="text_message", data=data, context=context
+                    event="text_message",
+                    data=data,
+                    context=context,
+                    listeners=listeners,
                 )
             return
         command_name, *_ = data.content[len(self.command_prefix) :].split()
@@ -895,45 +1397,106 @@ class EventHandler(abc.ABC):
                 context.reply(content=self._commands.__help__())
             return None
         message = data.content[len(self.command_prefix) + len(command_name) + 1 :]
-        if self._check_cooldown(command.name, data, context):
+        if self._check_cooldown(command, data, context):
             return None
 
         args = self._set_parameters(context=context, func=command.func, message=message)
-        command.func(*args)
+        if not command.timeout:
+            try:
+                self._call("command", command.func, args, name=f"command:{command.name}")
+            except entities.CommandCancelled as e:
+                logger.debug(f"Command {command.name} stopped: {e.reason}")
+            except Exception as e:
+                self._route_error("command", e)
+            return None
+
+        record = utilities.TimeoutRecord(
+            command.name, command.timeout, data.chatId, data.author.userId
+        )
+        self.command_timeouts.watch(context.token, record)
+        started = time.perf_counter()
+        result: Any = None
+        try:
+            result = self._call(
+                "command", command.func, args, name=f"command:{command.name}"
+            )
+        except entities.CommandCancelled as e:
+            logger.debug(f"Command {command.name} stopped: {e.reason}")
+        except Exception as e:
+            self._route_error("command", e)
+        finally:
+            if not isinstance(result, Future):
+                self.command_timeouts.finish(record, time.perf_counter() - started)
+        if isinstance(result, Future):
+            future = cast("Future[Any]", result)
+            record.thread = None
+            context.token.add_callback(future.cancel)
+            future.add_done_callback(
+                lambda _: self.command_timeouts.finish(
+                    record, time.perf_counter() - started
+                )
+            )
 
     def _check_cooldown(
         self,
-        command_name: str,
+        command: utilities.Command,
         data: "entities.Message",
         context: Context,
     ) -> bool:
         """A function that checks if a command is on cooldown."""
-        command = self._commands.fetch_command(command_name)
-        if command and command.cooldown:
-            cooldown_time = int(
-                self._commands.fetch_cooldown(command_name, data.author.userId)
-                - time.time()
-            )
-            if (
-                self._commands.fetch_cooldown(command_name, data.author.userId)
-                > time.time()
-            ):
-                default_message = f"You are on cooldown for {cooldown_time} seconds."
-                context.reply(content=self._cooldown_message or default_message)
-                return True
-            self._commands.set_cooldown(
-                command_name=command_name,
-                cooldown=command.cooldown,
-                userId=data.author.userId,
-            )
+        if not command.cooldown and not command.rate:
+            return False
+        scopeId = {
+            "user": data.author.userId,
+            "chat": data.chatId,
+            "community": str(data.comId),
+        }[command.scope]
+        retry_after = self._commands.check_cooldown(command, scopeId)
+        if retry_after:
+            default_message = f"You are on cooldown for {math.ceil(retry_after)} seconds."
+            context.reply(content=self._cooldown_message or default_message)
+            return True
         return False
 
     def _add_cache(self, chatId: str, userId: str, content: str) -> None:
+        """Hands a message to the `wait_for_reply` calls waiting on its author in its chat."""
+        with self._waiters_lock:
+            waiters = self._message_waiters.pop(f"{chatId}_{userId}", None)
+        for event, received in waiters or ():
+            received.append(content)
+            event.set()
+
+    def wait_for_reply(
+        self, chatId: str, userId: str, timeout: float = 10.0
+    ) -> Optional[str]:
+        """
+        Waits for the next message of a user in a chat. Requires intents.
+
+        `**Parameters**``
+        - `chatId` - The chat to wait in.
+        - `userId` - The user to wait for.
+        - `timeout` - The maximum time to wait in seconds. `Defaults` to `10`.
+
+        `**Returns**``
+        - `Optional[str]` - The content of the message, or `None` if the timeout was reached.
+        """
         key = f"{chatId}_{userId}"
-        with entities.cache as cache:
-            if cache.get(key) is not None:
-                cache.pop(key)
-            cache.add(key, content, expire=90)
+        event = threading.Event()
+        received: list[str] = []
+        with self._waiters_lock:
+            self._message_waiters.setdefault(key, []).append((event, received))
+        self._release_worker()
+        if not event.wait(timeout):
+            with self._waiters_lock:
+                waiters = self._message_waiters.get(key, [])
+                if (event, received) in waiters:
+                    waiters.remove((event, received))
+                if not waiters:
+                    self._message_waiters.pop(key, None)
+        return received[0] if received else None
+
+    def _release_worker(self) -> None:
+        """Called before the calling handler blocks waiting for another event."""
 
     def on_error(self) -> Callable[[CallableT], CallableT]:
         """This is an event that is called when an error occurs."""
@@ -943,213 +1506,333 @@ class EventHandler(abc.ABC):
         """This is an event that is called when the bot is ready to start handling events."""
         return self.register_event("ready")
 
-    def on_text_message(self) -> Callable[[CallableT], CallableT]:
-        """This is an event that is called when a text message is received in the chat."""
-        return self.register_event("text_message")
+    def on_text_message(
+        self, **options: Unpack[utilities.EventOptions]
+    ) -> Callable[[CallableT], CallableT]:
+        """This is an event that is called when a text message is received in the chat.
+
+        Every `on_*` event accepts the `comId`, `chatIds`, `userIds` and `roles` filters.
+        They are checked on the raw event before the handler's `Context` is built.
+
+        An event can have several handlers. They run by descending `priority`, then in
+        registration order, and a handler can return `STOP_PROPAGATION` to skip the rest.
+        Handlers registered with `concurrent=True` run on a thread pool instead.
+
+        `**Example**``
+        ```py
+        @bot.on_text_message(comId=123456, chatIds=["0000-0000-0000-0000"])
+        def on_text_message(ctx: Context):
+            ctx.reply(content="Hello World!")
+
+        @bot.on_text_message(priority=10)
+        def spam_filter(ctx: Context):
+            if "spam" in ctx.message.content:
+                return STOP_PROPAGATION
+        ```
+        """
+        return self.register_event("text_message", **options)
 
     def _console_on_text_message(self) -> Callable[[CallableT], CallableT]:
         """This is an event that is called when a text message is received in the console."""
         return self.register_event("_console_text_message")
 
-    def on_image_message(self) -> Callable[[CallableT], CallableT]:
+    def on_image_message(
+        self, **options: Unpack[utilities.EventOptions]
+    ) -> Callable[[CallableT], CallableT]:
         """This is an event that is called when an image message is received in the chat."""
-        return self.register_event("image_message")
+        return self.register_event("image_message", **options)
 
-    def on_youtube_message(self) -> Callable[[CallableT], CallableT]:
+    def on_youtube_message(
+        self, **options: Unpack[utilities.EventOptions]
+    ) -> Callable[[CallableT], CallableT]:
         """This is an event that is called when a YouTube message is received in the chat."""
-        return self.register_event("youtube_message")
+        return self.register_event("youtube_message", **options)
 
-    def on_strike_message(self) -> Callable[[CallableT], CallableT]:
+    def on_strike_message(
+        self, **options: Unpack[utilities.EventOptions]
+    ) -> Callable[[CallableT], CallableT]:
         """This is an event that is called when a strike message is received in the chat."""
-        return self.register_event("strike_message")
+        return self.register_event("strike_message", **options)
 
-    def on_voice_message(self) -> Callable[[CallableT], CallableT]:
+    def on_voice_message(
+        self, **options: Unpack[utilities.EventOptions]
+    ) -> Callable[[CallableT], CallableT]:
         """This is an event that is called when a voice message is received in the chat."""
-        return self.register_event("voice_message")
+        return self.register_event("voice_message", **options)
 
-    def on_sticker_message(self) -> Callable[[CallableT], CallableT]:
+    def on_sticker_message(
+        self, **options: Unpack[utilities.EventOptions]
+    ) -> Callable[[CallableT], CallableT]:
         """This is an event that is called when a sticker message is received in the chat."""
-        return self.register_event("sticker_message")
+        return self.register_event("sticker_message", **options)
 
-    def on_vc_not_answered(self) -> Callable[[CallableT], CallableT]:
+    def on_vc_not_answered(
+        self, **options: Unpack[utilities.EventOptions]
+    ) -> Callable[[CallableT], CallableT]:
         """This is an event that is called when a voice chat request is not answered."""
-        return self.register_event("vc_not_answered")
+        return self.register_event("vc_not_answered", **options)
 
-    def on_vc_not_cancelled(self) -> Callable[[CallableT], CallableT]:
+    def on_vc_not_cancelled(
+        self, **options: Unpack[utilities.EventOptions]
+    ) -> Callable[[CallableT], CallableT]:
         """This is an event that is called when a voice chat request is not cancelled."""
-        return self.register_event("vc_not_cancelled")
+        return self.register_event("vc_not_cancelled", **options)
 
-    def on_vc_not_declined(self) -> Callable[[CallableT], CallableT]:
+    def on_vc_not_declined(
+        self, **options: Unpack[utilities.EventOptions]
+    ) -> Callable[[CallableT], CallableT]:
         """This is an event that is called when a voice chat request is not declined."""
-        return self.register_event("vc_not_declined")
+        return self.register_event("vc_not_declined", **options)
 
-    def on_video_chat_not_answered(self) -> Callable[[CallableT], CallableT]:
+    def on_video_chat_not_answered(
+        self, **options: Unpack[utilities.EventOptions]
+    ) -> Callable[[CallableT], CallableT]:
         """This is an event that is called when a video chat request is not answered."""
-        return self.register_event("video_chat_not_answered")
+        return self.register_event("video_chat_not_answered", **options)
 
-    def on_video_chat_not_cancelled(self) -> Callable[[CallableT], CallableT]:
+    def on_video_chat_not_cancelled(
+        self, **options: Unpack[utilities.EventOptions]
+    ) -> Callable[[CallableT], CallableT]:
         """This is an event that is called when a video chat request is not cancelled."""
-        return self.register_event("video_chat_not_cancelled")
+        return self.register_event("video_chat_not_cancelled", **options)
 
-    def on_video_chat_not_declined(self) -> Callable[[CallableT], CallableT]:
+    def on_video_chat_not_declined(
+        self, **options: Unpack[utilities.EventOptions]
+    ) -> Callable[[CallableT], CallableT]:
         """This is an event that is called when a video chat request is not declined."""
-        return self.register_event("video_chat_not_declined")
+        return self.register_event("video_chat_not_declined", **options)
 
-    def on_avatar_chat_not_answered(self) -> Callable[[CallableT], CallableT]:
+    def on_avatar_chat_not_answered(
+        self, **options: Unpack[utilities.EventOptions]
+    ) -> Callable[[CallableT], CallableT]:
         """This is an event that is called when an avatar chat request is not answered."""
-        return self.register_event("avatar_chat_not_answered")
+        return self.register_event("avatar_chat_not_answered", **options)
 
-    def on_avatar_chat_not_cancelled(self) -> Callable[[CallableT], CallableT]:
+    def on_avatar_chat_not_cancelled(
+        self, **options: Unpack[utilities.EventOptions]
+    ) -> Callable[[CallableT], CallableT]:
         """This is an event that is called when an avatar chat request is not cancelled."""
-        return self.register_event("avatar_chat_not_cancelled")
+        return self.register_event("avatar_chat_not_cancelled", **options)
 
-    def on_avatar_chat_not_declined(self) -> Callable[[CallableT], CallableT]:
+    def on_avatar_chat_not_declined(
+        self, **options: Unpack[utilities.EventOptions]
+    ) -> Callable[[CallableT], CallableT]:
         """This is an event that is called when an avatar chat request is not declined."""
-        return self.register_event("avatar_chat_not_declined")
+        return self.register_event("avatar_chat_not_declined", **options)
 
-    def on_delete_message(self) -> Callable[[CallableT], CallableT]:
+    def on_delete_message(
+        self, **options: Unpack[utilities.EventOptions]
+    ) -> Callable[[CallableT], CallableT]:
         """This is an event that is called when a message is deleted in the chat."""
-        return self.register_event("delete_message")
+        return self.register_event("delete_message", **options)
 
-    def on_member_join(self) -> Callable[[CallableT], CallableT]:
+    def on_member_join(
+        self, **options: Unpack[utilities.EventOptions]
+    ) -> Callable[[CallableT], CallableT]:
         """This is an event that is called when a member joins the chat."""
-        return self.register_event("member_join")
+        return self.register_event("member_join", **options)
 
-    def on_member_leave(self) -> Callable[[CallableT], CallableT]:
+    def on_member_leave(
+        self, **options: Unpack[utilities.EventOptions]
+    ) -> Callable[[CallableT], CallableT]:
         """This is an event that is called when a member leaves the chat."""
-        return self.register_event("member_leave")
+        return self.register_event("member_leave", **options)
 
-    def on_chat_invite(self) -> Callable[[CallableT], CallableT]:
+    def on_chat_invite(
+        self, **options: Unpack[utilities.EventOptions]
+    ) -> Callable[[CallableT], CallableT]:
         """This is an event that is called when an invite is sent to the chat."""
-        return self.register_event("chat_invite")
+        return self.register_event("chat_invite", **options)
 
-    def on_chat_background_changed(self) -> Callable[[CallableT], CallableT]:
+    def on_chat_background_changed(
+        self, **options: Unpack[utilities.EventOptions]
+    ) -> Callable[[CallableT], CallableT]:
         """This is an event that is called when the chat background is changed."""
-        return self.register_event("chat_background_changed")
+        return self.register_event("chat_background_changed", **options)
 
-    def on_chat_title_changed(self) -> Callable[[CallableT], CallableT]:
+    def on_chat_title_changed(
+        self, **options: Unpack[utilities.EventOptions]
+    ) -> Callable[[CallableT], CallableT]:
         """This is an event that is called when the chat title is changed."""
-        return self.register_event("chat_title_changed")
+        return self.register_event("chat_title_changed", **options)
 
-    def on_chat_icon_changed(self) -> Callable[[CallableT], CallableT]:
+    def on_chat_icon_changed(
+        self, **options: Unpack[utilities.EventOptions]
+    ) -> Callable[[CallableT], CallableT]:
         """This is an event that is called when the chat icon is changed."""
-        return self.register_event("chat_icon_changed")
+        return self.register_event("chat_icon_changed", **options)
 
-    def on_vc_start(self) -> Callable[[CallableT], CallableT]:
+    def on_vc_start(
+        self, **options: Unpack[utilities.EventOptions]
+    ) -> Callable[[CallableT], CallableT]:
         """This is an event that is called when a voice chat starts."""
-        return self.register_event("vc_start")
+        return self.register_event("vc_start", **options)
 
-    def on_video_chat_start(self) -> Callable[[CallableT], CallableT]:
+    def on_video_chat_start(
+        self, **options: Unpack[utilities.EventOptions]
+    ) -> Callable[[CallableT], CallableT]:
         """This is an event that is called when a video chat starts."""
-        return self.register_event("video_chat_start")
+        return self.register_event("video_chat_start", **options)
 
-    def on_avatar_chat_start(self) -> Callable[[CallableT], CallableT]:
+    def on_avatar_chat_start(
+        self, **options: Unpack[utilities.EventOptions]
+    ) -> Callable[[CallableT], CallableT]:
         """This is an event that is called when an avatar chat starts."""
-        return self.register_event("avatar_chat_start")
+        return self.register_event("avatar_chat_start", **options)
 
-    def on_vc_end(self) -> Callable[[CallableT], CallableT]:
+    def on_vc_end(
+        self, **options: Unpack[utilities.EventOptions]
+    ) -> Callable[[CallableT], CallableT]:
         """This is an event that is called when a voice chat ends."""
-        return self.register_event("vc_end")
+        return self.register_event("vc_end", **options)
 
-    def on_video_chat_end(self) -> Callable[[CallableT], CallableT]:
+    def on_video_chat_end(
+        self, **options: Unpack[utilities.EventOptions]
+    ) -> Callable[[CallableT], CallableT]:
         """This is an event that is called when a video chat ends."""
-        return self.register_event("video_chat_end")
+        return self.register_event("video_chat_end", **options)
 
-    def on_avatar_chat_end(self) -> Callable[[CallableT], CallableT]:
+    def on_avatar_chat_end(
+        self, **options: Unpack[utilities.EventOptions]
+    ) -> Callable[[CallableT], CallableT]:
         """This is an event that is called when an avatar chat ends."""
-        return self.register_event("avatar_chat_end")
+        return self.register_event("avatar_chat_end", **options)
 
-    def on_chat_content_changed(self) -> Callable[[CallableT], CallableT]:
+    def on_chat_content_changed(
+        self, **options: Unpack[utilities.EventOptions]
+    ) -> Callable[[CallableT], CallableT]:
         """This is an event that is called when the chat content is changed."""
-        return self.register_event("chat_content_changed")
+        return self.register_event("chat_content_changed", **options)
 
-    def on_screen_room_start(self) -> Callable[[CallableT], CallableT]:
+    def on_screen_room_start(
+        self, **options: Unpack[utilities.EventOptions]
+    ) -> Callable[[CallableT], CallableT]:
         """This is an event that is called when a screen room starts."""
-        return self.register_event("screen_room_start")
+        return self.register_event("screen_room_start", **options)
 
-    def on_screen_room_end(self) -> Callable[[CallableT], CallableT]:
+    def on_screen_room_end(
+        self, **options: Unpack[utilities.EventOptions]
+    ) -> Callable[[CallableT], CallableT]:
         """This is an event that is called when a screen room ends."""
-        return self.register_event("screen_room_end")
+        return self.register_event("screen_room_end", **options)
 
-    def on_chat_host_transfered(self) -> Callable[[CallableT], CallableT]:
+    def on_chat_host_transfered(
+        self, **options: Unpack[utilities.EventOptions]
+    ) -> Callable[[CallableT], CallableT]:
         """This is an event that is called when the chat host is transferred."""
-        return self.register_event("chat_host_transfered")
+        return self.register_event("chat_host_transfered", **options)
 
-    def on_text_message_force_removed(self) -> Callable[[CallableT], CallableT]:
+    def on_text_message_force_removed(
+        self, **options: Unpack[utilities.EventOptions]
+    ) -> Callable[[CallableT], CallableT]:
         """This is an event that is called when a text message is forcefully removed."""
-        return self.register_event("text_message_force_removed")
+        return self.register_event("text_message_force_removed", **options)
 
-    def on_chat_removed_message(self) -> Callable[[CallableT], CallableT]:
+    def on_chat_removed_message(
+        self, **options: Unpack[utilities.EventOptions]
+    ) -> Callable[[CallableT], CallableT]:
         """This is an event that is called when a chat message is removed."""
-        return self.register_event("chat_removed_message")
+        return self.register_event("chat_removed_message", **options)
 
-    def on_mod_deleted_message(self) -> Callable[[CallableT], CallableT]:
+    def on_mod_deleted_message(
+        self, **options: Unpack[utilities.EventOptions]
+    ) -> Callable[[CallableT], CallableT]:
         """This is an event that is called when a moderator deletes a message."""
-        return self.register_event("mod_deleted_message")
+        return self.register_event("mod_deleted_message", **options)
 
-    def on_chat_tip(self) -> Callable[[CallableT], CallableT]:
+    def on_chat_tip(
+        self, **options: Unpack[utilities.EventOptions]
+    ) -> Callable[[CallableT], CallableT]:
         """This is an event that is called when a tip is received in the chat."""
-        return self.register_event("chat_tip")
+        return self.register_event("chat_tip", **options)
 
-    def on_chat_pin_announcement(self) -> Callable[[CallableT], CallableT]:
+    def on_chat_pin_announcement(
+        self, **options: Unpack[utilities.EventOptions]
+    ) -> Callable[[CallableT], CallableT]:
         """This is an event that is called when an announcement is pinned in the chat."""
-        return self.register_event("chat_pin_announcement")
+        return self.register_event("chat_pin_announcement", **options)
 
-    def on_vc_permission_open_to_everyone(self) -> Callable[[CallableT], CallableT]:
+    def on_vc_permission_open_to_everyone(
+        self, **options: Unpack[utilities.EventOptions]
+    ) -> Callable[[CallableT], CallableT]:
         """This is an event that is called when voice chat permissions are set to open to everyone."""
-        return self.register_event("vc_permission_open_to_everyone")
+        return self.register_event("vc_permission_open_to_everyone", **options)
 
     def on_vc_permission_invited_and_requested(
-        self,
+        self, **options: Unpack[utilities.EventOptions]
     ) -> Callable[[CallableT], CallableT]:
         """This is an event that is called when voice chat permissions are set to invited and requested."""
-        return self.register_event("vc_permission_invited_and_requested")
+        return self.register_event("vc_permission_invited_and_requested", **options)
 
-    def on_vc_permission_invite_only(self) -> Callable[[CallableT], CallableT]:
+    def on_vc_permission_invite_only(
+        self, **options: Unpack[utilities.EventOptions]
+    ) -> Callable[[CallableT], CallableT]:
         """This is an event that is called when voice chat permissions are set to invite only."""
-        return self.register_event("vc_permission_invite_only")
+        return self.register_event("vc_permission_invite_only", **options)
 
-    def on_chat_view_only_enabled(self) -> Callable[[CallableT], CallableT]:
+    def on_chat_view_only_enabled(
+        self, **options: Unpack[utilities.EventOptions]
+    ) -> Callable[[CallableT], CallableT]:
         """This is an event that is called when chat view only mode is enabled."""
-        return self.register_event("chat_view_only_enabled")
+        return self.register_event("chat_view_only_enabled", **options)
 
-    def on_chat_view_only_disabled(self) -> Callable[[CallableT], CallableT]:
+    def on_chat_view_only_disabled(
+        self, **options: Unpack[utilities.EventOptions]
+    ) -> Callable[[CallableT], CallableT]:
         """This is an event that is called when chat view only mode is disabled."""
-        return self.register_event("chat_view_only_disabled")
+        return self.register_event("chat_view_only_disabled", **options)
 
-    def on_chat_unpin_announcement(self) -> Callable[[CallableT], CallableT]:
+    def on_chat_unpin_announcement(
+        self, **options: Unpack[utilities.EventOptions]
+    ) -> Callable[[CallableT], CallableT]:
         """This is an event that is called when an announcement is unpinned in the chat."""
-        return self.register_event("chat_unpin_announcement")
+        return self.register_event("chat_unpin_announcement", **options)
 
-    def on_chat_tipping_enabled(self) -> Callable[[CallableT], CallableT]:
+    def on_chat_tipping_enabled(
+        self, **options: Unpack[utilities.EventOptions]
+    ) -> Callable[[CallableT], CallableT]:
         """This is an event that is called when chat tipping is enabled."""
-        return self.register_event("chat_tipping_enabled")
+        return self.register_event("chat_tipping_enabled", **options)
 
-    def on_chat_tipping_disabled(self) -> Callable[[CallableT], CallableT]:
+    def on_chat_tipping_disabled(
+        self, **options: Unpack[utilities.EventOptions]
+    ) -> Callable[[CallableT], CallableT]:
         """This is an event that is called when chat tipping is disabled."""
-        return self.register_event("chat_tipping_disabled")
+        return self.register_event("chat_tipping_disabled", **options)
 
-    def on_timestamp_message(self) -> Callable[[CallableT], CallableT]:
+    def on_timestamp_message(
+        self, **options: Unpack[utilities.EventOptions]
+    ) -> Callable[[CallableT], CallableT]:
         """This is an event that is called when a timestamp message is received in the chat."""
-        return self.register_event("timestamp_message")
+        return self.register_event("timestamp_message", **options)
 
-    def on_welcome_message(self) -> Callable[[CallableT], CallableT]:
+    def on_welcome_message(
+        self, **options: Unpack[utilities.EventOptions]
+    ) -> Callable[[CallableT], CallableT]:
         """This is an event that is called when a welcome message is received in the chat."""
-        return self.register_event("welcome_message")
+        return self.register_event("welcome_message", **options)
 
-    def on_share_exurl_message(self) -> Callable[[CallableT], CallableT]:
+    def on_share_exurl_message(
+        self, **options: Unpack[utilities.EventOptions]
+    ) -> Callable[[CallableT], CallableT]:
         """This is an event that is called when a shared external URL message is received in the chat."""
-        return self.register_event("share_exurl_message")
+        return self.register_event("share_exurl_message", **options)
 
-    def on_invite_message(self) -> Callable[[CallableT], CallableT]:
+    def on_invite_message(
+        self, **options: Unpack[utilities.EventOptions]
+    ) -> Callable[[CallableT], CallableT]:
         """This is an event that is called when an invite message is received in the chat."""
-        return self.register_event("invite_message")
+        return self.register_event("invite_message", **options)
 
-    def on_user_online(self) -> Callable[[CallableT], CallableT]:
+    def on_user_online(
+        self, **options: Unpack[utilities.EventOptions]
+    ) -> Callable[[CallableT], CallableT]:
         """This is an event that is called when a user comes online."""
-        return self.register_event("user_online")
+        return self.register_event("user_online", **options)
 
-    def on_member_set_you_host(self) -> Callable[[CallableT], CallableT]:
+    def on_member_set_you_host(
+        self, **options: Unpack[utilities.EventOptions]
+    ) -> Callable[[CallableT], CallableT]:
         """This is an event that is called when you are set as the host of the chat.
 
         **Example:**
@@ -1164,9 +1847,11 @@ class EventHandler(abc.ABC):
                 bot.community.send_message(chatId=chatId, content="I am now the host", comId=notification.comId)
         ```
         """
-        return self.register_event("member_set_you_host")
+        return self.register_event("member_set_you_host", **options)
 
-    def on_member_set_you_cohost(self) -> Callable[[CallableT], CallableT]:
+    def on_member_set_you_cohost(
+        self, **options: Unpack[utilities.EventOptions]
+    ) -> Callable[[CallableT], CallableT]:
         """This is an event that is called when you are set as a cohost of the chat.
 
         **Example:**
@@ -1181,9 +1866,11 @@ class EventHandler(abc.ABC):
                 bot.community.send_message(chatId=chatId, content="I am now a cohost", comId=notification.comId)
         ```
         """
-        return self.register_event("member_set_you_cohost")
+        return self.register_event("member_set_you_cohost", **options)
 
-    def on_member_remove_your_cohost(self) -> Callable[[CallableT], CallableT]:
+    def on_member_remove_your_cohost(
+        self, **options: Unpack[utilities.EventOptions]
+    ) -> Callable[[CallableT], CallableT]:
         """This is an event that is called when you are removed as a cohost of the chat.
 
         **Example:**
@@ -1198,7 +1885,7 @@ class EventHandler(abc.ABC):
                 bot.community.send_message(chatId=chatId, content="I am no longer a cohost", comId=notification.comId)
         ```
         """
-        return self.register_event("member_remove_your_cohost")
+        return self.register_event("member_remove_your_cohost", **options)
 
     def _handle_all_events(
         self,
@@ -1207,16 +1894,19 @@ class EventHandler(abc.ABC):
             "entities.Message", "entities.OnlineMembers", entities.Notification, Context
         ],
         context: Optional[Context],
+        listeners: Optional[Sequence[utilities.Listener]] = None,
     ) -> None:
-        callback = self._events.get(event)
-        if not callback:
+        if listeners is None:
+            listeners = self._matching_listeners(event, data)
+        if not listeners:
             return
-        args: list[Any] = []
-        if context:
-            args.extend(self._set_parameters(context, callback))
-        else:
-            args.append(data)
-        callback(*args)
+
+        def arguments(listener: utilities.Listener) -> list[Any]:
+            if context:
+                return self._set_parameters(context, listener.callback)
+            return [data]
+
+        self._run_listeners(event, listeners, arguments)
 
     def _handle_event(
         self,
@@ -1226,19 +1916,58 @@ class EventHandler(abc.ABC):
         ],
     ) -> None:
         """Is a function that handles events."""
+        listeners = self._matching_listeners(event, data)
+        triggered: dict[utilities.Listener, dict[str, Any]] = {}
+        if event == "text_message" and isinstance(data, entities.Message):
+            triggered = self._match_triggers(data)
+            if (
+                not listeners
+                and not triggered
+                and not data.content.startswith(self.command_prefix)
+            ):
+                if self.intents:
+                    self._add_cache(data.chatId, data.author.userId, data.content)
+                return None
+        elif not listeners:
+            return None
         context: Optional[Context] = None
         if isinstance(data, entities.Message):
             context = Context(data, cast(bot.Bot, self))
         elif isinstance(data, Context):
             context = data
+        self._run_middleware(
+            event,
+            context or data,
+            lambda: self._dispatch_event(event, data, context, listeners, triggered),
+        )
+
+    def _dispatch_event(
+        self,
+        event: str,
+        data: Union[
+            "entities.Message", "entities.OnlineMembers", entities.Notification, Context
+        ],
+        context: Optional[Context],
+        listeners: list[utilities.Listener],
+        triggered: Optional[dict[utilities.Listener, dict[str, Any]]] = None,
+    ) -> None:
         if event == "text_message" and isinstance(data, entities.Message):
             command_name = data.content[len(self.command_prefix) :].split(" ")[0]
             if self.intents and not self.command_exists(command_name):
                 self._add_cache(data.chatId, data.author.userId, data.content)
+            if context and triggered:
+                stopped = self._run_listeners(
+                    event,
+                    sorted(triggered, key=lambda listener: listener.sort_key),
+                    lambda listener: self._set_parameters(
+                        context, listener.callback, **triggered[listener]
+                    ),
+                )
+                if stopped:
+                    return None
             if context:
-                self._handle_command(data=data, context=context)
+                self._handle_command(data=data, context=context, listeners=listeners)
                 return None
-        if event in self._events:
-            self._handle_all_events(event=event, data=data, context=context)
-
-        return None
+        self._handle_all_events(
+            event=event, data=data, context=context, listeners=listeners
+        )
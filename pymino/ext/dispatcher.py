@@ -26,10 +26,18 @@ class MessageDispatcher:
     """
 
     def __init__(self) -> None:
-        self.dispatch_table: dict[int, set[Handler]] = {}
-
-    def register(self, message_type: int, handler: Handler) -> None:
-        self.dispatch_table.setdefault(message_type, set()).add(handler)
+        self.dispatch_table: dict[int, list[Handler]] = {}
+        self.priorities: dict[Handler, int] = {}
+        self.version = 0
+
+    def register(self, message_type: int, handler: Handler, priority: int = 0) -> None:
+        """Registers a handler. Handlers with a higher priority run first, ties run in registration order."""
+        handlers = self.dispatch_table.setdefault(message_type, [])
+        if handler not in handlers:
+            handlers.append(handler)
+        self.priorities[handler] = priority
+        handlers.sort(key=lambda registered: -self.priorities.get(registered, 0))
+        self.version += 1
 
     def handle(self, message: dict[str, Any]) -> None:
         message_type = message.get("t", 0)
@@ -9,6 +9,7 @@ from pymino.ext.entities.exceptions import *
 from pymino.ext.entities.general import *
 from pymino.ext.entities.handlers import *
 from pymino.ext.entities.link_info import *
+from pymino.ext.entities.media import *
 from pymino.ext.entities.member import *
 from pymino.ext.entities.messages import *
 from pymino.ext.entities.notification import *
@@ -1,4 +1,4 @@
-from typing import Any, NoReturn
+from typing import Any, NoReturn, Optional
 
 __all__ = (
     "APIException",
@@ -27,6 +27,7 @@ __all__ = (
     "ChatInvitesDisabled",
     "ChatMessageTooBig",
     "ChatViewOnly",
+    "CommandCancelled",
     "CommunityCreateLimitReached",
     "CommunityDeleted",
     "CommunityDisabled",
@@ -60,6 +61,7 @@ __all__ = (
     "LevelFiveRequiredToEnableProps",
     "LoginFailed",
     "LoginRequired",
+    "MediaUploadFailed",
     "MessageNeeded",
     "MissingAwaitError",
     "MissingCommunityId",
@@ -570,3 +572,41 @@ class MissingServiceKey(PyminoException):
         super().__init__(
             "It appears you are missing a required service key. This key is essential for accessing the service. To obtain the key, please visit the official Discord server. The Server provides support and resources related to the service. https://discord.gg/3HRdkVNets"
         )
+
+
+class MediaUploadFailed(PyminoException):
+    """
+    Raised when some media of a batch of two or more could not be uploaded.
+    A single media raises the original error of its upload instead.
+
+    `**Attributes**`
+    - `results` - The media values in input order, `None` where the upload failed.
+    - `errors` - Maps the index of every failed media to its exception.
+
+    """
+
+    def __init__(
+        self, results: list[Optional[str]], errors: dict[int, Exception]
+    ) -> None:
+        self.results = results
+        self.errors = errors
+        failed = ", ".join(
+            f"#{index}: {type(exc).__name__}" for index, exc in sorted(errors.items())
+        )
+        super().__init__(
+            f"Failed to upload {len(errors)} of {len(results)} media ({failed})."
+        )
+
+
+class CommandCancelled(PyminoException):
+    """
+    Raised by `CancellationToken.raise_if_cancelled` once a command was cancelled.
+
+    `**Attributes**`
+    - `reason` - Why the command was cancelled, e.g. `timeout`.
+
+    """
+
+    def __init__(self, reason: str = "cancelled") -> None:
+        self.reason = reason
+        super().__init__(f"The command was cancelled ({reason}).")
@@ -4,7 +4,6 @@ import os
 import random
 import re
 import time
-import urllib.request
 from typing import Any, BinaryIO, Optional, Union
 
 import colorama
@@ -192,22 +191,6 @@ def run_alive_loop(ws: socket.WSClient) -> None:
 
 
 def read_media(media: Media) -> bytes:
-    if isinstance(media, str):
-        if media.startswith("http") and "://" in media:
-            try:
-                with urllib.request.urlopen(media) as response:
-                    data = response.read()
-            except Exception as exc:
-                raise entities.InvalidImage from exc
-        elif os.path.exists(media) and os.path.isfile(media):
-            with open(media, "rb") as f:
-                data = f.read()
-        else:
-            raise entities.InvalidImage from None
-    elif isinstance(media, BinaryIO):
-        data = media.read()
-    elif isinstance(media, bytes):  # pyright: ignore[reportUnnecessaryIsInstance]
-        data = media
-    else:
-        raise entities.InvalidImage from None
-    return data
+    """Reads a media from a URL, a file path, bytes or a file-like object."""
+    with entities.MediaSource.open(media) as source:
+        return source.read()
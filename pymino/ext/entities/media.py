@@ -0,0 +1,170 @@
+import hashlib
+import mmap
+import os
+from typing import Any, Optional, Union
+
+import requests
+
+from pymino.ext import entities
+
+__all__ = ("MAX_MEDIA_SIZE", "MEDIA_TIMEOUT", "MediaSource")
+
+MAX_MEDIA_SIZE = 50 * 1024 * 1024
+MEDIA_TIMEOUT = 15.0
+CHUNK_SIZE = 64 * 1024
+
+http_session = requests.Session()
+
+
+class MediaSource:
+    """
+    `MediaSource` - A media that is read once and can be hashed and uploaded.
+
+    Use `MediaSource.open` to create one from a URL, a file path, bytes or any
+    object with a `read` method.
+
+    - URLs are streamed with a timeout and a size limit over a shared HTTP session.
+    - Local files are memory mapped, so hashing them does not copy them into memory.
+
+    `**Example**`
+    ```py
+    with MediaSource.open("https://i.imgur.com/image.jpg") as media:
+        print(len(media), media.digest())
+    ```
+
+    """
+
+    __slots__ = ("_data", "_file", "_mmap")
+
+    def __init__(
+        self,
+        data: Optional[bytes] = None,
+        path: Optional[str] = None,
+    ) -> None:
+        self._data = data
+        self._file = None
+        self._mmap: Optional[mmap.mmap] = None
+        if path is not None:
+            self._file = open(path, "rb")
+            if os.fstat(self._file.fileno()).st_size:
+                self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                self._data = b""
+
+    @classmethod
+    def open(
+        cls,
+        media: "entities.Media",
+        timeout: float = MEDIA_TIMEOUT,
+        max_size: int = MAX_MEDIA_SIZE,
+    ) -> "MediaSource":
+        """
+        Opens a media.
+
+        `**Parameters**`
+        - `media` - A URL, a file path, bytes or a file-like object.
+        - `timeout` - The timeout in seconds for URL downloads. `Defaults` to `15`.
+        - `max_size` - The maximum size in bytes of the media. `Defaults` to `50 MiB`.
+
+        `**Returns**`
+        - `MediaSource` - The opened media.
+
+        `**Raises**`
+        - `InvalidImage` - If the media cannot be read.
+        - `FileTooLarge` - If the media is larger than `max_size`.
+
+        """
+        if isinstance(media, (bytes, bytearray, memoryview)):
+            source = cls(bytes(media))
+        elif isinstance(media, str):
+            if media.startswith("http") and "://" in media:
+                source = cls(cls._download(media, timeout, max_size))
+            elif os.path.isfile(media):
+                source = cls(path=media)
+            else:
+                raise entities.InvalidImage from None
+        elif callable(getattr(media, "read", None)):
+            source = cls(cls._read_file(media, max_size))
+        else:
+            raise entities.InvalidImage from None
+        if len(source) > max_size:
+            source.close()
+            raise entities.FileTooLarge(f"Media is larger than {max_size} bytes.")
+        return source
+
+    @staticmethod
+    def _download(url: str, timeout: float, max_size: int) -> bytes:
+        try:
+            with http_session.get(url, stream=True, timeout=timeout) as response:
+                response.raise_for_status()
+                length = response.headers.get("Content-Length")
+                if length and length.isdigit() and int(length) > max_size:
+                    raise entities.FileTooLarge(f"Media is larger than {max_size} bytes.")
+                data = bytearray()
+                for chunk in response.iter_content(CHUNK_SIZE):
+                    data += chunk
+                    if len(data) > max_size:
+                        raise entities.FileTooLarge(
+                            f"Media is larger than {max_size} bytes."
+                        )
+        except requests.RequestException as exc:
+            raise entities.InvalidImage from exc
+        return bytes(data)
+
+    @staticmethod
+    def _read_file(media: Any, max_size: int) -> bytes:
+        data = bytearray()
+        while True:
+            chunk = media.read(CHUNK_SIZE)
+            if not chunk:
+                break
+            if isinstance(chunk, str):
+                raise entities.InvalidImage from None
+            data += chunk
+            if len(data) > max_size:
+                raise entities.FileTooLarge(f"Media is larger than {max_size} bytes.")
+        return bytes(data)
+
+    def __len__(self) -> int:
+        return len(self.view())
+
+    def __enter__(self) -> "MediaSource":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def view(self) -> Union[bytes, mmap.mmap]:
+        """Returns the content of the media without copying it."""
+        if self._mmap is not None:
+            return self._mmap
+        if self._data is None:
+            raise ValueError("I/O operation on closed media.")
+        return self._data
+
+    def read(self) -> bytes:
+        """Returns the content of the media."""
+        view = self.view()
+        return view if isinstance(view, bytes) else view[:]
+
+    def digest(self, algorithm: str = "sha256") -> str:
+        """
+        Hashes the content of the media.
+
+        `**Parameters**`
+        - `algorithm` - The `hashlib` algorithm to use. `Defaults` to `sha256`.
+
+        `**Returns**`
+        - `str` - The hex digest of the media.
+
+        """
+        return hashlib.new(algorithm, self.view()).hexdigest()
+
+    def close(self) -> None:
+        """Releases the memory map and file handle of the media."""
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
@@ -389,6 +389,12 @@ class CMessages:
         self.data: list[dict[str, Any]] = (
             data.get("result") or data.get("messageList") or []
         )
+        self.paging: dict[str, Any] = data.get("paging") or {}
+
+    @property
+    def next_page_token(self) -> Optional[str]:
+        """Returns the token of the next page of messages."""
+        return self.paging.get("nextPageToken")
 
     @property
     def includedInSummary(self) -> list[bool]:
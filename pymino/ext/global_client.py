@@ -41,6 +41,14 @@ class Global(abc.ABC):
     @abc.abstractmethod
     def proxy(self) -> Optional[str]: ...
 
+    @property
+    @abc.abstractmethod
+    def media_cache(self) -> utilities.MediaCache: ...
+
+    @property
+    @abc.abstractmethod
+    def rate_limiter(self) -> utilities.RateLimiter: ...
+
     @abc.abstractmethod
     def send_websocket_message(self, message: dict[str, Any]) -> None: ...
 
@@ -55,6 +63,9 @@ class Global(abc.ABC):
         use_cache: bool = True,
     ) -> dict[str, Any]: ...
 
+    @abc.abstractmethod
+    def refresh_login(self) -> None: ...
+
     def fetch_user(self, userId: Optional[str] = None) -> "entities.UserProfile":
         """
         Fetches a user's profile.
@@ -165,15 +176,36 @@ class Global(abc.ABC):
         media: "entities.Media",
         content_type: str = "image/jpg",
     ) -> str:
-        response = entities.ApiResponse(
-            self.request.handler(
-                "POST",
-                "/g/s/media/upload",
-                data=entities.read_media(media),
-                content_type=content_type,
+        """
+        Uploads a media file to the server.
+
+        :param media: The media to upload. Can be a URL, a file path, bytes or a file-like object.
+        :type media: Media
+        :param content_type: The content type of the media. Defaults to "image/jpg".
+        :type content_type: str
+        :return: The media value of the uploaded media.
+        :rtype: str
+
+        Uploads are cached by content, so uploading the same bytes again returns the cached media value
+        without another round trip. See `media_cache`.
+        """
+        with entities.MediaSource.open(media) as source:
+            key = self.media_cache.key(source, content_type)
+            media_value = self.media_cache.get(key)
+            if media_value:
+                return media_value
+            response = entities.ApiResponse(
+                self.request.handler(
+                    "POST",
+                    "/g/s/media/upload",
+                    data=source.read(),
+                    content_type=content_type,
+                )
             )
-        )
-        return cast(str, response.media_value)
+        media_value = cast(str, response.media_value)
+        if media_value:
+            self.media_cache.set(key, media_value)
+        return media_value
 
     def upload_image(self, image: "entities.Media") -> str:
         return self.upload_media(image, "image/jpg")
@@ -837,6 +869,44 @@ class Global(abc.ABC):
             )
         )
 
+    def iter_messages(
+        self,
+        chatId: str,
+        pageToken: Optional[str] = None,
+        size: int = 25,
+        limit: Optional[int] = None,
+        prefetch: bool = True,
+    ) -> "utilities.Paginator[entities.CMessage]":
+        """
+        Iterates over the messages of a chat, newest first.
+
+        :param chatId: The ID of the chat.
+        :type chatId: str
+        :param pageToken: The page token to start from, e.g. a saved `Paginator.cursor`. (Default: None)
+        :type pageToken: str, optional
+        :param size: The number of messages fetched per request. (Default: 25)
+        :type size: int, optional
+        :param limit: The maximum number of messages to yield. (Default: None, all of them)
+        :type limit: int, optional
+        :param prefetch: Whether to fetch the next page in the background. (Default: True)
+        :type prefetch: bool, optional
+        :return: A `Paginator` that yields `CMessage` objects.
+        :rtype: Paginator[CMessage]
+
+        **Example usage:**
+
+        >>> for message in client.iter_messages("chat123", limit=100):
+        ...     print(message.content)
+        """
+
+        def fetch(
+            pageToken: Optional[str], size: int
+        ) -> tuple[list[entities.CMessage], Optional[str]]:
+            messages = self.fetch_messages(chatId, size, pageToken)
+            return list(map(entities.CMessage, messages.data)), messages.next_page_token
+
+        return utilities.Paginator[entities.CMessage].from_token(fetch, pageToken, size, limit, prefetch)
+
     @utilities.authenticated
     def fetch_message(self, chatId: str, messageId: str) -> "entities.Message":
         """
@@ -929,6 +999,43 @@ class Global(abc.ABC):
             )
         )
 
+    def iter_followers(
+        self,
+        userId: str,
+        start: int = 0,
+        size: int = 25,
+        limit: Optional[int] = None,
+        prefetch: bool = True,
+    ) -> "utilities.Paginator[entities.UserProfile]":
+        """
+        Iterates over the followers of a user.
+
+        :param userId: The ID of the user.
+        :type userId: str
+        :param start: The offset to start from, e.g. a saved `Paginator.cursor`. (Default: 0)
+        :type start: int, optional
+        :param size: The number of followers fetched per request. (Default: 25)
+        :type size: int, optional
+        :param limit: The maximum number of followers to yield. (Default: None, all of them)
+        :type limit: int, optional
+        :param prefetch: Whether to fetch the next page in the background. (Default: True)
+        :type prefetch: bool, optional
+        :return: A `Paginator` that yields `UserProfile` objects.
+        :rtype: Paginator[UserProfile]
+
+        **Example usage:**
+
+        >>> for follower in client.iter_followers("user123"):
+        ...     print(follower.nickname)
+        """
+        return utilities.Paginator[entities.UserProfile].from_offset(
+            lambda start, size: self.fetch_followers(userId, start, size),
+            start,
+            size,
+            limit,
+            prefetch,
+        )
+
     def fetch_following(
         self,
         userId: str,
@@ -1015,6 +1122,49 @@ class Global(abc.ABC):
             )
         )
 
+    def iter_following(
+        self,
+        userId: str,
+        pageToken: Optional[str] = None,
+        size: int = 25,
+        limit: Optional[int] = None,
+        prefetch: bool = True,
+        ignoreMembership: bool = True,
+    ) -> "utilities.Paginator[entities.UserProfile]":
+        """
+        Iterates over the users that the specified user is following.
+
+        :param userId: The ID of the user.
+        :type userId: str
+        :param pageToken: The page token to start from, e.g. a saved `Paginator.cursor`. (Default: None)
+        :type pageToken: str, optional
+        :param size: The number of users fetched per request. (Default: 25)
+        :type size: int, optional
+        :param limit: The maximum number of users to yield. (Default: None, all of them)
+        :type limit: int, optional
+        :param prefetch: Whether to fetch the next page in the background. (Default: True)
+        :type prefetch: bool, optional
+        :param ignoreMembership: Whether to ignore membership. (Default: True)
+        :type ignoreMembership: bool, optional
+        :return: A `Paginator` that yields `UserProfile` objects.
+        :rtype: Paginator[UserProfile]
+
+        **Example usage:**
+
+        >>> for user in client.iter_following("user123", limit=500):
+        ...     print(user.userId)
+        """
+
+        def fetch(
+            pageToken: Optional[str], size: int
+        ) -> tuple[entities.UserProfileList, Optional[str]]:
+            following = self.large_fetch_following(
+                userId, size, pageToken, ignoreMembership
+            )
+            return following.members, following.paging.next_page_token
+
+        return utilities.Paginator[entities.UserProfile].from_token(fetch, pageToken, size, limit, prefetch)
+
     def fetch_visitors(
         self,
         userId: str,
@@ -1,21 +1,25 @@
 import abc
+import collections
 import logging
 import random
+import re
 import signal
 import threading
 import time
 import urllib.parse
-from typing import Any, Optional, Union
+from typing import Any, Optional, Union, cast
 
 import ujson
 import websocket
 
-from pymino.ext import context, dispatcher, entities, utilities
+from pymino.ext import context, dispatcher, entities, global_client, utilities
 
 __all__ = ("WSClient",)
 
 logger = logging.getLogger("pymino")
 
+FRAME_TYPE = re.compile(r'"t"\s*:\s*(\d+)')
+
 
 class WSClient(context.EventHandler):
     """
@@ -38,10 +42,22 @@ class WSClient(context.EventHandler):
     """
 
     __slots__ = (
+        "_chat_cursors",
+        "_chat_lock",
         "_communities",
+        "_disconnected",
+        "_endpoint",
+        "_frame_types",
         "_task_runner_active",
+        "backfill_limit",
         "channel",
+        "connection",
         "dispatcher",
+        "endpoints",
+        "event_lanes",
+        "lanes",
+        "seen",
+        "websocket_writer",
         "ws",
     )
 
@@ -86,23 +102,52 @@ class WSClient(context.EventHandler):
         self.dispatcher.register(
             entities.WsMessageTypes.CHAT_MESSAGE_DTO, self._handle_message
         )
+        self.dispatcher.register(
+            entities.WsMessageTypes.CHANNEL_USER_PING_RESPONSE,
+            self._handle_ping_response,
+        )
         self._communities: set[int] = set()
         self._task_runner_active: bool = False
+        self._disconnected: bool = False
+        self._chat_lock = threading.Lock()
+        self._chat_cursors: collections.OrderedDict[str, tuple[int, str, str]] = (
+            collections.OrderedDict()
+        )
+        self._frame_types: tuple[int, int, frozenset[str]] = (-1, -1, frozenset())
+        self.backfill_limit: int = 100
+        self.seen = utilities.SeenSet()
+        self.lanes = utilities.LaneScheduler()
+        self.event_lanes: dict[str, str] = dict(utilities.EVENT_LANES)
         self.channel: Optional[entities.Channel] = None
+        self.websocket_writer = utilities.WebsocketWriter(self._write_websocket_message)
+        self.connection = utilities.ConnectionMonitor()
+        self.endpoints = utilities.EndpointPool()
+        self._endpoint: Optional[str] = None
 
         signal.signal(signal.SIGINT, signal.SIG_DFL)
         super().__init__()
 
     def fetch_ws_url(self) -> str:
-        return f"wss://ws{random.randint(1, 4)}.aminoapps.com/"
+        """Returns the fastest healthy endpoint of `endpoints`."""
+        return self.endpoints.select()
+
+    def connect(self, timeout: Optional[float] = None) -> bool:
+        """
+        Connects to the websocket.
 
-    def connect(self) -> None:
-        """Connects to the websocket."""
+        Returns as soon as the websocket is open. Failed handshakes are retried
+        with the exponential backoff of `connection.backoff` in the meantime.
+
+        `**Parameters**`
+        - `timeout` - The maximum number of seconds to wait. `Defaults` to `None` (forever).
+
+        `**Returns**`
+        - `bool` - `True` if the websocket is open.
+        """
         if not self.sid:
             raise RuntimeError("Cannot connect websocket when the bot is not logged")
         threading.Thread(target=self._run_forever).start()
-        while not self.connected:
-            time.sleep(1)
+        return self.connection.wait(timeout)
 
     @property
     def connected(self) -> bool:
@@ -119,8 +164,10 @@ class WSClient(context.EventHandler):
                 self.ws = websocket.WebSocket()
             if not self.connected:
                 logger.debug("Initializing websocket.")
+                self.connection.connecting()
                 ws_data = f"{self.device_id}|{int(time.time() * 1000)}"
-                url = f"{self.fetch_ws_url()}?" + urllib.parse.urlencode(
+                endpoint = self._endpoint = self.fetch_ws_url()
+                url = f"{endpoint}?" + urllib.parse.urlencode(
                     {"signbody": ws_data}
                 )
                 kwargs: dict[str, Any] = {
@@ -128,7 +175,8 @@ class WSClient(context.EventHandler):
                         "NDCDEVICEID": self.device_id,
                         "NDCAUTH": f"sid={self.sid}",
                         "NDC-MSG-SIG": self.generate.signature(ws_data),
-                    }
+                    },
+                    "timeout": self.connection.handshake_timeout,
                 }
                 if self.proxy:
                     proxy = urllib.parse.urlparse(self.proxy)
@@ -139,31 +187,81 @@ class WSClient(context.EventHandler):
                     self.ws.connect(  # pyright: ignore[reportUnknownMemberType]
                         url, **kwargs
                     )
-                except websocket.WebSocketConnectionClosedException:
-                    time.sleep(1)
-                    logger.debug("Websocket handshake failed.")
+                except (websocket.WebSocketException, OSError) as exc:
+                    self.endpoints.failed(endpoint, exc)
+                    delay = self.connection.failed(exc)
+                    logger.debug(
+                        f"Websocket handshake failed: {exc!r}. Retrying in {delay:.1f}s."
+                    )
+                    time.sleep(delay)
                     continue
+                self.ws.settimeout(None)
+                handshake = self.connection.connected()
+                self.endpoints.succeeded(endpoint, handshake)
+                logger.debug(f"Websocket connected to {endpoint} in {handshake:.3f}s.")
                 self._on_websocket_open()
+                if self._disconnected:
+                    self._disconnected = False
+                    threading.Thread(
+                        target=self._backfill_chats,
+                        name="pymino-backfill",
+                        daemon=True,
+                    ).start()
             try:
                 message = self.ws.recv()
-            except websocket.WebSocketException as exc:
+            except (websocket.WebSocketException, OSError) as exc:
+                delay = self.connection.disconnected(exc)
+                if self._endpoint:
+                    self.endpoints.failed(self._endpoint, exc)
                 self._on_websocket_error(exc)
                 self.stop_websocket()
+                self._disconnected = True
+                logger.debug(f"Websocket disconnected. Reconnecting in {delay:.1f}s.")
+                time.sleep(delay)
                 continue
             self._on_websocket_message(message)
+        self.connection.disconnected()
         self.stop_websocket()
 
     def _on_websocket_error(self, error: Exception) -> None:
         """Handles websocket errors."""
-        callback = self._events.get("error")
-        if callback:
-            threading.Thread(target=callback, args=(error,)).start()
+        if "error" in self._events:
+            threading.Thread(target=self.emit, args=("error", error)).start()
 
         logger.debug(f"Websocket error: {error}")
 
     def _on_websocket_message(self, message: Union[bytes, str]) -> None:
-        """Receives websocket messages."""
-        threading.Thread(target=self._handle_websocket_message, args=(message,)).start()
+        """Receives websocket messages and queues them on their priority lane."""
+        frame = self._decode_websocket_message(message)
+        if frame is None:
+            return None
+        # Pongs skip the lanes so their round trip excludes the wait for a worker.
+        if frame.get("t") == entities.WsMessageTypes.CHANNEL_USER_PING_RESPONSE:
+            self._handle_ping_response(frame)
+        else:
+            self.lanes.submit(self._frame_lane(frame), self.dispatcher.handle, frame)
+
+    def _frame_lane(self, frame: dict[str, Any]) -> str:
+        """Returns the name of the lane a frame is processed on, using `event_lanes`."""
+        message_type = frame.get("t")
+        payload: dict[str, Any] = frame.get("o") or {}
+        if message_type == entities.WsMessageTypes.CHAT_MESSAGE_DTO:
+            chat_message: dict[str, Any] = payload.get("chatMessage") or {}
+            content = chat_message.get("content")
+            if isinstance(content, str) and content.startswith(self.command_prefix):
+                return self.event_lanes.get("command", "command")
+            event = entities.EVENT_TYPES.get(
+                f"{chat_message.get('type', 0)}:{chat_message.get('mediaType', 0)}", ""
+            )
+            return self.event_lanes.get(event, "moderation")
+        if message_type == entities.WsMessageTypes.PUSH_NOTIFICATION_DTO:
+            notification: dict[str, Any] = payload.get("payload") or {}
+            notification_type = notification.get("notifType", 0)
+            event = entities.NOTIF_TYPES.get(notification_type, "")
+            return self.event_lanes.get(event, "passive")
+        if message_type == entities.WsMessageTypes.LIVE_LAYER_USER_JOINED_EVENT:
+            return self.event_lanes.get("user_online", "passive")
+        return "passive"
 
     def _on_websocket_close(self) -> None:
         """Handles websocket close events."""
@@ -185,29 +283,142 @@ class WSClient(context.EventHandler):
                 }
             )
 
-    def _handle_websocket_message(self, message: Union[bytes, str]) -> None:
-        """Handles websocket messages."""
+    def _release_worker(self) -> None:
+        """Replaces the lane worker of the calling thread while it blocks, if it is one."""
+        self.lanes.release(threading.get_ident())
+
+    def _command_timed_out(self, record: utilities.TimeoutRecord) -> None:
+        """Replaces the lane worker stuck in a timed out command so other events keep flowing."""
+        super()._command_timed_out(record)
+        if record.thread is not None:
+            self.lanes.release(record.thread)
+
+    def _interesting_frames(self) -> frozenset[str]:
+        """Returns the frame types (`t`) that have a handler, as strings."""
+        version = (self.dispatcher.version, len(self._events))
+        if self._frame_types[:2] != version:
+            types = set(self.dispatcher.dispatch_table)
+            if not any(event in self._events for event in entities.NOTIF_TYPES.values()):
+                types.discard(entities.WsMessageTypes.PUSH_NOTIFICATION_DTO)
+            if "user_online" not in self._events:
+                types.discard(entities.WsMessageTypes.LIVE_LAYER_USER_JOINED_EVENT)
+            self._frame_types = (*version, frozenset(str(int(t)) for t in types))
+        return self._frame_types[2]
+
+    def _decode_websocket_message(
+        self, message: Union[bytes, str]
+    ) -> Optional[dict[str, Any]]:
+        """Decodes a websocket message, skipping frames no handler is interested in."""
+        raw = message.decode("utf-8", "replace") if isinstance(message, bytes) else message
+        frame_types = FRAME_TYPE.findall(raw)
+        if frame_types and self._interesting_frames().isdisjoint(frame_types):
+            return None
         try:
-            self.dispatcher.handle(ujson.loads(message))
+            return cast(dict[str, Any], ujson.loads(message))
         except ujson.JSONDecodeError:
             logger.error(f"Unhandled ws message: {message!r}")
+        return None
+
+    def _handle_websocket_message(self, message: Union[bytes, str]) -> None:
+        """Handles websocket messages."""
+        frame = self._decode_websocket_message(message)
+        if frame is not None:
+            self.dispatcher.handle(frame)
 
     def _handle_message(self, data: dict[str, Any]) -> None:
         """Sends the message to the event handler."""
-        message = entities.Message(data)
+        payload: dict[str, Any] = data.get("o") or {}
+        chat_message: dict[str, Any] = payload.get("chatMessage") or {}
+        messageId: Optional[str] = chat_message.get("messageId")
+        if messageId and not self.seen.add(messageId):
+            return None
+        self._track_chat(payload)
 
-        if self.userId == message.userId:
+        if payload.get("ndcId"):
+            self._communities.add(payload["ndcId"])
+        if self.userId and chat_message.get("uid") == self.userId:
+            return None
+        event_key = f"{chat_message.get('type', 0)}:{chat_message.get('mediaType', 0)}"
+        if event_key not in self._interesting_keys():
+            return None
+        if (
+            event_key == "0:0"
+            and not self.intents
+            and "text_message" not in self._events
+            and not len(self._triggers)
+            and not (chat_message.get("content") or "").startswith(self.command_prefix)
+        ):
             return None
-        if message.comId:
-            self._communities.add(message.comId)
+
+        message = entities.Message(data)
 
         key = entities.EVENT_TYPES.get(f"{message.type}:{message.mediaType}")
 
         if key:
             self._handle_event(key, message)
 
+    def _track_chat(self, payload: dict[str, Any]) -> None:
+        """Records the newest message of a chat."""
+        chat_message: dict[str, Any] = payload.get("chatMessage") or {}
+        chatId: Optional[str] = chat_message.get("threadId")
+        messageId: Optional[str] = chat_message.get("messageId")
+        if not (chatId and messageId):
+            return None
+        createdTime: str = chat_message.get("createdTime") or ""
+        with self._chat_lock:
+            cursor = self._chat_cursors.get(chatId)
+            if cursor is None or createdTime >= cursor[2]:
+                self._chat_cursors[chatId] = (
+                    payload.get("ndcId", 0),
+                    messageId,
+                    createdTime,
+                )
+            self._chat_cursors.move_to_end(chatId)
+            while len(self._chat_cursors) > 256:
+                self._chat_cursors.popitem(last=False)
+
+    def _backfill_chats(self) -> None:
+        """Replays the messages that were sent while the websocket was disconnected."""
+        if self.backfill_limit <= 0:
+            return None
+        with self._chat_lock:
+            cursors = list(self._chat_cursors.items())
+        for chatId, (comId, messageId, createdTime) in cursors:
+            try:
+                if comId:
+                    messages = self.community.iter_messages(
+                        chatId, size=25, limit=self.backfill_limit, comId=comId
+                    )
+                elif isinstance(self, global_client.Global):
+                    messages = self.iter_messages(
+                        chatId, size=25, limit=self.backfill_limit
+                    )
+                else:
+                    continue
+                missed: list[dict[str, Any]] = []
+                for message in messages:
+                    if message.messageId == messageId or message.createdTime < createdTime:
+                        break
+                    missed.append(message.json())
+            except Exception as exc:
+                logger.debug(f"Failed to backfill {chatId}: {exc}")
+                continue
+            logger.debug(f"Backfilling {len(missed)} messages in {chatId}.")
+            for chat_message in reversed(missed):
+                self.dispatcher.handle(
+                    {
+                        "t": entities.WsMessageTypes.CHAT_MESSAGE_DTO,
+                        "o": {"ndcId": comId, "chatMessage": chat_message},
+                    }
+                )
+
     def _handle_notification(self, message: dict[str, Any]) -> None:
         """Handles notifications."""
+        payload: dict[str, Any] = message.get("o") or {}
+        notification_payload: dict[str, Any] = payload.get("payload") or {}
+        notificationId: Optional[str] = notification_payload.get("id")
+        if notificationId and not self.seen.add(("notification", notificationId)):
+            return None
         notification = entities.Notification(message)
         key = entities.NOTIF_TYPES.get(notification.notification_type)
         if key:
@@ -220,16 +431,49 @@ class WSClient(context.EventHandler):
     def _handle_user_online(self, message: dict[str, Any]) -> None:
         self._handle_event("user_online", entities.OnlineMembers(message))
 
+    def _handle_ping_response(self, message: dict[str, Any]) -> None:
+        """Records the round trip of the last ping."""
+        payload: dict[str, Any] = message.get("o") or {}
+        latency = self.connection.pong(payload.get("id"))
+        if latency is None:
+            return None
+        logger.debug(f"Websocket ping took {latency:.3f}s.")
+        endpoint, ws = self._endpoint, self.ws
+        if endpoint and ws and self.endpoints.measured(endpoint, latency):
+            logger.debug(f"Websocket endpoint {endpoint} degraded, switching endpoints.")
+            ws.abort()
+
     def send_websocket_message(
         self,
         message: Union[dict[str, Any], bytes, str],
     ) -> None:
-        """Sends a websocket message."""
+        """
+        Queues a websocket message on the writer thread.
+
+        Messages are dropped while the websocket is disconnected or reconnecting,
+        since typing indicators and pings are meaningless once the socket that they
+        were meant for is gone. Drops are counted in `stats()["websocket"]["dropped"]`.
+        """
         if not self.ws:
             return None
-        if not isinstance(message, (bytes, str)):
-            message = ujson.dumps(message)
-        self.ws.send(ujson.dumps(message))
+        self.websocket_writer.send(message)
+
+    def _write_websocket_message(self, data: Union[bytes, str]) -> bool:
+        """Sends an encoded websocket message. Called from the writer thread only."""
+        ws = self.ws
+        if not ws or not ws.connected:
+            logger.debug("Dropped a websocket message, the websocket is not connected.")
+            return False
+        ws.send(data)
+        return True
+
+    def stats(self, top: int = 20) -> dict[str, Any]:
+        """Returns the report of `EventHandler.stats` with the `websocket` writer, `connection` and `endpoints` metrics."""
+        report = super().stats(top)
+        report["websocket"] = self.websocket_writer.stats()
+        report["connection"] = self.connection.stats()
+        report["endpoints"] = self.endpoints.stats()
+        return report
 
     def stop_websocket(self) -> None:
         """Stops the websocket."""
@@ -243,11 +487,13 @@ class WSClient(context.EventHandler):
         return time.time() - last_activity_time >= 300
 
     def _send_ping(self) -> None:
+        ident = random.randint(1, 100)
+        self.connection.ping_sent(ident)
         self.send_websocket_message(
             {
                 "o": {
                     "threadChannelUserInfoList": [],
-                    "id": random.randint(1, 100),
+                    "id": ident,
                 },
                 "t": entities.WsMessageTypes.CHANNEL_USER_PING_REQUEST,
             }
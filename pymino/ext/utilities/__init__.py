@@ -1,9 +1,31 @@
+from pymino.ext.utilities.broadcast import *
+from pymino.ext.utilities.bulk import *
+from pymino.ext.utilities.cancellation import *
 from pymino.ext.utilities.chat_console import *
 from pymino.ext.utilities.commands import *
 from pymino.ext.utilities.community_console import *
+from pymino.ext.utilities.connection import *
+from pymino.ext.utilities.cooldowns import *
+from pymino.ext.utilities.endpoints import *
+from pymino.ext.utilities.event_loop import *
+from pymino.ext.utilities.exporter import *
+from pymino.ext.utilities.filters import *
 from pymino.ext.utilities.generate import *
+from pymino.ext.utilities.lanes import *
+from pymino.ext.utilities.listeners import *
 from pymino.ext.utilities.logs import *
+from pymino.ext.utilities.media_cache import *
 from pymino.ext.utilities.menu import *
+from pymino.ext.utilities.moderation import *
+from pymino.ext.utilities.outbound import *
+from pymino.ext.utilities.paginator import *
 from pymino.ext.utilities.profile_console import *
+from pymino.ext.utilities.ratelimit import *
 from pymino.ext.utilities.request_handler import *
+from pymino.ext.utilities.seen import *
+from pymino.ext.utilities.session import *
+from pymino.ext.utilities.stats import *
+from pymino.ext.utilities.triggers import *
+from pymino.ext.utilities.websocket_writer import *
+from pymino.ext.utilities.workers import *
 from pymino.ext.utilities.wrappers import *
@@ -0,0 +1,148 @@
+import logging
+import threading
+import time
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Optional
+
+from pymino.ext import utilities
+
+__all__ = ("BroadcastReport", "BroadcastResult", "broadcast")
+
+logger = logging.getLogger("pymino")
+
+
+class BroadcastResult:
+    """
+    `BroadcastResult` - The outcome of sending a broadcast to one chat.
+
+    `**Attributes**`
+    - `chatId` - The ID of the chat.
+    - `response` - The value returned by the send, or `None` if it failed.
+    - `error` - The exception raised by the last attempt, or `None` if it succeeded.
+    - `attempts` - The number of times the send was attempted.
+
+    """
+
+    __slots__ = ("chatId", "response", "error", "attempts")
+
+    def __init__(self, chatId: str) -> None:
+        self.chatId = chatId
+        self.response: Any = None
+        self.error: Optional[Exception] = None
+        self.attempts = 0
+
+    def __repr__(self) -> str:
+        status = "ok" if self.ok else type(self.error).__name__
+        return f"BroadcastResult({self.chatId!r}, {status})"
+
+    @property
+    def ok(self) -> bool:
+        """Whether or not the message was sent."""
+        return self.error is None and self.attempts > 0
+
+
+class BroadcastReport:
+    """
+    `BroadcastReport` - The outcome of a broadcast, in the order of the chats.
+
+    `**Attributes**`
+    - `results` - The `BroadcastResult` of every chat.
+    - `duration` - The time in seconds the broadcast took.
+
+    """
+
+    __slots__ = ("results", "duration")
+
+    def __init__(self, results: list[BroadcastResult], duration: float) -> None:
+        self.results = results
+        self.duration = duration
+
+    def __iter__(self) -> Iterator[BroadcastResult]:
+        return iter(self.results)
+
+    def __len__(self) -> int:
+        return len(self.results)
+
+    def __repr__(self) -> str:
+        return (
+            f"BroadcastReport(sent={len(self.succeeded)}, "
+            f"failed={len(self.failed)}, duration={self.duration:.2f})"
+        )
+
+    @property
+    def succeeded(self) -> list[BroadcastResult]:
+        """The chats the message was sent to."""
+        return [result for result in self.results if result.ok]
+
+    @property
+    def failed(self) -> list[BroadcastResult]:
+        """The chats the message could not be sent to."""
+        return [result for result in self.results if not result.ok]
+
+    def json(self) -> dict[str, Any]:
+        return {
+            "duration": self.duration,
+            "sent": len(self.succeeded),
+            "failed": {result.chatId: repr(result.error) for result in self.failed},
+        }
+
+
+def broadcast(
+    send: Callable[[str], Any],
+    chatIds: Sequence[str],
+    parallelism: int = 8,
+    retries: int = 2,
+    backoff: float = 1.0,
+    rate_limiter: Optional["utilities.RateLimiter"] = None,
+    progress: Optional[Callable[[int, int, BroadcastResult], Any]] = None,
+) -> BroadcastReport:
+    """
+    Calls `send` for every chat concurrently.
+
+    `**Parameters**`
+    - `send` - Sends the message to a chat ID.
+    - `chatIds` - The chats to send to. Duplicates are sent once.
+    - `parallelism` - The maximum number of sends in flight. `Defaults` to `8`.
+    - `retries` - The number of times a transient failure is retried. `Defaults` to `2`.
+    - `backoff` - The delay in seconds before the first retry, doubled on every retry. `Defaults` to `1`.
+    - `rate_limiter` - Acquired before every send. `Defaults` to `None`.
+    - `progress` - Called with the number of finished chats, the total and the result of the chat that just finished. `Defaults` to `None`.
+
+    `**Returns**`
+    - `BroadcastReport` - The outcome of every chat.
+
+    """
+    started = time.monotonic()
+    results = [BroadcastResult(chatId) for chatId in dict.fromkeys(chatIds)]
+    lock = threading.Lock()
+    finished = 0
+
+    def execute(result: BroadcastResult) -> None:
+        nonlocal finished
+        for attempt in range(retries + 1):
+            if rate_limiter is not None:
+                rate_limiter.acquire()
+            result.attempts += 1
+            try:
+                result.response = send(result.chatId)
+                result.error = None
+                break
+            except utilities.TRANSIENT_ERRORS as exc:
+                result.error = exc
+                if attempt < retries:
+                    time.sleep(backoff * 2**attempt)
+            except Exception as exc:
+                result.error = exc
+                break
+        with lock:
+            finished += 1
+            if progress is not None:
+                try:
+                    progress(finished, len(results), result)
+                except Exception as exc:
+                    logger.error(f"Error in broadcast progress callback: {exc}", exc_info=exc)
+
+    with ThreadPoolExecutor(max_workers=max(parallelism, 1)) as executor:
+        list(executor.map(execute, results))
+    return BroadcastReport(results, time.monotonic() - started)
@@ -0,0 +1,79 @@
+from collections import deque
+from collections.abc import Callable, Hashable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional, TypeVar
+
+from pymino.ext import utilities
+
+__all__ = ("bulk_fetch",)
+
+T = TypeVar("T")
+
+
+def bulk_fetch(
+    fetch: Callable[[int, int], Iterable[T]],
+    start: int = 0,
+    size: int = 25,
+    parallelism: int = 4,
+    limit: Optional[int] = None,
+    key: Optional[Callable[[T], Hashable]] = None,
+    rate_limiter: Optional["utilities.RateLimiter"] = None,
+) -> Iterator[T]:
+    """
+    Fetches an offset paginated listing with several windows in flight.
+
+    `**Parameters**`
+    - `fetch` - Fetches `size` items from an offset.
+    - `start` - The offset to start from. `Defaults` to `0`.
+    - `size` - The number of items per window. `Defaults` to `25`.
+    - `parallelism` - The maximum number of windows fetched at once. `Defaults` to `4`.
+    - `limit` - The maximum number of items to yield. `Defaults` to `None` (no limit).
+    - `key` - Returns the identity of an item, used to drop items repeated across windows. `Defaults` to `None` (no dedup).
+    - `rate_limiter` - Acquired before every window is requested. `Defaults` to `None`.
+
+    `**Returns**`
+    - `Iterator` - The items in listing order.
+
+    The listing ends at the first window shorter than `size`; windows already
+    requested past the end are discarded.
+
+    """
+
+    def window(offset: int) -> list[T]:
+        if rate_limiter is not None:
+            rate_limiter.acquire()
+        return list(fetch(offset, size))
+
+    seen: set[Hashable] = set()
+    count = 0
+    offset = start
+    pending: deque[Future[list[T]]] = deque()
+    executor = ThreadPoolExecutor(max_workers=max(parallelism, 1))
+    try:
+        ended = False
+        while True:
+            while not ended and len(pending) < max(parallelism, 1):
+                if limit is not None and key is None and offset - start >= limit:
+                    break
+                pending.append(executor.submit(window, offset))
+                offset += size
+            if not pending:
+                return None
+            items = pending.popleft().result()
+            if len(items) < size:
+                ended = True
+                for future in pending:
+                    future.cancel()
+                pending.clear()
+            for item in items:
+                if key is not None:
+                    identity = key(item)
+                    if identity in seen:
+                        continue
+                    seen.add(identity)
+                yield item
+                count += 1
+                if limit is not None and count >= limit:
+                    return None
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
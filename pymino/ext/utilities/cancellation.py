@@ -0,0 +1,212 @@
+import collections
+import heapq
+import itertools
+import threading
+import time
+from collections.abc import Callable
+from typing import Any, Optional
+
+from pymino.ext import entities
+
+__all__ = ("CancellationToken", "TimeoutRecord", "TimeoutWatchdog")
+
+
+class CancellationToken:
+    """
+    `CancellationToken` - Lets a running command know it should stop.
+
+    Long running commands check `cancelled`, call `raise_if_cancelled()` between
+    steps, or sleep with `wait()` so they wake up as soon as they are cancelled.
+
+    `**Example**`
+    ```py
+    @bot.command("scan", timeout=30)
+    def scan(ctx: Context):
+        for message in bot.community.iter_messages(ctx.chatId):
+            ctx.token.raise_if_cancelled()
+            ...
+    ```
+
+    """
+
+    __slots__ = ("_event", "_callbacks", "reason")
+
+    def __init__(self) -> None:
+        self._event = threading.Event()
+        self._callbacks: list[Callable[[], Any]] = []
+        self.reason: Optional[str] = None
+
+    def __repr__(self) -> str:
+        return f"<CancellationToken cancelled={self.cancelled} reason={self.reason!r}>"
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether or not the command was cancelled."""
+        return self._event.is_set()
+
+    def cancel(self, reason: str = "cancelled") -> None:
+        """Cancels the command and runs the callbacks added with `add_callback`."""
+        if self._event.is_set():
+            return
+        self.reason = reason
+        self._event.set()
+        for callback in self._callbacks:
+            callback()
+
+    def add_callback(self, callback: Callable[[], Any]) -> None:
+        """Calls `callback` when the token is cancelled, or right away if it already is."""
+        if self._event.is_set():
+            callback()
+        else:
+            self._callbacks.append(callback)
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Sleeps until the command is cancelled or `timeout` passes.
+
+        `**Returns**`
+        - `bool` - `True` if the command was cancelled.
+
+        """
+        return self._event.wait(timeout)
+
+    def raise_if_cancelled(self) -> None:
+        """Raises `CommandCancelled` if the command was cancelled."""
+        if self._event.is_set():
+            raise entities.CommandCancelled(self.reason or "cancelled")
+
+
+class TimeoutRecord:
+    """
+    `TimeoutRecord` - A command invocation that exceeded its timeout.
+
+    `**Attributes**`
+    - `name` - The name of the command.
+    - `timeout` - The timeout of the command in seconds.
+    - `started` - The time the command started at.
+    - `chatId` - The chat the command was used in.
+    - `userId` - The user who used the command.
+    - `thread` - The thread running the command, `None` for coroutines.
+    - `finished` - Whether or not the command has returned since.
+    - `elapsed` - The total run time, once the command returned.
+
+    """
+
+    __slots__ = (
+        "name",
+        "timeout",
+        "started",
+        "chatId",
+        "userId",
+        "thread",
+        "finished",
+        "elapsed",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        timeout: float,
+        chatId: Optional[str] = None,
+        userId: Optional[str] = None,
+    ) -> None:
+        self.name = name
+        self.timeout = timeout
+        self.started = time.time()
+        self.chatId = chatId
+        self.userId = userId
+        self.thread: Optional[int] = threading.get_ident()
+        self.finished = False
+        self.elapsed: Optional[float] = None
+
+    def __repr__(self) -> str:
+        return f"<TimeoutRecord name={self.name!r} timeout={self.timeout} finished={self.finished}>"
+
+    def json(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "timeout": self.timeout,
+            "started": self.started,
+            "chatId": self.chatId,
+            "userId": self.userId,
+            "finished": self.finished,
+            "elapsed": self.elapsed,
+        }
+
+
+class TimeoutWatchdog:
+    """
+    `TimeoutWatchdog` - Cancels the tokens of commands that run past their timeout.
+
+    `**Parameters**`
+    - `on_timeout` - Called with the `TimeoutRecord` of every command that times out. `Defaults` to `None`.
+    - `history` - The number of timed out invocations kept in `report()`. `Defaults` to `100`.
+
+    A single daemon thread sleeps until the nearest deadline, so watching a
+    command costs one heap push and nothing while it runs within its timeout.
+
+    """
+
+    def __init__(
+        self,
+        on_timeout: Optional[Callable[[TimeoutRecord], Any]] = None,
+        history: int = 100,
+    ) -> None:
+        self.on_timeout = on_timeout
+        self.timed_out: collections.deque[TimeoutRecord] = collections.deque(
+            maxlen=history
+        )
+        self._deadlines: list[
+            tuple[float, int, CancellationToken, TimeoutRecord]
+        ] = []
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+
+    def watch(self, token: CancellationToken, record: TimeoutRecord) -> None:
+        """
+        Cancels `token` if it is still running after `record.timeout` seconds.
+
+        `**Parameters**`
+        - `token` - The token of the command.
+        - `record` - The invocation being watched.
+
+        """
+        deadline = time.monotonic() + record.timeout
+        with self._condition:
+            heapq.heappush(
+                self._deadlines, (deadline, next(self._sequence), token, record)
+            )
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="pymino-timeouts", daemon=True
+                )
+                self._thread.start()
+            self._condition.notify()
+
+    def finish(self, record: TimeoutRecord, elapsed: float) -> None:
+        """Marks a watched invocation as returned."""
+        record.finished = True
+        record.elapsed = elapsed
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._deadlines:
+                    self._condition.wait()
+                deadline, _, token, record = self._deadlines[0]
+                remaining = deadline - time.monotonic()
+                if remaining > 0:
+                    self._condition.wait(remaining)
+                    continue
+                heapq.heappop(self._deadlines)
+            if record.finished:
+                continue
+            token.cancel("timeout")
+            self.timed_out.append(record)
+            if self.on_timeout is not None:
+                self.on_timeout(record)
+
+    def report(self) -> list[dict[str, Any]]:
+        """Returns the most recent timed out invocations, oldest first."""
+        return [record.json() for record in list(self.timed_out)]
@@ -1,11 +1,14 @@
 import time
 from collections.abc import Callable, Sequence
-from typing import Any, Optional
+from typing import Any, Literal, Optional
 
-__all__ = ("CommandCallback", "Command", "Commands")
+from pymino.ext import utilities
+
+__all__ = ("CommandCallback", "Command", "Commands", "CooldownScope")
 
 
 CommandCallback = Callable[..., Any]
+CooldownScope = Literal["user", "chat", "community"]
 
 
 class Command:
@@ -19,6 +22,9 @@ class Command:
     - `usage` - The usage of the command. `Defaults` to `None`.
     - `aliases` - The aliases of the command. `Defaults` to `None`.
     - `cooldown` - The cooldown of the command. `Defaults` to `0`.
+    - `rate` - The number of uses allowed per window, as `(uses, seconds)`. `Defaults` to `None`.
+    - `scope` - Whether limits apply per `user`, `chat` or `community`. `Defaults` to `user`.
+    - `timeout` - The number of seconds after which the command is cancelled. `Defaults` to `None`.
 
     """
 
@@ -30,19 +36,37 @@ class Command:
         usage: Optional[str] = None,
         aliases: Optional[Sequence[str]] = None,
         cooldown: float = 0.0,
+        rate: Optional[tuple[int, float]] = None,
+        scope: CooldownScope = "user",
+        timeout: Optional[float] = None,
     ) -> None:
+        if scope not in ("user", "chat", "community"):
+            raise ValueError(f"Unsupported cooldown scope: {scope}")
         self.func = func
         self.name = name
         self.description = description
         self.usage = usage
         self.aliases = list(aliases or [])
         self.cooldown = cooldown
+        self.rate = rate
+        self.scope: CooldownScope = scope
+        self.timeout = timeout
+
+    @property
+    def limits(self) -> list[tuple[int, float]]:
+        """The `(uses, seconds)` windows the command is limited by."""
+        limits: list[tuple[int, float]] = []
+        if self.cooldown:
+            limits.append((1, self.cooldown))
+        if self.rate:
+            limits.append(self.rate)
+        return limits
 
 
 class Commands:
     def __init__(self) -> None:
         self.commands: dict[str, Command] = {}
-        self.cooldowns: dict[str, dict[str, float]] = {}
+        self.cooldowns: utilities.CooldownStore = utilities.CooldownStore()
 
     def add_command(self, command: Command) -> Command:
         """
@@ -150,6 +174,35 @@ class Commands:
         """
         return {command.name: command.cooldown for command in self.commands.values()}
 
+    def _cooldown_key(self, command_name: str, scope: str, scopeId: str, index: int) -> str:
+        return f"{command_name}:{scope}:{scopeId}:{index}"
+
+    def check_cooldown(self, command: Command, scopeId: str) -> float:
+        """
+        Uses a command if it is within its cooldown and rate limit.
+
+        `**Parameters**`
+        - `command` - The command being used.
+        - `scopeId` - The user, chat or community ID, depending on `command.scope`.
+
+        `**Returns**`
+        - `float` - `0` if the command can run, otherwise the seconds until it can be used again.
+
+        """
+        keys = [
+            (self._cooldown_key(command.name, command.scope, scopeId, index), limit, window)
+            for index, (limit, window) in enumerate(command.limits)
+        ]
+        retry_after = max(
+            (self.cooldowns.peek(key, limit, window) for key, limit, window in keys),
+            default=0.0,
+        )
+        if retry_after:
+            return retry_after
+        for key, limit, window in keys:
+            retry_after = max(retry_after, self.cooldowns.hit(key, limit, window))
+        return retry_after
+
     def set_cooldown(self, command_name: str, cooldown: float, userId: str) -> None:
         """
         Sets the cooldown of a command for a user.
@@ -160,7 +213,9 @@ class Commands:
         - `userId` - The user to set the cooldown for.
 
         """
-        self.cooldowns[command_name][userId] = time.time() + cooldown
+        key = self._cooldown_key(command_name, "user", userId, 0)
+        self.cooldowns.reset(key)
+        self.cooldowns.hit(key, 1, cooldown)
 
     def fetch_cooldown(self, command_name: str, userId: str) -> float:
         """
@@ -171,11 +226,15 @@ class Commands:
         - `userId` - The user to fetch the cooldown for.
 
         `**Returns**`
-        - `float` - The cooldown that was fetched.
+        - `float` - The time the cooldown ends at, or `0` if there is none.
 
         """
-        self.cooldowns[command_name].setdefault(userId, 0.0)
-        return self.cooldowns[command_name][userId]
+        command = self.fetch_command(command_name)
+        if command is None or not command.cooldown:
+            return 0.0
+        key = self._cooldown_key(command.name, "user", userId, 0)
+        retry_after = self.cooldowns.peek(key, 1, command.cooldown)
+        return time.time() + retry_after if retry_after else 0.0
 
     def __help__(self) -> str:
         """
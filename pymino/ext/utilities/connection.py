@@ -0,0 +1,248 @@
+import collections
+import random
+import threading
+import time
+from typing import Any, Optional
+
+__all__ = ("Backoff", "ConnectionMonitor")
+
+
+class Backoff:
+    """
+    `Backoff` - Exponential delays with jitter between reconnect attempts.
+
+    `**Parameters**`
+    - `initial` - The delay after the first failure in seconds. `Defaults` to `1.0`.
+    - `maximum` - The longest delay in seconds. `Defaults` to `60.0`.
+    - `multiplier` - The factor the delay grows by after every failure. `Defaults` to `2.0`.
+    - `jitter` - The share of each delay that is randomized. `Defaults` to `0.5`.
+
+    The jitter keeps many bots that lost their connection at the same time from
+    reconnecting in lockstep.
+
+    """
+
+    __slots__ = ("initial", "maximum", "multiplier", "jitter", "attempts")
+
+    def __init__(
+        self,
+        initial: float = 1.0,
+        maximum: float = 60.0,
+        multiplier: float = 2.0,
+        jitter: float = 0.5,
+    ) -> None:
+        self.initial = initial
+        self.maximum = maximum
+        self.multiplier = multiplier
+        self.jitter = jitter
+        self.attempts = 0
+
+    def next(self) -> float:
+        """Returns the delay before the next attempt and counts the attempt."""
+        delay = min(self.maximum, self.initial * self.multiplier**self.attempts)
+        self.attempts += 1
+        return random.uniform(delay * (1 - self.jitter), delay)
+
+    def reset(self) -> None:
+        """Starts over from `initial` after a successful attempt."""
+        self.attempts = 0
+
+
+class ConnectionMonitor:
+    """
+    `ConnectionMonitor` - The state, readiness and metrics of a reconnecting connection.
+
+    `**Parameters**`
+    - `backoff` - The delays between failed attempts. `Defaults` to `Backoff()`.
+    - `handshake_timeout` - The number of seconds a handshake may take. `Defaults` to `10.0`.
+    - `stable_after` - The number of seconds a connection must stay up before the backoff starts over. `Defaults` to `30.0`.
+    - `window` - The number of recent handshake and ping latencies kept. `Defaults` to `64`.
+
+    The connection moves from `disconnected` to `connecting`, then either to
+    `connected` or to `backoff` until the next attempt. `ready` is set only
+    while the connection is up, so callers can wait for it instead of polling.
+    A connection dropped before `stable_after` counts as a failure, so a server
+    that accepts and then closes the socket is not hammered with reconnects.
+
+    `**Example**`
+    ```py
+    bot.connection.backoff.maximum = 30
+    if not bot.connection.wait(timeout=10):
+        print(bot.connection.stats()["last_error"])
+    ```
+
+    """
+
+    DISCONNECTED = "disconnected"
+    CONNECTING = "connecting"
+    CONNECTED = "connected"
+    BACKOFF = "backoff"
+
+    __slots__ = (
+        "backoff",
+        "handshake_timeout",
+        "stable_after",
+        "state",
+        "ready",
+        "connects",
+        "disconnects",
+        "failures",
+        "last_error",
+        "connected_since",
+        "_attempt_started",
+        "_handshakes",
+        "_pings",
+        "_ping",
+        "_lock",
+    )
+
+    def __init__(
+        self,
+        backoff: Optional[Backoff] = None,
+        handshake_timeout: float = 10.0,
+        stable_after: float = 30.0,
+        window: int = 64,
+    ) -> None:
+        self.backoff = backoff or Backoff()
+        self.handshake_timeout = handshake_timeout
+        self.stable_after = stable_after
+        self.state = self.DISCONNECTED
+        self.ready = threading.Event()
+        self.connects = 0
+        self.disconnects = 0
+        self.failures = 0
+        self.last_error: Optional[str] = None
+        self.connected_since: Optional[float] = None
+        self._attempt_started = 0.0
+        self._handshakes: collections.deque[float] = collections.deque(maxlen=window)
+        self._pings: collections.deque[float] = collections.deque(maxlen=window)
+        self._ping: Optional[tuple[Any, float]] = None
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f"<ConnectionMonitor state={self.state!r} connects={self.connects} failures={self.failures}>"
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Waits until the connection is up.
+
+        `**Parameters**`
+        - `timeout` - The maximum number of seconds to wait. `Defaults` to `None` (forever).
+
+        `**Returns**`
+        - `bool` - `True` if the connection is up.
+
+        """
+        return self.ready.wait(timeout)
+
+    def connecting(self) -> None:
+        """Marks the start of a connection attempt."""
+        with self._lock:
+            self.state = self.CONNECTING
+            self._attempt_started = time.monotonic()
+
+    def connected(self) -> float:
+        """
+        Marks the connection as up and wakes everyone waiting for it.
+
+        `**Returns**`
+        - `float` - The duration of the handshake in seconds.
+
+        """
+        with self._lock:
+            handshake = time.monotonic() - self._attempt_started
+            self._handshakes.append(handshake)
+            self.state = self.CONNECTED
+            self.connects += 1
+            self.connected_since = time.time()
+        self.ready.set()
+        return handshake
+
+    def failed(self, error: Exception) -> float:
+        """
+        Records a failed attempt.
+
+        `**Parameters**`
+        - `error` - The reason the attempt failed.
+
+        `**Returns**`
+        - `float` - The number of seconds to wait before the next attempt.
+
+        """
+        with self._lock:
+            self.state = self.BACKOFF
+            self.failures += 1
+            self.last_error = repr(error)
+            return self.backoff.next()
+
+    def disconnected(self, error: Optional[Exception] = None) -> float:
+        """
+        Marks an established connection as lost.
+
+        `**Parameters**`
+        - `error` - The reason the connection was lost. `Defaults` to `None`.
+
+        `**Returns**`
+        - `float` - The number of seconds to wait before reconnecting.
+
+        """
+        self.ready.clear()
+        with self._lock:
+            if self.state == self.CONNECTED:
+                self.disconnects += 1
+            if self.connected_since and time.time() - self.connected_since >= self.stable_after:
+                self.backoff.reset()
+            self.state = self.DISCONNECTED
+            self.connected_since = None
+            self._ping = None
+            if error is not None:
+                self.last_error = repr(error)
+            return self.backoff.next()
+
+    def ping_sent(self, ident: Any) -> None:
+        """Records the time a ping with the id `ident` was sent."""
+        self._ping = (ident, time.monotonic())
+
+    def pong(self, ident: Any) -> Optional[float]:
+        """
+        Records the reply to the last ping.
+
+        `**Returns**`
+        - `Optional[float]` - The round trip in seconds, `None` if `ident` was not the last ping.
+
+        """
+        ping = self._ping
+        if ping is None or ping[0] != ident:
+            return None
+        self._ping = None
+        latency = time.monotonic() - ping[1]
+        self._pings.append(latency)
+        return latency
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Returns the connection metrics.
+
+        `**Returns**`
+        - `dict` - The `state`, `uptime`, `connects`, `disconnects`, `failures` and
+          `last_error`, and the last and mean `handshake` and `ping` latencies in seconds.
+
+        """
+        with self._lock:
+            handshakes, pings = list(self._handshakes), list(self._pings)
+            return {
+                "state": self.state,
+                "uptime": time.time() - self.connected_since if self.connected_since else 0.0,
+                "connects": self.connects,
+                "disconnects": self.disconnects,
+                "failures": self.failures,
+                "last_error": self.last_error,
+                "handshake": _latency(handshakes),
+                "ping": _latency(pings),
+            }
+
+
+def _latency(samples: list[float]) -> dict[str, Optional[float]]:
+    if not samples:
+        return {"last": None, "mean": None}
+    return {"last": samples[-1], "mean": sum(samples) / len(samples)}
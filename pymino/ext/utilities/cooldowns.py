@@ -0,0 +1,208 @@
+import collections
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+__all__ = ("CooldownStore", "SQLiteCooldownStore")
+
+
+class CooldownStore:
+    """
+    `CooldownStore` - Sliding-window rate limits kept in memory.
+
+    `**Parameters**`
+    - `maxsize` - The maximum number of keys tracked at once. `Defaults` to `65536`.
+
+    Every key holds the timestamps of its uses inside its window. A key whose
+    window has passed is evicted, so the store only grows with the number of
+    keys that are currently limited. A fixed cooldown is a window with a limit of one.
+
+    `**Example**`
+    ```py
+    store = CooldownStore()
+    retry_after = store.hit("ping:user:0000-0000-0000-0000", limit=5, window=60)
+    if retry_after:
+        print(f"Try again in {retry_after:.0f} seconds.")
+    ```
+
+    """
+
+    def __init__(self, maxsize: int = 65536) -> None:
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._hits: collections.OrderedDict[
+            str, tuple[float, collections.deque[float]]
+        ] = collections.OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._hits)
+
+    def _evict(self, now: float) -> None:
+        while self._hits:
+            key, (window, hits) = next(iter(self._hits.items()))
+            if len(self._hits) <= self.maxsize and hits and hits[-1] + window > now:
+                break
+            del self._hits[key]
+
+    def _retry_after(
+        self, hits: collections.deque[float], limit: int, window: float, now: float
+    ) -> float:
+        while hits and hits[0] + window <= now:
+            hits.popleft()
+        if len(hits) < limit:
+            return 0.0
+        return hits[len(hits) - limit] + window - now
+
+    def peek(self, key: str, limit: int, window: float) -> float:
+        """
+        Checks a key without using it.
+
+        `**Parameters**`
+        - `key` - The key to check.
+        - `limit` - The number of uses allowed per window.
+        - `window` - The length of the window in seconds.
+
+        `**Returns**`
+        - `float` - The seconds until the key can be used again, `0` if it can be used now.
+
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._hits.get(key)
+            if entry is None:
+                return 0.0
+            return self._retry_after(entry[1], limit, window, now)
+
+    def hit(self, key: str, limit: int, window: float) -> float:
+        """
+        Uses a key if it is within its limit.
+
+        `**Parameters**`
+        - `key` - The key to use.
+        - `limit` - The number of uses allowed per window.
+        - `window` - The length of the window in seconds.
+
+        `**Returns**`
+        - `float` - `0` if the use was recorded, otherwise the seconds until the key can be used again.
+
+        """
+        now = time.time()
+        with self._lock:
+            self._evict(now)
+            entry = self._hits.get(key)
+            hits: collections.deque[float] = (
+                entry[1] if entry is not None else collections.deque()
+            )
+            retry_after = self._retry_after(hits, limit, window, now)
+            if retry_after:
+                return retry_after
+            hits.append(now)
+            self._hits[key] = (window, hits)
+            self._hits.move_to_end(key)
+            return 0.0
+
+    def reset(self, key: Optional[str] = None) -> None:
+        """
+        Forgets the uses of a key.
+
+        `**Parameters**`
+        - `key` - The key to reset. `Defaults` to `None` (every key).
+
+        """
+        with self._lock:
+            if key is None:
+                self._hits.clear()
+            else:
+                self._hits.pop(key, None)
+
+
+class SQLiteCooldownStore(CooldownStore):
+    """
+    `SQLiteCooldownStore` - Sliding-window rate limits shared through a SQLite file.
+
+    `**Parameters**`
+    - `path` - The SQLite database file.
+    - `cleanup_interval` - The number of uses between removals of expired rows. `Defaults` to `500`.
+
+    Several bot processes pointing at the same file share their limits. Every
+    check runs in an immediate transaction, so concurrent processes cannot both
+    take the last use of a window.
+
+    """
+
+    def __init__(self, path: str, cleanup_interval: int = 500) -> None:
+        super().__init__()
+        self.path = path
+        self.cleanup_interval = cleanup_interval
+        self._uses = 0
+        self._db = sqlite3.connect(
+            path, timeout=30, isolation_level=None, check_same_thread=False
+        )
+        self._db.executescript(
+            """
+            PRAGMA journal_mode=WAL;
+            CREATE TABLE IF NOT EXISTS cooldowns (
+                key TEXT NOT NULL,
+                usedTime REAL NOT NULL,
+                expiresTime REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS cooldowns_key ON cooldowns (key, usedTime);
+            CREATE INDEX IF NOT EXISTS cooldowns_expires ON cooldowns (expiresTime);
+            """
+        )
+
+    def __len__(self) -> int:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT COUNT(DISTINCT key) FROM cooldowns WHERE expiresTime > ?",
+                (time.time(),),
+            ).fetchone()
+        return row[0]
+
+    def _query_retry_after(self, key: str, limit: int, window: float, now: float) -> float:
+        row = self._db.execute(
+            "SELECT usedTime FROM cooldowns WHERE key = ? AND usedTime > ? "
+            "ORDER BY usedTime DESC LIMIT 1 OFFSET ?",
+            (key, now - window, limit - 1),
+        ).fetchone()
+        return row[0] + window - now if row else 0.0
+
+    def peek(self, key: str, limit: int, window: float) -> float:
+        now = time.time()
+        with self._lock:
+            return self._query_retry_after(key, limit, window, now)
+
+    def hit(self, key: str, limit: int, window: float) -> float:
+        now = time.time()
+        with self._lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                retry_after = self._query_retry_after(key, limit, window, now)
+                if not retry_after:
+                    self._db.execute(
+                        "INSERT INTO cooldowns (key, usedTime, expiresTime) VALUES (?, ?, ?)",
+                        (key, now, now + window),
+                    )
+                self._uses += 1
+                if self._uses % self.cleanup_interval == 0:
+                    self._db.execute(
+                        "DELETE FROM cooldowns WHERE expiresTime <= ?", (now,)
+                    )
+                self._db.execute("COMMIT")
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+        return retry_after
+
+    def reset(self, key: Optional[str] = None) -> None:
+        with self._lock:
+            if key is None:
+                self._db.execute("DELETE FROM cooldowns")
+            else:
+                self._db.execute("DELETE FROM cooldowns WHERE key = ?", (key,))
+
+    def close(self) -> None:
+        """Closes the database."""
+        with self._lock:
+            self._db.close()
@@ -0,0 +1,216 @@
+import random
+import threading
+import time
+from collections.abc import Iterable
+from typing import Any, Optional
+
+__all__ = ("DEFAULT_ENDPOINTS", "Endpoint", "EndpointPool")
+
+DEFAULT_ENDPOINTS: tuple[str, ...] = (
+    "wss://ws1.aminoapps.com/",
+    "wss://ws2.aminoapps.com/",
+    "wss://ws3.aminoapps.com/",
+    "wss://ws4.aminoapps.com/",
+)
+"""The websocket endpoints of Amino."""
+
+
+class Endpoint:
+    """
+    `Endpoint` - The measured health of one websocket endpoint.
+
+    `**Attributes**`
+    - `url` - The url of the endpoint.
+    - `handshake` - The moving average of its handshake times in seconds, `None` until measured.
+    - `ping` - The moving average of its ping round trips in seconds, `None` until measured.
+    - `baseline` - The lowest `ping` average seen, `None` until measured.
+    - `successes` - The number of successful handshakes.
+    - `failures` - The number of failed handshakes and dropped connections.
+    - `streak` - The number of failures since the last success.
+    - `down_until` - The monotonic time before which the endpoint is skipped.
+    - `last_error` - The last failure.
+
+    """
+
+    __slots__ = (
+        "url",
+        "handshake",
+        "ping",
+        "baseline",
+        "successes",
+        "failures",
+        "streak",
+        "down_until",
+        "last_error",
+    )
+
+    def __init__(self, url: str) -> None:
+        self.url = url
+        self.handshake: Optional[float] = None
+        self.ping: Optional[float] = None
+        self.baseline: Optional[float] = None
+        self.successes = 0
+        self.failures = 0
+        self.streak = 0
+        self.down_until = 0.0
+        self.last_error: Optional[str] = None
+
+    def __repr__(self) -> str:
+        return f"<Endpoint url={self.url!r} handshake={self.handshake} ping={self.ping} streak={self.streak}>"
+
+    @property
+    def healthy(self) -> bool:
+        """Whether or not the endpoint is outside its failure cooldown."""
+        return self.down_until <= time.monotonic()
+
+    def json(self) -> dict[str, Any]:
+        return {
+            "url": self.url,
+            "handshake": self.handshake,
+            "ping": self.ping,
+            "successes": self.successes,
+            "failures": self.failures,
+            "healthy": self.healthy,
+            "last_error": self.last_error,
+        }
+
+
+class EndpointPool:
+    """
+    `EndpointPool` - Picks the fastest healthy websocket endpoint.
+
+    `**Parameters**`
+    - `urls` - The endpoints to choose from. `Defaults` to `DEFAULT_ENDPOINTS`.
+    - `cooldown` - The number of seconds a failing endpoint is skipped, doubled per failure in a row. `Defaults` to `30`.
+    - `explore` - The chance of trying another healthy endpoint to refresh its measurements. `Defaults` to `0.05`.
+    - `smoothing` - The weight of a new measurement in the moving average. `Defaults` to `0.3`.
+    - `degraded_factor` - How many times slower than its reference an endpoint's ping must be to be left. `Defaults` to `3`.
+    - `degraded_floor` - The ping in seconds below which an endpoint is never considered degraded. `Defaults` to `0.25`.
+
+    Endpoints that were never measured are tried first, then the one with the
+    lowest average ping is preferred, or the lowest average handshake while
+    some endpoints have no ping yet. An endpoint that fails is skipped for its
+    cooldown, so a reconnect goes straight to another one.
+
+    Handshakes and pings are averaged apart and only compared with their own
+    kind. The ping of the endpoint in use is compared with the best ping of the
+    healthy alternatives, or with its own `baseline` while none has a ping.
+
+    `**Example**`
+    ```py
+    bot.endpoints = EndpointPool(["ws://127.0.0.1:8765/"])
+    print(bot.stats()["endpoints"])
+    ```
+
+    """
+
+    __slots__ = (
+        "cooldown",
+        "explore",
+        "smoothing",
+        "degraded_factor",
+        "degraded_floor",
+        "endpoints",
+        "_lock",
+    )
+
+    def __init__(
+        self,
+        urls: Optional[Iterable[str]] = None,
+        cooldown: float = 30.0,
+        explore: float = 0.05,
+        smoothing: float = 0.3,
+        degraded_factor: float = 3.0,
+        degraded_floor: float = 0.25,
+    ) -> None:
+        self.cooldown = cooldown
+        self.explore = explore
+        self.smoothing = smoothing
+        self.degraded_factor = degraded_factor
+        self.degraded_floor = degraded_floor
+        self.endpoints: dict[str, Endpoint] = {
+            url: Endpoint(url) for url in (urls or DEFAULT_ENDPOINTS)
+        }
+        if not self.endpoints:
+            raise ValueError("At least one endpoint is required.")
+        self._lock = threading.Lock()
+
+    def select(self) -> str:
+        """
+        Picks the endpoint for the next connection.
+
+        `**Returns**`
+        - `str` - The url of the endpoint.
+
+        """
+        with self._lock:
+            endpoints = list(self.endpoints.values())
+            healthy = [endpoint for endpoint in endpoints if endpoint.healthy]
+            if not healthy:
+                return min(endpoints, key=lambda endpoint: endpoint.down_until).url
+            unmeasured = [endpoint for endpoint in healthy if endpoint.handshake is None]
+            if unmeasured:
+                return random.choice(unmeasured).url
+            if len(healthy) > 1 and random.random() < self.explore:
+                return random.choice(healthy).url
+            if all(endpoint.ping is not None for endpoint in healthy):
+                return min(healthy, key=lambda endpoint: endpoint.ping or 0.0).url
+            return min(healthy, key=lambda endpoint: endpoint.handshake or 0.0).url
+
+    def _average(self, average: Optional[float], seconds: float) -> float:
+        if average is None:
+            return seconds
+        return average + self.smoothing * (seconds - average)
+
+    def succeeded(self, url: str, handshake: float) -> None:
+        """Records a successful handshake that took `handshake` seconds."""
+        with self._lock:
+            endpoint = self.endpoints.get(url)
+            if endpoint is None:
+                return
+            endpoint.successes += 1
+            endpoint.streak = 0
+            endpoint.down_until = 0.0
+            endpoint.handshake = self._average(endpoint.handshake, handshake)
+
+    def failed(self, url: str, error: Exception) -> None:
+        """Records a failed handshake or a dropped connection and puts the endpoint on cooldown."""
+        with self._lock:
+            endpoint = self.endpoints.get(url)
+            if endpoint is None:
+                return
+            endpoint.failures += 1
+            endpoint.streak += 1
+            endpoint.last_error = repr(error)
+            delay = self.cooldown * 2 ** min(endpoint.streak - 1, 5)
+            endpoint.down_until = time.monotonic() + delay
+
+    def measured(self, url: str, latency: float) -> bool:
+        """
+        Records a ping round trip of the endpoint in use.
+
+        `**Returns**`
+        - `bool` - `True` if the endpoint has degraded and another one should be used.
+
+        """
+        with self._lock:
+            endpoint = self.endpoints.get(url)
+            if endpoint is None:
+                return False
+            ping = endpoint.ping = self._average(endpoint.ping, latency)
+            alternatives = [
+                other.ping
+                for other in self.endpoints.values()
+                if other is not endpoint and other.healthy and other.ping is not None
+            ]
+            reference = min(alternatives) if alternatives else endpoint.baseline
+            if endpoint.baseline is None or ping < endpoint.baseline:
+                endpoint.baseline = ping
+            if reference is None or ping < self.degraded_floor:
+                return False
+            return ping > self.degraded_factor * reference
+
+    def stats(self) -> list[dict[str, Any]]:
+        """Returns the handshake and ping averages, successes, failures and health of every endpoint."""
+        with self._lock:
+            return [endpoint.json() for endpoint in self.endpoints.values()]
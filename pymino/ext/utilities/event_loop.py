@@ -0,0 +1,91 @@
+import asyncio
+import concurrent.futures
+import threading
+from collections.abc import Awaitable, Coroutine
+from typing import Any, Optional, TypeVar
+
+__all__ = ("EventLoopThread",)
+
+T = TypeVar("T")
+
+
+async def _await(awaitable: Awaitable[T]) -> T:
+    return await awaitable
+
+
+class EventLoopThread:
+    """
+    `EventLoopThread` - An asyncio event loop running on its own daemon thread.
+
+    `**Parameters**`
+    - `name` - The name of the thread. `Defaults` to `pymino-event-loop`.
+
+    The loop is started the first time a coroutine is submitted, so bots without
+    `async def` handlers never start the thread.
+
+    `**Example**`
+    ```py
+    loop = EventLoopThread()
+    future = loop.submit(asyncio.sleep(1, result="done"))
+    print(future.result())
+    ```
+
+    """
+
+    __slots__ = ("name", "_loop", "_thread", "_lock")
+
+    def __init__(self, name: str = "pymino-event-loop") -> None:
+        self.name = name
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    @property
+    def running(self) -> bool:
+        """Whether or not the loop thread is running."""
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """The event loop, started on first access."""
+        with self._lock:
+            if self._loop is None or not self.running:
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(
+                    target=self._run, args=(self._loop,), name=self.name, daemon=True
+                )
+                self._thread.start()
+            return self._loop
+
+    def _run(self, loop: asyncio.AbstractEventLoop) -> None:
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_forever()
+        finally:
+            loop.close()
+
+    def submit(self, awaitable: Awaitable[T]) -> "concurrent.futures.Future[T]":
+        """
+        Schedules an awaitable on the loop.
+
+        `**Parameters**`
+        - `awaitable` - The coroutine or awaitable to run.
+
+        `**Returns**`
+        - `Future` - A thread-safe future resolved with the result of the awaitable.
+
+        """
+        coroutine: Coroutine[Any, Any, T] = (
+            awaitable if asyncio.iscoroutine(awaitable) else _await(awaitable)
+        )
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop)
+
+    def stop(self) -> None:
+        """Stops the loop. It is started again by the next `submit`."""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is not None and thread is not None and thread.is_alive():
+            loop.call_soon_threadsafe(loop.stop)
+            if thread is not threading.current_thread():
+                thread.join()
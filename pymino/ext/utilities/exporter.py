@@ -0,0 +1,295 @@
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections.abc import Callable, Iterable
+from typing import IO, Any, Literal, Optional
+
+import ujson
+
+from pymino.ext import entities
+
+__all__ = ("ChatExporter",)
+
+logger = logging.getLogger("pymino")
+
+_dumps: Callable[[Any], str] = ujson.dumps  # pyright: ignore[reportUnknownMemberType, reportUnknownVariableType]
+_loads: Callable[[str], Any] = ujson.loads  # pyright: ignore[reportUnknownMemberType, reportUnknownVariableType]
+
+Mark = tuple[str, str]
+"""A messageId and its createdTime."""
+
+
+class ChatExporter:
+    """
+    `ChatExporter` - Archives chat messages incrementally to SQLite or JSONL.
+
+    `**Parameters**`
+    - `path` - The SQLite database file, or the directory of the JSONL files.
+    - `format` - Either `sqlite` or `jsonl`. `Defaults` to `sqlite`.
+    - `batch_size` - The number of messages written at once. `Defaults` to `500`.
+
+    Every chat is checkpointed at the newest message up to which all of its
+    messages were exported, so later runs stop reading as soon as they reach it
+    and only the delta is downloaded. The checkpoint only moves once a run
+    completes, so an interrupted run is simply redone.
+
+    A run cut short by `limit` leaves a gap between its oldest message and the
+    checkpoint. The next run skips the messages it already exported and fills
+    that gap first; newer messages are picked up once the gap is closed.
+
+    `**Example**`
+    ```py
+    exporter = ChatExporter("archive.db")
+    for chatId in chatIds:
+        exporter.export(chatId, bot.community.iter_messages(chatId, size=100))
+    ```
+
+    """
+
+    def __init__(
+        self,
+        path: str,
+        format: Literal["sqlite", "jsonl"] = "sqlite",
+        batch_size: int = 500,
+    ) -> None:
+        if format not in ("sqlite", "jsonl"):
+            raise ValueError(f"Unsupported export format: {format}")
+        self.path = path
+        self.format = format
+        self.batch_size = batch_size
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+        if format == "sqlite":
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._db.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS messages (
+                    messageId TEXT PRIMARY KEY,
+                    chatId TEXT NOT NULL,
+                    uid TEXT,
+                    type INTEGER,
+                    mediaType INTEGER,
+                    content TEXT,
+                    createdTime TEXT,
+                    data TEXT NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS messages_chat
+                    ON messages (chatId, createdTime);
+                CREATE TABLE IF NOT EXISTS checkpoints (
+                    chatId TEXT PRIMARY KEY,
+                    messageId TEXT,
+                    createdTime TEXT,
+                    partialNewestId TEXT,
+                    partialNewestTime TEXT,
+                    partialOldestId TEXT,
+                    partialOldestTime TEXT,
+                    updatedTime REAL NOT NULL
+                );
+                """
+            )
+        else:
+            os.makedirs(path, exist_ok=True)
+
+    def __enter__(self) -> "ChatExporter":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Closes the database connection."""
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+    def _checkpoint_path(self, chatId: str) -> str:
+        return os.path.join(self.path, f"{chatId}.checkpoint.json")
+
+    def _jsonl_path(self, chatId: str) -> str:
+        return os.path.join(self.path, f"{chatId}.jsonl")
+
+    def checkpoint(self, chatId: str) -> Optional[Mark]:
+        """
+        Fetches the checkpoint of a chat.
+
+        `**Parameters**`
+        - `chatId` - The ID of the chat.
+
+        `**Returns**`
+        - `tuple[str, str]` - The messageId and createdTime up to which every message was exported, or `None` if no run of the chat completed.
+
+        """
+        return self._load(chatId)[0]
+
+    def _load(self, chatId: str) -> tuple[Optional[Mark], Optional[tuple[Mark, Mark]]]:
+        """Returns the checkpoint and the newest and oldest message of an unfinished run."""
+        if self._db is not None:
+            with self._lock:
+                row = self._db.execute(
+                    "SELECT messageId, createdTime, partialNewestId, partialNewestTime, "
+                    "partialOldestId, partialOldestTime FROM checkpoints WHERE chatId = ?",
+                    (chatId,),
+                ).fetchone()
+            if row is None:
+                return None, None
+            values: list[Optional[str]] = list(row)
+        else:
+            try:
+                with open(self._checkpoint_path(chatId), encoding="utf-8") as file:
+                    data: dict[str, Any] = _loads(file.read())
+            except (OSError, ValueError):
+                return None, None
+            unfinished: dict[str, Any] = data.get("partial") or {}
+            values = [
+                data.get("messageId"),
+                data.get("createdTime"),
+                *(unfinished.get("newest") or (None, None)),
+                *(unfinished.get("oldest") or (None, None)),
+            ]
+        checkpoint = (values[0], values[1] or "") if values[0] else None
+        if values[2] and values[4]:
+            return checkpoint, ((values[2], values[3] or ""), (values[4], values[5] or ""))
+        return checkpoint, None
+
+    def export(
+        self,
+        chatId: str,
+        messages: Iterable["entities.CMessage"],
+        limit: Optional[int] = None,
+    ) -> int:
+        """
+        Exports the messages of a chat that are newer than its checkpoint.
+
+        `**Parameters**`
+        - `chatId` - The ID of the chat.
+        - `messages` - The messages of the chat, newest first, e.g. `bot.community.iter_messages(chatId)`.
+        - `limit` - The maximum number of messages to export. `Defaults` to `None` (no limit).
+
+        `**Returns**`
+        - `int` - The number of exported messages.
+
+        """
+        checkpoint, partial = self._load(chatId)
+        skipping = partial is not None
+        newest: Optional[Mark] = None
+        oldest: Optional[Mark] = None
+        truncated = False
+        batch: list[entities.CMessage] = []
+        count = 0
+        writer = self._begin(chatId)
+        try:
+            for message in messages:
+                if checkpoint is not None and (
+                    message.messageId == checkpoint[0]
+                    or (checkpoint[1] and message.createdTime < checkpoint[1])
+                ):
+                    break
+                if partial is not None and skipping:
+                    if message.messageId == partial[1][0]:
+                        skipping = False
+                        continue
+                    if not (partial[1][1] and message.createdTime < partial[1][1]):
+                        continue
+                    skipping = False
+                if limit is not None and count >= limit:
+                    truncated = True
+                    break
+                mark = (message.messageId, message.createdTime)
+                newest = newest or mark
+                oldest = mark
+                batch.append(message)
+                count += 1
+                if len(batch) >= self.batch_size:
+                    self._write(writer, chatId, batch)
+                    batch.clear()
+            if batch:
+                self._write(writer, chatId, batch)
+            if truncated:
+                if oldest is not None:
+                    partial = (partial[0] if partial else newest or oldest, oldest)
+            else:
+                checkpoint = partial[0] if partial else newest or checkpoint
+                partial = None
+            self._commit(writer, chatId, checkpoint, partial, count > 0)
+        except BaseException:
+            self._rollback(writer, chatId)
+            raise
+        logger.debug(f"Exported {count} messages from {chatId}.")
+        return count
+
+    def _begin(self, chatId: str) -> Optional[IO[str]]:
+        if self._db is not None:
+            return None
+        return open(f"{self._jsonl_path(chatId)}.part", "w", encoding="utf-8")
+
+    def _write(
+        self, writer: Optional[IO[str]], chatId: str, batch: list["entities.CMessage"]
+    ) -> None:
+        if writer is not None:
+            writer.writelines(f"{_dumps(message.json())}\n" for message in batch)
+            return None
+        rows = [
+            (
+                message.messageId,
+                chatId,
+                message.uid,
+                message.type,
+                message.mediaType,
+                message.content,
+                message.createdTime,
+                _dumps(message.json()),
+            )
+            for message in batch
+        ]
+        assert self._db is not None
+        with self._lock, self._db:
+            self._db.executemany(
+                "INSERT OR IGNORE INTO messages VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows
+            )
+
+    def _commit(
+        self,
+        writer: Optional[IO[str]],
+        chatId: str,
+        checkpoint: Optional[Mark],
+        partial: Optional[tuple[Mark, Mark]],
+        exported: bool,
+    ) -> None:
+        if writer is None:
+            assert self._db is not None
+            with self._lock, self._db:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO checkpoints VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        chatId,
+                        *(checkpoint or (None, None)),
+                        *(partial[0] if partial else (None, None)),
+                        *(partial[1] if partial else (None, None)),
+                        time.time(),
+                    ),
+                )
+            return None
+        writer.close()
+        part = f"{self._jsonl_path(chatId)}.part"
+        if exported:
+            with open(part, "rb") as source, open(self._jsonl_path(chatId), "ab") as target:
+                while chunk := source.read(1 << 16):
+                    target.write(chunk)
+        data: dict[str, Any] = {}
+        if checkpoint is not None:
+            data.update(messageId=checkpoint[0], createdTime=checkpoint[1])
+        if partial is not None:
+            data["partial"] = {"newest": partial[0], "oldest": partial[1]}
+        with open(self._checkpoint_path(chatId), "w", encoding="utf-8") as file:
+            file.write(_dumps(data))
+        os.remove(part)
+
+    def _rollback(self, writer: Optional[IO[str]], chatId: str) -> None:
+        if writer is None:
+            return None
+        writer.close()
+        part = f"{self._jsonl_path(chatId)}.part"
+        if os.path.exists(part):
+            os.remove(part)
@@ -0,0 +1,88 @@
+from collections.abc import Callable, Iterable
+from typing import Any, Optional, Union
+
+from typing_extensions import TypedDict, Unpack
+
+__all__ = ("EventFilters", "EventPredicate", "compile_filters")
+
+EventPredicate = Callable[[dict[str, Any]], bool]
+
+
+class EventFilters(TypedDict, total=False):
+    """
+    `EventFilters` - The filters an event handler can be registered with.
+
+    - `comId` - The community ID, or IDs, the event must come from.
+    - `chatIds` - The chat IDs the event must come from.
+    - `userIds` - The user IDs the event must be sent by.
+    - `roles` - The roles the author of the message must have.
+
+    """
+
+    comId: Union[int, Iterable[int]]
+    chatIds: Iterable[str]
+    userIds: Iterable[str]
+    roles: Iterable[int]
+
+
+def _source(data: dict[str, Any]) -> dict[str, Any]:
+    return data.get("chatMessage") or data.get("payload") or {}
+
+
+def _comId(data: dict[str, Any]) -> Any:
+    comId = data.get("ndcId")
+    return comId if comId is not None else _source(data).get("ndcId")
+
+
+def _chatId(data: dict[str, Any]) -> Any:
+    source = _source(data)
+    return source.get("threadId") or source.get("tid")
+
+
+def _userId(data: dict[str, Any]) -> Any:
+    return _source(data).get("uid")
+
+
+def _role(data: dict[str, Any]) -> Any:
+    author: dict[str, Any] = _source(data).get("author") or {}
+    return author.get("role", 0)
+
+
+def compile_filters(**filters: Unpack[EventFilters]) -> Optional[EventPredicate]:
+    """
+    Compiles event filters into a single predicate over the raw event data.
+
+    `**Parameters**`
+    - `comId` - The community ID, or IDs, the event must come from.
+    - `chatIds` - The chat IDs the event must come from.
+    - `userIds` - The user IDs the event must be sent by.
+    - `roles` - The roles the author of the message must have.
+
+    `**Returns**`
+    - `EventPredicate` - A function that returns `True` when the raw event (the `o` object of the
+      websocket frame) matches every filter, or `None` if no filter was given.
+
+    """
+    checks: list[tuple[Callable[[dict[str, Any]], Any], frozenset[Any]]] = []
+    for getter, values in (
+        (_comId, filters.get("comId")),
+        (_chatId, filters.get("chatIds")),
+        (_userId, filters.get("userIds")),
+        (_role, filters.get("roles")),
+    ):
+        if values is None:
+            continue
+        allowed = frozenset([values] if isinstance(values, (int, str)) else values)
+        checks.append((getter, allowed))
+
+    if not checks:
+        return None
+
+    if len(checks) == 1:
+        getter, allowed = checks[0]
+        return lambda data: getter(data) in allowed
+
+    def predicate(data: dict[str, Any]) -> bool:
+        return all(getter(data) in allowed for getter, allowed in checks)
+
+    return predicate
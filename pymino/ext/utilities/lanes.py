@@ -0,0 +1,239 @@
+import collections
+import itertools
+import logging
+import threading
+import time
+from collections.abc import Callable, Iterable
+from typing import Any, Optional
+
+__all__ = ("EVENT_LANES", "Lane", "LaneScheduler")
+
+logger = logging.getLogger("pymino")
+
+EVENT_LANES: dict[str, str] = {
+    "command": "command",
+    "delete_message": "moderation",
+    "mod_deleted_message": "moderation",
+    "chat_removed_message": "moderation",
+    "text_message_force_removed": "moderation",
+    "user_online": "passive",
+    "member_join": "passive",
+    "member_leave": "passive",
+}
+"""The lane of each event. Message events default to `moderation`, every other event to `passive`."""
+
+
+class Lane:
+    """
+    `Lane` - A priority class of events with its own queue and shedding limits.
+
+    `**Parameters**`
+    - `name` - The name of the lane.
+    - `priority` - Lanes with a lower number are always served first.
+    - `max_backlog` - The number of queued events after which new ones are shed. `Defaults` to `None` (unbounded).
+    - `max_age` - The number of seconds after which a queued event is dropped. `Defaults` to `None` (never).
+    - `sample_rate` - The share of events still kept while the lane is over `max_backlog`. `Defaults` to `0`.
+
+    """
+
+    __slots__ = (
+        "name",
+        "priority",
+        "max_backlog",
+        "max_age",
+        "sample_rate",
+        "queue",
+        "submitted",
+        "processed",
+        "dropped",
+        "_sampled",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        priority: int,
+        max_backlog: Optional[int] = None,
+        max_age: Optional[float] = None,
+        sample_rate: float = 0.0,
+    ) -> None:
+        self.name = name
+        self.priority = priority
+        self.max_backlog = max_backlog
+        self.max_age = max_age
+        self.sample_rate = sample_rate
+        self.queue: collections.deque[
+            tuple[float, Callable[..., Any], tuple[Any, ...]]
+        ] = collections.deque()
+        self.submitted = 0
+        self.processed = 0
+        self.dropped = 0
+        self._sampled = 0.0
+
+    def __repr__(self) -> str:
+        return f"<Lane name={self.name!r} priority={self.priority} backlog={len(self.queue)}>"
+
+    def admit(self) -> bool:
+        """Decides whether a new event is queued, sampling it when the lane is over its backlog."""
+        if self.max_backlog is None or len(self.queue) < self.max_backlog:
+            return True
+        self._sampled += self.sample_rate
+        if self._sampled >= 1.0:
+            self._sampled -= 1.0
+            return True
+        return False
+
+    def json(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "priority": self.priority,
+            "backlog": len(self.queue),
+            "submitted": self.submitted,
+            "processed": self.processed,
+            "dropped": self.dropped,
+        }
+
+
+class LaneScheduler:
+    """
+    `LaneScheduler` - A bounded worker pool that serves event lanes by priority.
+
+    `**Parameters**`
+    - `workers` - The number of worker threads. `Defaults` to `16`.
+    - `lanes` - The lanes to serve. `Defaults` to `command`, `moderation` and `passive`.
+
+    Workers always take from the highest priority lane that has work, so a flood
+    of passive events cannot delay commands. Lanes with limits drop (or sample)
+    events once they fall behind instead of building an unbounded backlog. Only
+    the `passive` lane has limits by default, so chat messages are never dropped.
+
+    A worker that blocks waiting for another event, like `wait_for_message`, is
+    `release`d and replaced, so waits never starve the events they wait for.
+
+    `**Example**`
+    ```py
+    scheduler = LaneScheduler(workers=8)
+    scheduler.lanes["passive"].max_backlog = 100
+    scheduler.submit("passive", print, "member joined")
+    ```
+
+    """
+
+    def __init__(
+        self,
+        workers: int = 16,
+        lanes: Optional[Iterable[Lane]] = None,
+    ) -> None:
+        if lanes is None:
+            lanes = (
+                Lane("command", 0),
+                Lane("moderation", 1),
+                Lane("passive", 2, max_backlog=200, max_age=10.0, sample_rate=0.1),
+            )
+        self.workers = workers
+        self.lanes: dict[str, Lane] = {lane.name: lane for lane in lanes}
+        self._ordered = sorted(self.lanes.values(), key=lambda lane: lane.priority)
+        self._condition = threading.Condition()
+        self._threads: list[threading.Thread] = []
+        self._released: set[int] = set()
+        self._names = itertools.count()
+
+    @property
+    def backlog(self) -> int:
+        """The number of events waiting in every lane."""
+        return sum(len(lane.queue) for lane in self._ordered)
+
+    def add_lane(self, lane: Lane) -> Lane:
+        """Adds or replaces a lane."""
+        with self._condition:
+            self.lanes[lane.name] = lane
+            self._ordered = sorted(self.lanes.values(), key=lambda lane: lane.priority)
+        return lane
+
+    def submit(self, lane: str, func: Callable[..., Any], *args: Any) -> bool:
+        """
+        Queues a call on a lane.
+
+        `**Parameters**`
+        - `lane` - The name of the lane. Unknown lanes fall back to the lowest priority lane.
+        - `func` - The function to call.
+        - `args` - The arguments of the function.
+
+        `**Returns**`
+        - `bool` - `True` if the call was queued, `False` if it was shed.
+
+        """
+        with self._condition:
+            target = self.lanes.get(lane) or self._ordered[-1]
+            target.submitted += 1
+            if not target.admit():
+                target.dropped += 1
+                logger.debug(f"Dropped an event from the {target.name} lane, {len(target.queue)} queued.")
+                return False
+            target.queue.append((time.monotonic(), func, args))
+            self._ensure_workers()
+            self._condition.notify()
+        return True
+
+    def release(self, ident: int) -> None:
+        """
+        Stops counting a stuck worker and starts a replacement.
+
+        `**Parameters**`
+        - `ident` - The thread identifier of the worker.
+
+        The released worker exits once its current call returns.
+        """
+        with self._condition:
+            if any(thread.ident == ident for thread in self._threads):
+                self._released.add(ident)
+                self._ensure_workers()
+
+    def _ensure_workers(self) -> None:
+        self._threads = [
+            thread
+            for thread in self._threads
+            if thread.is_alive() and thread.ident not in self._released
+        ]
+        while len(self._threads) < self.workers:
+            thread = threading.Thread(
+                target=self._work,
+                name=f"pymino-worker-{next(self._names)}",
+                daemon=True,
+            )
+            thread.start()
+            self._threads.append(thread)
+
+    def _next(self) -> tuple[Lane, Callable[..., Any], tuple[Any, ...]]:
+        with self._condition:
+            while True:
+                now = time.monotonic()
+                for lane in self._ordered:
+                    while lane.queue:
+                        queued_at, func, args = lane.queue.popleft()
+                        if lane.max_age is not None and now - queued_at > lane.max_age:
+                            lane.dropped += 1
+                            logger.debug(f"Dropped an event older than {lane.max_age}s from the {lane.name} lane.")
+                            continue
+                        return lane, func, args
+                self._condition.wait()
+
+    def _work(self) -> None:
+        ident = threading.get_ident()
+        while True:
+            lane, func, args = self._next()
+            try:
+                func(*args)
+            except Exception as e:
+                logger.error(f"Unhandled error in {lane.name} lane: {e}", exc_info=e)
+            finally:
+                with self._condition:
+                    lane.processed += 1
+                    if ident in self._released:
+                        self._released.discard(ident)
+                        return
+
+    def stats(self) -> list[dict[str, Any]]:
+        """Returns the backlog and the submitted, processed and dropped counts of every lane."""
+        with self._condition:
+            return [lane.json() for lane in self._ordered]
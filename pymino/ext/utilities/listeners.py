@@ -0,0 +1,68 @@
+import itertools
+from collections.abc import Callable
+from typing import Any, Optional
+
+from pymino.ext import utilities
+
+__all__ = ("STOP_PROPAGATION", "EventOptions", "Listener", "Middleware")
+
+STOP_PROPAGATION: Any = object()
+"""Returned by a handler to stop the remaining handlers of the event from running."""
+
+Middleware = Callable[[str, Any, Callable[[], None]], None]
+
+_sequence = itertools.count()
+
+
+class Listener:
+    """
+    `Listener` - A handler registered for an event.
+
+    `**Parameters**`
+    - `callback` - The function to call.
+    - `priority` - Handlers with a higher priority run first. `Defaults` to `0`.
+    - `concurrent` - Whether the handler runs on the fan-out pool instead of inline. `Defaults` to `False`.
+    - `predicate` - The compiled filters of the handler. `Defaults` to `None`.
+
+    Handlers with the same priority run in the order they were registered.
+
+    """
+
+    __slots__ = ("callback", "priority", "concurrent", "predicate", "_order")
+
+    def __init__(
+        self,
+        callback: Callable[..., Any],
+        priority: int = 0,
+        concurrent: bool = False,
+        predicate: Optional["utilities.EventPredicate"] = None,
+    ) -> None:
+        self.callback = callback
+        self.priority = priority
+        self.concurrent = concurrent
+        self.predicate = predicate
+        self._order = next(_sequence)
+
+    def __repr__(self) -> str:
+        return f"<Listener callback={self.callback!r} priority={self.priority} concurrent={self.concurrent}>"
+
+    @property
+    def sort_key(self) -> tuple[int, int]:
+        return -self.priority, self._order
+
+    def accepts(self, data: dict[str, Any]) -> bool:
+        """Checks the raw event data against the filters of the handler."""
+        return self.predicate is None or self.predicate(data)
+
+
+class EventOptions(utilities.EventFilters, total=False):
+    """
+    `EventOptions` - The filters and options an event handler can be registered with.
+
+    - `priority` - Handlers with a higher priority run first.
+    - `concurrent` - Whether the handler runs on the fan-out pool instead of inline.
+
+    """
+
+    priority: int
+    concurrent: bool
@@ -0,0 +1,113 @@
+import collections
+import hashlib
+import threading
+import time
+from typing import Optional, Union
+
+import diskcache
+
+from pymino.ext import entities
+
+__all__ = ("MediaCache",)
+
+
+class MediaCache:
+    """
+    `MediaCache` - Maps uploaded media to the `mediaValue` returned by the server.
+
+    `**Parameters**`
+    - `directory` - The directory to persist the cache in. `Defaults` to `None` (memory only).
+    - `ttl` - The time in seconds an upload is reused for. `Defaults` to `86400`.
+    - `max_entries` - The maximum number of uploads kept in memory. `Defaults` to `1024`.
+
+    Uploads are keyed by the SHA-256 of their content plus the content type, so
+    sending the same bytes again skips the upload round trip.
+
+    """
+
+    def __init__(
+        self,
+        directory: Optional[str] = None,
+        ttl: float = 86400.0,
+        max_entries: int = 1024,
+    ) -> None:
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.disk = diskcache.Cache(directory) if directory else None
+        self._lock = threading.Lock()
+        self._memory: collections.OrderedDict[str, tuple[str, float]] = (
+            collections.OrderedDict()
+        )
+
+    def __len__(self) -> int:
+        return len(self._memory)
+
+    def key(self, data: Union[bytes, "entities.MediaSource"], content_type: str) -> str:
+        """
+        Generates the cache key of a media.
+
+        `**Parameters**`
+        - `data` - The content of the media.
+        - `content_type` - The content type the media is uploaded as.
+
+        `**Returns**`
+        - `str` - The cache key.
+
+        """
+        if isinstance(data, bytes):
+            return f"{hashlib.sha256(data).hexdigest()}:{content_type}"
+        return f"{data.digest('sha256')}:{content_type}"
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Fetches the media value of an upload.
+
+        `**Parameters**`
+        - `key` - The cache key of the media.
+
+        `**Returns**`
+        - `str` - The media value, or `None` if it is not cached or expired.
+
+        """
+        now = time.time()
+        with self._lock:
+            cached = self._memory.get(key)
+            if cached is not None:
+                if cached[1] > now:
+                    self._memory.move_to_end(key)
+                    return cached[0]
+                del self._memory[key]
+        if self.disk is None:
+            return None
+        value, expires_at = self.disk.get(key, expire_time=True)
+        if value is None:
+            return None
+        self._remember(key, value, expires_at or now + self.ttl)
+        return value
+
+    def set(self, key: str, media_value: str) -> None:
+        """
+        Stores the media value of an upload.
+
+        `**Parameters**`
+        - `key` - The cache key of the media.
+        - `media_value` - The media value returned by the server.
+
+        """
+        self._remember(key, media_value, time.time() + self.ttl)
+        if self.disk is not None:
+            self.disk.set(key, media_value, expire=self.ttl)
+
+    def clear(self) -> None:
+        """Removes every cached upload."""
+        with self._lock:
+            self._memory.clear()
+        if self.disk is not None:
+            self.disk.clear()
+
+    def _remember(self, key: str, media_value: str, expires_at: float) -> None:
+        with self._lock:
+            self._memory[key] = (media_value, expires_at)
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_entries:
+                self._memory.popitem(last=False)
@@ -0,0 +1,227 @@
+import logging
+import threading
+import time
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Optional, Union
+
+import requests
+
+from pymino.ext import entities, utilities
+
+__all__ = (
+    "MODERATION_RATES",
+    "TRANSIENT_ERRORS",
+    "BulkModerator",
+    "ModerationReport",
+    "ModerationResult",
+)
+
+logger = logging.getLogger("pymino")
+
+MODERATION_RATES: dict[str, float] = {
+    "ban": 2.0,
+    "delete_message": 20.0,
+    "hide_user": 2.0,
+    "kick": 5.0,
+    "strike": 2.0,
+    "unban": 2.0,
+    "warn": 2.0,
+}
+
+TRANSIENT_ERRORS: tuple[type[Exception], ...] = (
+    entities.BadGateway,
+    entities.InternalServerError,
+    entities.ServiceUnavailable,
+    entities.WhoaCooldown,
+    requests.RequestException,
+)
+
+Target = Union[str, tuple[Any, ...], Mapping[str, Any]]
+
+
+class ModerationResult:
+    """
+    `ModerationResult` - The outcome of a single moderation action.
+
+    `**Attributes**`
+    - `action` - The name of the action.
+    - `target` - The target the action was called with.
+    - `response` - The value returned by the action, or `None` if it failed.
+    - `error` - The exception raised by the last attempt, or `None` if it succeeded.
+    - `attempts` - The number of times the action was attempted.
+
+    """
+
+    __slots__ = ("action", "target", "response", "error", "attempts")
+
+    def __init__(self, action: str, target: Target) -> None:
+        self.action = action
+        self.target = target
+        self.response: Any = None
+        self.error: Optional[Exception] = None
+        self.attempts = 0
+
+    def __repr__(self) -> str:
+        status = "ok" if self.ok else type(self.error).__name__
+        return f"ModerationResult({self.action!r}, {self.target!r}, {status})"
+
+    @property
+    def ok(self) -> bool:
+        """Whether or not the action succeeded."""
+        return self.error is None and self.attempts > 0
+
+
+class ModerationReport:
+    """
+    `ModerationReport` - The outcome of a bulk moderation run, in input order.
+
+    `**Attributes**`
+    - `results` - The `ModerationResult` of every action.
+    - `duration` - The time in seconds the run took.
+
+    """
+
+    __slots__ = ("results", "duration")
+
+    def __init__(self, results: list[ModerationResult], duration: float) -> None:
+        self.results = results
+        self.duration = duration
+
+    def __iter__(self) -> Iterator[ModerationResult]:
+        return iter(self.results)
+
+    def __len__(self) -> int:
+        return len(self.results)
+
+    def __repr__(self) -> str:
+        return (
+            f"ModerationReport(succeeded={len(self.succeeded)}, "
+            f"failed={len(self.failed)}, duration={self.duration:.2f})"
+        )
+
+    @property
+    def succeeded(self) -> list[ModerationResult]:
+        """The actions that succeeded."""
+        return [result for result in self.results if result.ok]
+
+    @property
+    def failed(self) -> list[ModerationResult]:
+        """The actions that failed after every retry."""
+        return [result for result in self.results if not result.ok]
+
+    def json(self) -> dict[str, Any]:
+        return {
+            "duration": self.duration,
+            "succeeded": len(self.succeeded),
+            "failed": [
+                {
+                    "action": result.action,
+                    "target": result.target,
+                    "error": repr(result.error),
+                    "attempts": result.attempts,
+                }
+                for result in self.failed
+            ],
+        }
+
+
+class BulkModerator:
+    """
+    `BulkModerator` - Runs moderation actions concurrently within per-action rate limits.
+
+    `**Parameters**`
+    - `handlers` - Maps an action name to the function that performs it.
+    - `rates` - Maps an action name to the calls per second it is limited to. `Defaults` to `MODERATION_RATES`.
+    - `parallelism` - The maximum number of actions in flight. `Defaults` to `8`.
+    - `retries` - The number of times a transient failure is retried. `Defaults` to `3`.
+    - `backoff` - The delay in seconds before the first retry, doubled on every retry. `Defaults` to `1`.
+
+    Failures listed in `TRANSIENT_ERRORS` are retried; any other exception is
+    recorded in the report straight away.
+
+    """
+
+    __slots__ = ("handlers", "limiters", "parallelism", "retries", "backoff")
+
+    def __init__(
+        self,
+        handlers: Mapping[str, Callable[..., Any]],
+        rates: Optional[Mapping[str, float]] = None,
+        parallelism: int = 8,
+        retries: int = 3,
+        backoff: float = 1.0,
+    ) -> None:
+        rates = {**MODERATION_RATES, **(rates or {})}
+        self.handlers = dict(handlers)
+        self.limiters = {
+            action: utilities.RateLimiter(rates.get(action, 0.0))
+            for action in self.handlers
+        }
+        self.parallelism = parallelism
+        self.retries = retries
+        self.backoff = backoff
+
+    def _execute(self, result: ModerationResult) -> ModerationResult:
+        handler = self.handlers.get(result.action)
+        if handler is None:
+            result.error = ValueError(f"Unknown moderation action: {result.action}")
+            return result
+        target = result.target
+        for attempt in range(self.retries + 1):
+            self.limiters[result.action].acquire()
+            result.attempts += 1
+            try:
+                if isinstance(target, Mapping):
+                    result.response = handler(**target)
+                elif isinstance(target, tuple):
+                    result.response = handler(*target)
+                else:
+                    result.response = handler(target)
+                result.error = None
+                return result
+            except TRANSIENT_ERRORS as exc:
+                result.error = exc
+                if attempt < self.retries:
+                    logger.debug(f"Retrying {result.action} {target}: {exc!r}")
+                    time.sleep(self.backoff * 2**attempt)
+            except Exception as exc:
+                result.error = exc
+                return result
+        return result
+
+    def run(
+        self,
+        actions: Iterable[tuple[str, Target]],
+        progress: Optional[Callable[[ModerationResult], Any]] = None,
+    ) -> ModerationReport:
+        """
+        Runs moderation actions.
+
+        `**Parameters**`
+        - `actions` - `(action, target)` pairs. The target is passed as keyword arguments if it is a dict,
+          as positional arguments if it is a tuple and as the only argument otherwise.
+        - `progress` - Called with every `ModerationResult` as soon as it is finished. `Defaults` to `None`.
+          Errors raised by it are logged and do not stop the run.
+
+        `**Returns**`
+        - `ModerationReport` - The result of every action, in input order.
+
+        """
+        started = time.monotonic()
+        results = [ModerationResult(action, target) for action, target in actions]
+        lock = threading.Lock()
+
+        def execute(result: ModerationResult) -> ModerationResult:
+            self._execute(result)
+            if progress is not None:
+                with lock:
+                    try:
+                        progress(result)
+                    except Exception as exc:
+                        logger.error(f"Error in bulk moderation progress callback: {exc}", exc_info=exc)
+            return result
+
+        with ThreadPoolExecutor(max_workers=max(self.parallelism, 1)) as executor:
+            list(executor.map(execute, results))
+        return ModerationReport(results, time.monotonic() - started)
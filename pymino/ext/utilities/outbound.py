@@ -0,0 +1,230 @@
+import collections
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Optional, TypeVar
+
+__all__ = ("OutboundQueue",)
+
+T = TypeVar("T")
+
+
+class _Call:
+    __slots__ = ("future", "func", "args", "kwargs", "text", "queued")
+
+    def __init__(
+        self,
+        func: Callable[..., Any],
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+        text: Optional[str] = None,
+    ) -> None:
+        self.future: "Future[Any]" = Future()
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.text = text
+        self.queued = time.monotonic()
+
+
+class OutboundQueue:
+    """
+    `OutboundQueue` - Runs calls one at a time per key and in parallel across keys.
+
+    `**Parameters**`
+    - `workers` - The maximum number of keys served at once. `Defaults` to `8`.
+    - `coalesce_window` - The number of seconds a text waits for more texts to merge with. `Defaults` to `None` (never merge).
+    - `coalesce_limit` - The maximum length of a merged text. `Defaults` to `2000`.
+    - `interval` - The minimum number of seconds between two calls of the same key. `Defaults` to `0`.
+
+    Calls queued under the same key, like the messages of one chat, run in the
+    order they were submitted. A key only holds a worker while it has calls
+    queued, so idle chats cost nothing.
+
+    With a `coalesce_window`, consecutive texts queued with `submit_text` within
+    the window are joined with `separator` and sent as one call. Every merged
+    future resolves to the result of that call.
+
+    `**Example**`
+    ```py
+    outbound = OutboundQueue(coalesce_window=0.01)
+    first = outbound.submit_text("0000-0000-0000-0000", print, "Hello")
+    second = outbound.submit_text("0000-0000-0000-0000", print, "World!")
+    second.result() # Prints "Hello\\nWorld!" once.
+    ```
+
+    """
+
+    __slots__ = (
+        "workers",
+        "coalesce_window",
+        "coalesce_limit",
+        "separator",
+        "interval",
+        "calls",
+        "coalesced",
+        "_queues",
+        "_lock",
+        "_local",
+        "_executor",
+    )
+
+    def __init__(
+        self,
+        workers: int = 8,
+        coalesce_window: Optional[float] = None,
+        coalesce_limit: int = 2000,
+        interval: float = 0.0,
+    ) -> None:
+        self.workers = workers
+        self.coalesce_window = coalesce_window
+        self.coalesce_limit = coalesce_limit
+        self.separator = "\n"
+        self.interval = interval
+        self.calls = 0
+        self.coalesced = 0
+        self._queues: dict[str, collections.deque[_Call]] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def __len__(self) -> int:
+        with self._lock:
+            return sum(len(queue) for queue in self._queues.values())
+
+    def pending(self, key: str) -> int:
+        """The number of calls waiting under `key`."""
+        with self._lock:
+            queue = self._queues.get(key)
+            return len(queue) if queue is not None else 0
+
+    def stats(self) -> dict[str, int]:
+        """Returns the number of `pending`, executed `calls` and `coalesced` texts."""
+        return {
+            "pending": len(self),
+            "calls": self.calls,
+            "coalesced": self.coalesced,
+        }
+
+    def _pool(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.workers, thread_name_prefix="pymino-outbound"
+            )
+        return self._executor
+
+    def submit(self, key: str, func: Callable[..., T], *args: Any, **kwargs: Any) -> "Future[T]":
+        """
+        Queues a call behind the other calls of a key.
+
+        `**Parameters**`
+        - `key` - The key the call is ordered under.
+        - `func` - The function to call.
+        - `args` - The arguments of the function.
+        - `kwargs` - The keyword arguments of the function.
+
+        `**Returns**`
+        - `Future` - Resolved with the result of the call, or the exception it raised.
+
+        A call submitted from a call of the same key runs right away, so waiting
+        on its future cannot deadlock the queue.
+
+        """
+        return self._enqueue(key, _Call(func, args, kwargs))
+
+    def submit_text(self, key: str, func: Callable[[str], T], text: str) -> "Future[T]":
+        """
+        Queues a text that may be merged with the texts queued right after it.
+
+        `**Parameters**`
+        - `key` - The key the call is ordered under.
+        - `func` - The function called with the (merged) text.
+        - `text` - The text.
+
+        `**Returns**`
+        - `Future` - Resolved with the result of the call that sent the text.
+
+        """
+        return self._enqueue(key, _Call(func, (text,), {}, text))
+
+    def _enqueue(self, key: str, call: _Call) -> "Future[Any]":
+        if getattr(self._local, "key", None) == key:
+            self._run(call)
+            return call.future
+        with self._lock:
+            queue = self._queues.get(key)
+            idle = queue is None
+            if queue is None:
+                queue = self._queues[key] = collections.deque()
+            queue.append(call)
+            if idle:
+                self._pool().submit(self._drain, key, queue)
+        return call.future
+
+    def _merge(self, call: _Call, queue: "collections.deque[_Call]") -> _Call:
+        assert call.text is not None and self.coalesce_window is not None
+        delay = call.queued + self.coalesce_window - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+        texts = [call.text]
+        merged = [call]
+        length = len(call.text)
+        with self._lock:
+            while queue and queue[0].text is not None:
+                if queue[0].future.cancelled():
+                    queue.popleft()
+                    continue
+                text: str = queue[0].text
+                length += len(self.separator) + len(text)
+                if length > self.coalesce_limit:
+                    break
+                merged.append(queue.popleft())
+                texts.append(text)
+            self.coalesced += len(merged) - 1
+        if len(merged) == 1:
+            return call
+        running = [part for part in merged if part.future.set_running_or_notify_cancel()]
+        combined = _Call(call.func, (self.separator.join(texts),), {})
+
+        def resolve(future: "Future[Any]") -> None:
+            error = future.exception()
+            for part in running:
+                if error is not None:
+                    part.future.set_exception(error)
+                else:
+                    part.future.set_result(future.result())
+
+        combined.future.add_done_callback(resolve)
+        return combined
+
+    def _run(self, call: _Call) -> None:
+        if not call.future.set_running_or_notify_cancel():
+            return
+        with self._lock:
+            self.calls += 1
+        try:
+            result = call.func(*call.args, **call.kwargs)
+        except BaseException as e:
+            call.future.set_exception(e)
+        else:
+            call.future.set_result(result)
+
+    def _drain(self, key: str, queue: "collections.deque[_Call]") -> None:
+        self._local.key = key
+        try:
+            while True:
+                with self._lock:
+                    if not queue:
+                        del self._queues[key]
+                        return
+                    call = queue.popleft()
+                if call.future.cancelled():
+                    continue
+                if call.text is not None and self.coalesce_window:
+                    call = self._merge(call, queue)
+                self._run(call)
+                if self.interval:
+                    time.sleep(self.interval)
+        finally:
+            self._local.key = None
@@ -0,0 +1,143 @@
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Generic, Optional, TypeVar
+
+__all__ = ("Paginator",)
+
+T = TypeVar("T")
+
+Page = tuple[Sequence[T], Any]
+
+
+class Paginator(Generic[T]):
+    """
+    `Paginator` - Streams the items of a paginated endpoint page by page.
+
+    `**Parameters**`
+    - `fetch` - Fetches the page at a cursor and returns its items and the next cursor (`None` at the end).
+    - `cursor` - The cursor of the first page. `Defaults` to `None`.
+    - `limit` - The maximum number of items to yield. `Defaults` to `None` (no limit).
+    - `prefetch` - Whether or not to fetch the next page in the background while the current one is consumed. `Defaults` to `True`.
+    - `offset` - Whether or not the cursor is an item offset, which allows resuming in the middle of a page. `Defaults` to `False`.
+
+    After iterating (or breaking out of the loop), `cursor` points at the next
+    item to fetch, so a new paginator created with it resumes where this one
+    stopped. Token cursors can only resume at page boundaries.
+
+    `**Example**`
+    ```py
+    for user in bot.community.iter_users(limit=500):
+        print(user.username)
+    ```
+
+    """
+
+    __slots__ = ("fetch", "cursor", "limit", "prefetch", "offset", "count", "done")
+
+    def __init__(
+        self,
+        fetch: Callable[[Any], Page[T]],
+        cursor: Any = None,
+        limit: Optional[int] = None,
+        prefetch: bool = True,
+        offset: bool = False,
+    ) -> None:
+        self.fetch = fetch
+        self.cursor: Any = cursor
+        self.limit = limit
+        self.prefetch = prefetch
+        self.offset = offset
+        self.count = 0
+        self.done = False
+
+    @classmethod
+    def from_offset(
+        cls,
+        fetch: Callable[[int, int], Iterable[T]],
+        start: int = 0,
+        size: int = 25,
+        limit: Optional[int] = None,
+        prefetch: bool = True,
+    ) -> "Paginator[T]":
+        """
+        Creates a paginator for a `start`/`size` endpoint.
+
+        `**Parameters**`
+        - `fetch` - Fetches `size` items from `start`.
+        - `start` - The offset to start from. `Defaults` to `0`.
+        - `size` - The number of items per page. `Defaults` to `25`.
+        - `limit` - The maximum number of items to yield. `Defaults` to `None`.
+        - `prefetch` - Whether or not to prefetch the next page. `Defaults` to `True`.
+
+        A page shorter than `size` ends the iteration.
+
+        """
+
+        def page(cursor: int) -> Page[T]:
+            items = list(fetch(cursor, size))
+            return items, cursor + len(items) if len(items) >= size else None
+
+        return cls(page, start, limit, prefetch, offset=True)
+
+    @classmethod
+    def from_token(
+        cls,
+        fetch: Callable[[Optional[str], int], tuple[Iterable[T], Optional[str]]],
+        pageToken: Optional[str] = None,
+        size: int = 25,
+        limit: Optional[int] = None,
+        prefetch: bool = True,
+    ) -> "Paginator[T]":
+        """
+        Creates a paginator for a `pageToken`/`size` endpoint.
+
+        `**Parameters**`
+        - `fetch` - Fetches `size` items at `pageToken` and returns them with the next page token.
+        - `pageToken` - The token of the first page. `Defaults` to `None`.
+        - `size` - The number of items per page. `Defaults` to `25`.
+        - `limit` - The maximum number of items to yield. `Defaults` to `None`.
+        - `prefetch` - Whether or not to prefetch the next page. `Defaults` to `True`.
+
+        """
+
+        def page(cursor: Optional[str]) -> Page[T]:
+            items, next_token = fetch(cursor, size)
+            return list(items), next_token or None
+
+        return cls(page, pageToken, limit, prefetch)
+
+    def _limited(self) -> bool:
+        return self.limit is not None and self.count >= self.limit
+
+    def __iter__(self) -> Iterator[T]:
+        executor = ThreadPoolExecutor(max_workers=1) if self.prefetch else None
+        pending: Optional[Future[Page[T]]] = None
+        try:
+            while not self.done and not self._limited():
+                cursor: Any = self.cursor
+                next_cursor: Any
+                if pending is not None:
+                    items, next_cursor = pending.result()
+                    pending = None
+                else:
+                    items, next_cursor = self.fetch(cursor)
+                if not items:
+                    next_cursor = None
+                if (
+                    executor is not None
+                    and next_cursor is not None
+                    and (self.limit is None or self.count + len(items) < self.limit)
+                ):
+                    pending = executor.submit(self.fetch, next_cursor)
+                for index, item in enumerate(items):
+                    if self._limited():
+                        return None
+                    self.count += 1
+                    if self.offset:
+                        self.cursor = (cursor or 0) + index + 1
+                    yield item
+                self.cursor = next_cursor
+                self.done = next_cursor is None
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,87 @@
+import threading
+import time
+from typing import Optional
+
+__all__ = ("RateLimiter",)
+
+
+class RateLimiter:
+    """
+    `RateLimiter` - A thread-safe token bucket.
+
+    `**Parameters**`
+    - `rate` - The number of requests allowed per second. `0` disables the limit. `Defaults` to `5`.
+    - `burst` - The number of requests that can be made at once. `Defaults` to `rate`.
+
+    `**Example**`
+    ```py
+    limiter = RateLimiter(rate=2)
+    for chatId in chatIds:
+        limiter.acquire()
+        bot.community.send_message(chatId, "Hello!")
+    ```
+
+    """
+
+    __slots__ = ("rate", "burst", "_tokens", "_updated", "_lock")
+
+    def __init__(self, rate: float = 5.0, burst: Optional[float] = None) -> None:
+        self.rate = rate
+        self.burst = max(burst or rate, 1.0)
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def try_acquire(self, tokens: float = 1.0) -> bool:
+        """
+        Takes tokens from the bucket without waiting.
+
+        `**Parameters**`
+        - `tokens` - The number of tokens to take. `Defaults` to `1`.
+
+        `**Returns**`
+        - `bool` - Whether or not the tokens were taken.
+
+        """
+        if self.rate <= 0:
+            return True
+        with self._lock:
+            self._refill()
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return True
+            return False
+
+    def acquire(self, tokens: float = 1.0, timeout: Optional[float] = None) -> bool:
+        """
+        Takes tokens from the bucket, waiting until they are available.
+
+        `**Parameters**`
+        - `tokens` - The number of tokens to take. `Defaults` to `1`.
+        - `timeout` - The maximum number of seconds to wait. `Defaults` to `None` (no timeout).
+
+        `**Returns**`
+        - `bool` - Whether or not the tokens were taken before the timeout.
+
+        """
+        if self.rate <= 0:
+            return True
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return True
+                delay = (tokens - self._tokens) / self.rate
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                delay = min(delay, remaining)
+            time.sleep(delay)
@@ -1,4 +1,7 @@
+import collections
+import hashlib
 import logging
+import threading
 import urllib.parse
 import uuid
 from typing import Any, Optional, Union
@@ -25,6 +28,10 @@ class RequestHandler:
         "response_map",
         "email",
         "password",
+        "session",
+        "signature_cache_size",
+        "_signature_cache",
+        "_signature_lock",
     )
 
     def __init__(
@@ -44,6 +51,12 @@ class RequestHandler:
         }
         self.email: Optional[str] = None
         self.password: Optional[str] = None
+        self.session = utilities.SessionManager(self)
+        self.signature_cache_size = 256
+        self._signature_cache: collections.OrderedDict[tuple[bytes, str], str] = (
+            collections.OrderedDict()
+        )
+        self._signature_lock = threading.Lock()
 
     def service_url(self, url: str) -> str:
         """
@@ -147,6 +160,11 @@ class RequestHandler:
                 url += "&"
             url += urllib.parse.urlencode(params)
 
+        if is_login_required and self.session.refreshing:
+            self.session.wait()
+
+        sid = self.bot.sid
+
         if isinstance(data, dict) and self.bot.userId:
             data.update({"uid": self.bot.userId})
 
@@ -165,7 +183,9 @@ class RequestHandler:
 
         self.print_response(method=method, url=url, status_code=status_code)
 
-        response = self.handle_response(status_code=status_code, response=content)
+        response = self.handle_response(
+            status_code=status_code, response=content, sid=sid
+        )
 
         if response is None:
             response = self.handler(method, url, data=data, content_type=content_type)
@@ -229,33 +249,62 @@ class RequestHandler:
         )
 
         if self.bot.userId:
-            headers["NDC-MESSAGE-SIGNATURE"] = self.generate.ndc_message_signature(
+            headers["NDC-MESSAGE-SIGNATURE"] = self.message_signature(
                 data, self.bot.userId
             )
 
         return headers, data
 
-    def raise_error(self, response: dict[str, Any]) -> None:
+    def message_signature(self, data: bytes, userId: str) -> str:
+        """
+        Fetches the message signature of a body, reusing it if the same body was signed before.
+
+        `**Parameters**``
+        - `data` - The body to sign.
+        - `userId` - The user ID the body is signed for.
+
+        `**Returns**``
+        - `str` - The message signature.
+
+        """
+        key = (hashlib.sha1(data).digest(), userId)
+        with self._signature_lock:
+            signature = self._signature_cache.get(key)
+            if signature is not None:
+                self._signature_cache.move_to_end(key)
+                return signature
+        signature = self.generate.ndc_message_signature(data, userId)
+        with self._signature_lock:
+            self._signature_cache[key] = signature
+            while len(self._signature_cache) > self.signature_cache_size:
+                self._signature_cache.popitem(last=False)
+        return signature
+
+    def raise_error(
+        self,
+        response: dict[str, Any],
+        sid: Optional[str] = None,
+    ) -> None:
         """
         Raises an error if an error is in the response
 
         `**Parameters**``
         - `response` - The response from the request.
+        - `sid` - The session ID the request was sent with.
 
         `**Returns**``
         - `None` - Raises an error if the status code is in the response map.
-        - `404` - Returns 404 if the status code is 105 and the email and password is set.
+        - `None` - Returns None if the status code is 105 and the session was refreshed.
 
         """
-        if (
-            response.get("api:statuscode", 200) == 105
-            and self.email
-            and self.password
-            and self.bot.sid
-            and entities.SID(self.bot.sid).expired
-        ):
-            self.bot.run(self.email, self.password, use_cache=False)
-            return None
+        if response.get("api:statuscode", 200) == 105 and self.session.can_refresh:
+            stale_sid = sid or self.bot.sid
+            if (
+                stale_sid
+                and (stale_sid != self.bot.sid or self.session.expired())
+                and self.session.refresh(stale_sid)
+            ):
+                return None
 
         logger.debug(f"Exception: {response}")
         entities.APIException(response)
@@ -264,6 +313,7 @@ class RequestHandler:
         self,
         status_code: int,
         response: str,
+        sid: Optional[str] = None,
     ) -> Optional[dict[str, Any]]:
         """
         Handles the response and returns the response as a dict.
@@ -271,6 +321,7 @@ class RequestHandler:
         `**Parameters**``
         - `status_code` - The status code of the response.
         - `response` - The response to handle.
+        - `sid` - The session ID the request was sent with.
 
         `**Returns**``
         - `dict` - The response as a dict.
@@ -280,7 +331,7 @@ class RequestHandler:
             raise self.response_map[status_code]
         data = ujson.loads(response)
         if status_code != 200:
-            self.raise_error(data)
+            self.raise_error(data, sid)
             data = None
 
         return data
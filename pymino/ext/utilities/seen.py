@@ -0,0 +1,71 @@
+import collections
+import threading
+import time
+from collections.abc import Hashable
+
+__all__ = ("SeenSet",)
+
+
+class SeenSet:
+    """
+    `SeenSet` - A bounded, time-windowed set of recently seen keys.
+
+    `**Parameters**`
+    - `maxsize` - The maximum number of keys remembered. `Defaults` to `4096`.
+    - `ttl` - The number of seconds a key is remembered for. `Defaults` to `600`.
+
+    Keys are kept in insertion order, so expiring and evicting only ever
+    touches the oldest entries and every check is O(1).
+
+    `**Example**`
+    ```py
+    seen = SeenSet()
+    if seen.add(message.messageId):
+        handle(message)
+    ```
+
+    """
+
+    __slots__ = ("maxsize", "ttl", "_keys", "_lock")
+
+    def __init__(self, maxsize: int = 4096, ttl: float = 600.0) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._keys: collections.OrderedDict[Hashable, float] = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            seen_at = self._keys.get(key)
+            return seen_at is not None and time.monotonic() - seen_at < self.ttl
+
+    def add(self, key: Hashable) -> bool:
+        """
+        Marks a key as seen.
+
+        `**Parameters**`
+        - `key` - The key to mark.
+
+        `**Returns**`
+        - `bool` - `True` if the key was not seen within `ttl`, `False` if it is a duplicate.
+
+        """
+        now = time.monotonic()
+        with self._lock:
+            while self._keys:
+                oldest, seen_at = next(iter(self._keys.items()))
+                if now - seen_at < self.ttl and len(self._keys) < self.maxsize:
+                    break
+                del self._keys[oldest]
+            if key in self._keys:
+                return False
+            self._keys[key] = now
+            return True
+
+    def clear(self) -> None:
+        """Forgets every key."""
+        with self._lock:
+            self._keys.clear()
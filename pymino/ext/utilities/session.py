@@ -0,0 +1,143 @@
+import logging
+import threading
+import time
+from typing import Optional
+
+from pymino.ext import entities, utilities
+
+__all__ = ("SessionManager",)
+
+logger = logging.getLogger("pymino")
+
+
+class SessionManager:
+    """
+    `SessionManager` - Keeps the session alive by refreshing it before it expires.
+
+    `**Parameters**`
+    - `request` - The request handler whose session is managed.
+    - `refresh_margin` - Seconds before `SID.expireTime` to refresh the session. `Defaults` to `600`.
+    - `wait_timeout` - Maximum seconds a request is parked while a refresh is running. `Defaults` to `30`.
+
+    Concurrent expiry detections collapse into a single login: the first caller
+    performs it and every other request thread waits until it has finished.
+
+    """
+
+    __slots__ = (
+        "request",
+        "refresh_margin",
+        "wait_timeout",
+        "_done",
+        "_lock",
+        "_owner",
+        "_thread",
+    )
+
+    def __init__(
+        self,
+        request: "utilities.RequestHandler",
+        refresh_margin: float = 600.0,
+        wait_timeout: float = 30.0,
+    ) -> None:
+        self.request = request
+        self.refresh_margin = refresh_margin
+        self.wait_timeout = wait_timeout
+        self._lock = threading.Lock()
+        self._done = threading.Event()
+        self._done.set()
+        self._owner: Optional[int] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def refreshing(self) -> bool:
+        """Whether or not a refresh is in progress."""
+        return not self._done.is_set()
+
+    @property
+    def can_refresh(self) -> bool:
+        """Whether or not the credentials needed to log in again are known."""
+        return bool(self.request.email and self.request.password)
+
+    def expire_time(self) -> Optional[float]:
+        """
+        Fetches the expiration time of the current session.
+
+        `**Returns**`
+        - `float` - The unix time the session expires at, or `None` if there is no valid session.
+
+        """
+        sid = self.request.bot.sid
+        if not sid:
+            return None
+        try:
+            return entities.SID(sid).expireTime
+        except ValueError:
+            return None
+
+    def expired(self) -> bool:
+        """Whether or not the current session has expired."""
+        expire_time = self.expire_time()
+        return expire_time is not None and time.time() >= expire_time
+
+    def wait(self) -> None:
+        """Parks the calling thread while another thread refreshes the session."""
+        if self._owner == threading.get_ident():
+            return None
+        if not self._done.wait(self.wait_timeout):
+            logger.debug("Timed out waiting for the session refresh.")
+
+    def refresh(self, stale_sid: Optional[str] = None) -> bool:
+        """
+        Logs in again, collapsing concurrent calls into a single login.
+
+        `**Parameters**`
+        - `stale_sid` - The session ID the caller saw expire. If the session has
+          already been replaced, no new login is performed.
+
+        `**Returns**`
+        - `bool` - Whether or not the session is usable after the call.
+
+        """
+        with self._lock:
+            if self.refreshing:
+                owner = False
+            elif stale_sid is not None and stale_sid != self.request.bot.sid:
+                return True
+            else:
+                owner = True
+                self._owner = threading.get_ident()
+                self._done.clear()
+        if not owner:
+            self.wait()
+            return not self.refreshing
+        try:
+            logger.debug("Refreshing session.")
+            self.request.bot.refresh_login()
+            return True
+        except Exception as exc:
+            logger.debug(f"Failed to refresh session: {exc}")
+            return False
+        finally:
+            self._owner = None
+            self._done.set()
+
+    def start(self) -> None:
+        """Starts the background thread that refreshes the session before it expires."""
+        with self._lock:
+            if self._thread and self._thread.is_alive():
+                return None
+            self._thread = threading.Thread(target=self._refresh_loop, daemon=True)
+            self._thread.start()
+
+    def _refresh_loop(self) -> None:
+        while self.request.bot.sid and self.can_refresh:
+            expire_time = self.expire_time()
+            if expire_time is None:
+                return None
+            delay = expire_time - self.refresh_margin - time.time()
+            if delay > 0:
+                time.sleep(min(delay, 60.0))
+                continue
+            if not self.refresh(self.request.bot.sid):
+                time.sleep(min(self.refresh_margin / 4, 60.0))
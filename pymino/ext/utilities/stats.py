@@ -0,0 +1,219 @@
+import collections
+import logging
+import sys
+import threading
+import time
+from collections.abc import Generator
+from contextlib import contextmanager
+from typing import Any, Optional
+
+__all__ = ("HandlerStats", "SamplingProfiler")
+
+logger = logging.getLogger("pymino")
+
+
+class _Timings:
+    __slots__ = ("calls", "errors", "total", "maximum", "samples")
+
+    def __init__(self, window: int) -> None:
+        self.calls = 0
+        self.errors = 0
+        self.total = 0.0
+        self.maximum = 0.0
+        self.samples: collections.deque[float] = collections.deque(maxlen=window)
+
+    def percentile(self, ordered: list[float], percent: float) -> float:
+        if not ordered:
+            return 0.0
+        return ordered[min(len(ordered) - 1, int(len(ordered) * percent / 100))]
+
+    def json(self, name: str) -> dict[str, Any]:
+        ordered = sorted(self.samples)
+        return {
+            "name": name,
+            "calls": self.calls,
+            "errors": self.errors,
+            "total": self.total,
+            "mean": self.total / self.calls if self.calls else 0.0,
+            "max": self.maximum,
+            "p50": self.percentile(ordered, 50),
+            "p95": self.percentile(ordered, 95),
+            "p99": self.percentile(ordered, 99),
+        }
+
+
+class HandlerStats:
+    """
+    `HandlerStats` - Invocation counts, errors and latencies per handler.
+
+    `**Parameters**`
+    - `slow_threshold` - The number of seconds after which a call is logged as slow. `Defaults` to `1.0`.
+    - `window` - The number of recent latencies kept per handler for percentiles. `Defaults` to `1024`.
+
+    `**Example**`
+    ```py
+    stats = HandlerStats()
+    with stats.measure("command:ping"):
+        ping()
+    print(stats.report())
+    ```
+
+    """
+
+    __slots__ = ("slow_threshold", "window", "enabled", "_handlers", "_lock")
+
+    def __init__(self, slow_threshold: Optional[float] = 1.0, window: int = 1024) -> None:
+        self.slow_threshold = slow_threshold
+        self.window = window
+        self.enabled = True
+        self._handlers: dict[str, _Timings] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._handlers)
+
+    def record(self, name: str, elapsed: float, error: bool = False) -> None:
+        """
+        Records one call of a handler.
+
+        `**Parameters**`
+        - `name` - The name of the handler.
+        - `elapsed` - The duration of the call in seconds.
+        - `error` - Whether or not the call raised. `Defaults` to `False`.
+
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            timings = self._handlers.get(name)
+            if timings is None:
+                timings = self._handlers[name] = _Timings(self.window)
+            timings.calls += 1
+            timings.errors += error
+            timings.total += elapsed
+            timings.maximum = max(timings.maximum, elapsed)
+            timings.samples.append(elapsed)
+        if self.slow_threshold is not None and elapsed >= self.slow_threshold:
+            logger.warning(f"Slow handler {name} took {elapsed:.3f}s")
+
+    @contextmanager
+    def measure(self, name: str) -> Generator[None, None, None]:
+        """Records the duration of the block, counting an exception as an error."""
+        started = time.perf_counter()
+        try:
+            yield None
+        except BaseException:
+            self.record(name, time.perf_counter() - started, error=True)
+            raise
+        self.record(name, time.perf_counter() - started)
+
+    def report(self, sort_by: str = "total") -> list[dict[str, Any]]:
+        """
+        Summarizes every handler.
+
+        `**Parameters**`
+        - `sort_by` - The field the handlers are ranked by, descending. `Defaults` to `total`.
+
+        `**Returns**`
+        - `list[dict]` - The name, calls, errors, total, mean, max, p50, p95 and p99 of each handler.
+
+        """
+        with self._lock:
+            rows = [timings.json(name) for name, timings in self._handlers.items()]
+        return sorted(rows, key=lambda row: row[sort_by], reverse=True)
+
+    def reset(self) -> None:
+        """Forgets every recorded call."""
+        with self._lock:
+            self._handlers.clear()
+
+
+class SamplingProfiler:
+    """
+    `SamplingProfiler` - Samples the stacks of every thread at a fixed interval.
+
+    `**Parameters**`
+    - `interval` - The number of seconds between samples. `Defaults` to `0.005`.
+    - `depth` - The number of innermost frames kept per sample. `Defaults` to `1`.
+
+    The profiled code is never instrumented, so the overhead stays constant and
+    low enough to leave the profiler running in production for a while.
+
+    """
+
+    __slots__ = ("interval", "depth", "samples", "_counts", "_lock", "_stop", "_thread")
+
+    def __init__(self, interval: float = 0.005, depth: int = 1) -> None:
+        self.interval = interval
+        self.depth = depth
+        self.samples = 0
+        self._counts: collections.Counter[tuple[str, ...]] = collections.Counter()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def running(self) -> bool:
+        """Whether or not the profiler is sampling."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Starts sampling."""
+        if self.running:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="pymino-profiler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stops sampling. The collected samples are kept."""
+        self._stop.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+        self._thread = None
+
+    def _run(self) -> None:
+        own = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            stacks: list[tuple[str, ...]] = []
+            # No public API exposes the frames of other threads; CPython and PyPy both provide this one.
+            frames = sys._current_frames()  # pyright: ignore[reportPrivateUsage]
+            for ident, frame in frames.items():
+                if ident == own:
+                    continue
+                stack: list[str] = []
+                current: Any = frame
+                while current is not None and len(stack) < self.depth:
+                    code = current.f_code
+                    stack.append(f"{code.co_filename}:{current.f_lineno}:{code.co_name}")
+                    current = current.f_back
+                stacks.append(tuple(stack))
+            with self._lock:
+                self.samples += 1
+                self._counts.update(stacks)
+
+    def report(self, top: int = 20) -> list[dict[str, Any]]:
+        """
+        Ranks the most sampled locations.
+
+        `**Parameters**`
+        - `top` - The number of locations returned. `Defaults` to `20`.
+
+        `**Returns**`
+        - `list[dict]` - The stack, sample count and share of samples of each location.
+
+        """
+        with self._lock:
+            samples = self.samples or 1
+            return [
+                {"stack": list(stack), "samples": count, "percent": 100 * count / samples}
+                for stack, count in self._counts.most_common(top)
+            ]
+
+    def reset(self) -> None:
+        """Forgets every sample."""
+        with self._lock:
+            self.samples = 0
+            self._counts.clear()
@@ -0,0 +1,292 @@
+import collections
+import re
+import threading
+import unicodedata
+from collections.abc import Hashable, Iterable, Iterator
+from typing import Any, Generic, Optional, TypeVar, Union
+
+__all__ = ("KeywordAutomaton", "PatternMatcher", "TriggerEngine")
+
+T = TypeVar("T", bound=Hashable)
+
+BACKREFERENCE = re.compile(r"\\\d|\(\?P=")
+
+
+class KeywordAutomaton(Generic[T]):
+    """
+    `KeywordAutomaton` - An Aho-Corasick automaton over a set of keywords.
+
+    `**Parameters**`
+    - `case_sensitive` - Whether or not keywords are matched case sensitively. `Defaults` to `False`.
+
+    Every keyword is found in a single pass over the text, so matching costs the
+    same whether one or ten thousand keywords are registered.
+
+    `**Example**`
+    ```py
+    automaton = KeywordAutomaton()
+    automaton.add("hello", "greeting")
+    list(automaton.iter_matches("Hello world")) # [(0, 5, "hello", "greeting")]
+    ```
+
+    """
+
+    __slots__ = ("case_sensitive", "_keywords", "_goto", "_fail", "_output", "_lock")
+
+    def __init__(self, case_sensitive: bool = False) -> None:
+        self.case_sensitive = case_sensitive
+        self._keywords: dict[str, list[T]] = {}
+        self._goto: list[dict[str, int]] = []
+        self._fail: list[int] = []
+        self._output: list[list[str]] = []
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._keywords)
+
+    def add(self, keyword: str, value: T) -> None:
+        """
+        Adds a keyword to the automaton.
+
+        `**Parameters**`
+        - `keyword` - The keyword to match.
+        - `value` - The value reported when the keyword is found.
+
+        """
+        if not keyword:
+            raise ValueError("Keywords cannot be empty.")
+        if not self.case_sensitive:
+            keyword = keyword.lower()
+        with self._lock:
+            self._keywords.setdefault(keyword, []).append(value)
+            self._goto = []
+
+    def _build(self) -> None:
+        goto: list[dict[str, int]] = [{}]
+        output: list[list[str]] = [[]]
+        for keyword in self._keywords:
+            state = 0
+            for char in keyword:
+                next_state = goto[state].get(char)
+                if next_state is None:
+                    next_state = len(goto)
+                    goto[state][char] = next_state
+                    goto.append({})
+                    output.append([])
+                state = next_state
+            output[state].append(keyword)
+
+        fail = [0] * len(goto)
+        queue = collections.deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in goto[state].items():
+                queue.append(next_state)
+                fallback = fail[state]
+                while fallback and char not in goto[fallback]:
+                    fallback = fail[fallback]
+                fail[next_state] = goto[fallback].get(char, 0)
+                output[next_state] = output[next_state] + output[fail[next_state]]
+
+        self._fail, self._output, self._goto = fail, output, goto
+
+    def iter_matches(self, text: str) -> Iterator[tuple[int, int, str, T]]:
+        """
+        Finds every occurrence of every keyword in a text.
+
+        `**Parameters**`
+        - `text` - The text to search.
+
+        `**Returns**`
+        - `Iterator[tuple[int, int, str, T]]` - The start, end, keyword and value of each occurrence.
+          Without `case_sensitive`, the offsets index `text.lower()`, which can differ in length from `text`.
+
+        """
+        with self._lock:
+            if not self._keywords:
+                return
+            if not self._goto:
+                self._build()
+            goto, fail, output, keywords = self._goto, self._fail, self._output, self._keywords
+        if not self.case_sensitive:
+            text = text.lower()
+        state = 0
+        for index, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for keyword in output[state]:
+                start = index + 1 - len(keyword)
+                for value in keywords[keyword]:
+                    yield start, index + 1, keyword, value
+
+
+class PatternMatcher(Generic[T]):
+    """
+    `PatternMatcher` - Matches a set of regular expressions against a text.
+
+    All patterns are merged into one alternation that is searched first, so texts
+    matching none of them cost a single regex search. Only when it finds something
+    are the individual patterns checked.
+
+    """
+
+    __slots__ = ("_patterns", "_combined", "_lock")
+
+    def __init__(self) -> None:
+        self._patterns: list[tuple["re.Pattern[str]", T]] = []
+        self._combined: Optional["re.Pattern[str]"] = None
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._patterns)
+
+    def add(self, pattern: Union[str, "re.Pattern[str]"], value: T, flags: int = 0) -> None:
+        """
+        Adds a pattern to the matcher.
+
+        `**Parameters**`
+        - `pattern` - The regular expression to match.
+        - `value` - The value reported when the pattern matches.
+        - `flags` - The regex flags used to compile `pattern` if it is a string. `Defaults` to `0`.
+
+        """
+        compiled = re.compile(pattern, flags) if isinstance(pattern, str) else pattern
+        with self._lock:
+            self._patterns.append((compiled, value))
+            self._combined = self._combine(self._patterns)
+
+    @staticmethod
+    def _combine(patterns: list[tuple["re.Pattern[str]", Any]]) -> Optional["re.Pattern[str]"]:
+        scoped = re.IGNORECASE | re.MULTILINE | re.DOTALL | re.VERBOSE
+        parts: list[str] = []
+        for pattern, _ in patterns:
+            if pattern.flags & ~(scoped | re.UNICODE) or BACKREFERENCE.search(pattern.pattern):
+                return None
+            inline = "".join(
+                letter
+                for flag, letter in (
+                    (re.IGNORECASE, "i"),
+                    (re.MULTILINE, "m"),
+                    (re.DOTALL, "s"),
+                    (re.VERBOSE, "x"),
+                )
+                if pattern.flags & flag
+            )
+            parts.append(f"(?{inline}:{pattern.pattern})" if inline else f"(?:{pattern.pattern})")
+        try:
+            return re.compile("|".join(parts))
+        except re.error:
+            return None
+
+    def iter_matches(self, text: str) -> Iterator[tuple["re.Match[str]", T]]:
+        """
+        Finds the patterns that match a text.
+
+        `**Parameters**`
+        - `text` - The text to search.
+
+        `**Returns**`
+        - `Iterator[tuple[re.Match, T]]` - The first match and the value of each matching pattern.
+
+        """
+        with self._lock:
+            patterns, combined = self._patterns, self._combined
+        if not patterns or (combined is not None and combined.search(text) is None):
+            return
+        for pattern, value in patterns:
+            match = pattern.search(text)
+            if match is not None:
+                yield match, value
+
+
+class TriggerEngine(Generic[T]):
+    """
+    `TriggerEngine` - Keyword and regex triggers matched once per text.
+
+    Keywords are compiled into one case-insensitive and one case-sensitive
+    `KeywordAutomaton`, and patterns into a `PatternMatcher`.
+
+    """
+
+    __slots__ = ("_keywords", "_case_sensitive", "_whole_word", "_patterns")
+
+    def __init__(self) -> None:
+        self._keywords: KeywordAutomaton[T] = KeywordAutomaton()
+        self._case_sensitive: KeywordAutomaton[T] = KeywordAutomaton(case_sensitive=True)
+        self._whole_word: set[T] = set()
+        self._patterns: PatternMatcher[T] = PatternMatcher()
+
+    def __len__(self) -> int:
+        return len(self._keywords) + len(self._case_sensitive) + len(self._patterns)
+
+    def add_keywords(
+        self,
+        keywords: Iterable[str],
+        value: T,
+        case_sensitive: bool = False,
+        whole_word: bool = False,
+    ) -> None:
+        """
+        Adds keywords that trigger `value`.
+
+        `**Parameters**`
+        - `keywords` - The keywords to match.
+        - `value` - The value reported when any of the keywords is found.
+        - `case_sensitive` - Whether or not the keywords are case sensitive. `Defaults` to `False`.
+        - `whole_word` - Whether or not keywords only match whole words. `Defaults` to `False`.
+
+        """
+        automaton = self._case_sensitive if case_sensitive else self._keywords
+        for keyword in keywords:
+            automaton.add(keyword, value)
+        if whole_word:
+            self._whole_word.add(value)
+
+    def add_pattern(
+        self, pattern: Union[str, "re.Pattern[str]"], value: T, flags: int = 0
+    ) -> None:
+        """
+        Adds a regular expression that triggers `value`.
+
+        `**Parameters**`
+        - `pattern` - The regular expression to match.
+        - `value` - The value reported when the pattern matches.
+        - `flags` - The regex flags used to compile `pattern` if it is a string. `Defaults` to `0`.
+
+        """
+        self._patterns.add(pattern, value, flags)
+
+    def match(self, text: str) -> dict[T, dict[str, Any]]:
+        """
+        Matches every trigger against a text.
+
+        `**Parameters**`
+        - `text` - The text to match.
+
+        `**Returns**`
+        - `dict` - Maps each triggered value to `{"keywords": [...]}` and/or `{"match": re.Match}`.
+
+        """
+        triggered: dict[T, dict[str, Any]] = {}
+        for automaton in (self._keywords, self._case_sensitive):
+            searched = text if automaton.case_sensitive else text.lower()
+            for start, end, keyword, value in automaton.iter_matches(text):
+                if value in self._whole_word and not _is_whole_word(searched, start, end):
+                    continue
+                keywords = triggered.setdefault(value, {}).setdefault("keywords", [])
+                if keyword not in keywords:
+                    keywords.append(keyword)
+        for match, value in self._patterns.iter_matches(text):
+            triggered.setdefault(value, {})["match"] = match
+        return triggered
+
+
+def _is_whole_word(text: str, start: int, end: int) -> bool:
+    return (start == 0 or not _is_word(text[start - 1])) and (
+        end == len(text) or not _is_word(text[end])
+    )
+
+
+def _is_word(char: str) -> bool:
+    return char.isalnum() or char == "_" or unicodedata.category(char).startswith("M")
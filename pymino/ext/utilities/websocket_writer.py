@@ -0,0 +1,201 @@
+import collections
+import logging
+import threading
+import time
+from collections.abc import Callable
+from typing import Any, Optional, Union
+
+import ujson
+
+__all__ = ("WebsocketWriter",)
+
+logger = logging.getLogger("pymino")
+
+_dumps: Callable[[Any], str] = ujson.dumps  # pyright: ignore[reportUnknownMemberType, reportUnknownVariableType]
+
+Payload = Union[dict[str, Any], bytes, str]
+
+
+class _Frame:
+    __slots__ = ("data", "sent", "cancelled")
+
+    def __init__(self, data: Union[bytes, str]) -> None:
+        self.data = data
+        self.sent = False
+        self.cancelled = False
+
+
+class WebsocketWriter:
+    """
+    `WebsocketWriter` - Sends websocket frames from a single writer thread.
+
+    `**Parameters**`
+    - `write` - Sends one encoded frame, returning `False` if it could not be sent.
+    - `window` - The number of seconds the send rate is measured over. `Defaults` to `60`.
+
+    Frames can be queued from any thread. Each one is encoded once, when it is
+    queued, and the writer sends everything queued since its last wake up in
+    one pass.
+
+    Typing indicators are reference counted per chat: only the first start and
+    the last stop are sent. A start that is still queued when its stop arrives
+    is dropped together with the stop.
+
+    Frames are not retried: a frame that `write` could not send, for example
+    while the socket is reconnecting, is dropped and counted in `dropped`.
+
+    `**Example**`
+    ```py
+    writer = WebsocketWriter(ws.send)
+    writer.send({"t": 116, "o": {"threadChannelUserInfoList": [], "id": 1}})
+    print(writer.stats())
+    ```
+
+    """
+
+    __slots__ = (
+        "write",
+        "window",
+        "sent",
+        "bytes_sent",
+        "coalesced",
+        "dropped",
+        "errors",
+        "_queue",
+        "_typing",
+        "_history",
+        "_condition",
+        "_thread",
+    )
+
+    def __init__(
+        self,
+        write: Callable[[Union[bytes, str]], bool],
+        window: float = 60.0,
+    ) -> None:
+        self.write = write
+        self.window = window
+        self.sent = 0
+        self.bytes_sent = 0
+        self.coalesced = 0
+        self.dropped = 0
+        self.errors = 0
+        self._queue: collections.deque[_Frame] = collections.deque()
+        self._typing: dict[str, tuple[int, Optional[_Frame]]] = {}
+        self._history: collections.deque[float] = collections.deque()
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+    @staticmethod
+    def encode(message: Payload) -> Union[bytes, str]:
+        """Encodes a payload to JSON, leaving already encoded frames untouched."""
+        if isinstance(message, (bytes, str)):
+            return message
+        return _dumps(message)
+
+    def _enqueue(self, frame: _Frame) -> None:
+        self._queue.append(frame)
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(
+                target=self._run, name="pymino-websocket-writer", daemon=True
+            )
+            self._thread.start()
+        self._condition.notify()
+
+    def send(self, message: Payload) -> None:
+        """
+        Queues a frame.
+
+        `**Parameters**`
+        - `message` - The payload, or an already encoded frame.
+
+        """
+        frame = _Frame(self.encode(message))
+        with self._condition:
+            self._enqueue(frame)
+
+    def typing(self, key: str, message: Payload, active: bool) -> None:
+        """
+        Queues a typing start or stop frame, skipping redundant ones.
+
+        `**Parameters**`
+        - `key` - The chat the indicator belongs to.
+        - `message` - The start or stop frame.
+        - `active` - `True` for a start frame, `False` for a stop frame.
+
+        """
+        data = self.encode(message)
+        with self._condition:
+            count, start = self._typing.get(key, (0, None))
+            if active:
+                if count:
+                    self.coalesced += 1
+                else:
+                    start = _Frame(data)
+                    self._enqueue(start)
+                self._typing[key] = (count + 1, start)
+                return
+            if count > 1:
+                self._typing[key] = (count - 1, start)
+                self.coalesced += 1
+                return
+            self._typing.pop(key, None)
+            if start is not None and not start.sent:
+                start.cancelled = True
+                self.coalesced += 2
+                return
+            self._enqueue(_Frame(data))
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._queue:
+                    self._condition.wait()
+                batch = list(self._queue)
+                self._queue.clear()
+                for frame in batch:
+                    frame.sent = True
+            for frame in batch:
+                if not frame.cancelled:
+                    self._write(frame.data)
+
+    def _write(self, data: Union[bytes, str]) -> None:
+        try:
+            written = self.write(data)
+        except Exception as e:
+            self.errors += 1
+            logger.debug(f"Failed to send websocket message: {e}")
+            return
+        if not written:
+            self.dropped += 1
+            return
+        now = time.monotonic()
+        self.sent += 1
+        self.bytes_sent += len(data)
+        self._history.append(now)
+        while self._history and self._history[0] < now - self.window:
+            self._history.popleft()
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Returns the writer metrics.
+
+        `**Returns**`
+        - `dict` - The `sent`, `bytes_sent`, `coalesced`, `dropped` and `errors`
+          counts, the `pending` frames and the send `rate` in frames per second over `window`.
+
+        """
+        now = time.monotonic()
+        recent = sum(1 for sent in list(self._history) if sent >= now - self.window)
+        return {
+            "sent": self.sent,
+            "bytes_sent": self.bytes_sent,
+            "coalesced": self.coalesced,
+            "dropped": self.dropped,
+            "errors": self.errors,
+            "pending": len(self._queue),
+            "rate": recent / self.window,
+        }
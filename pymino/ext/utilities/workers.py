@@ -0,0 +1,47 @@
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, TypeVar
+
+__all__ = ("MAX_WORKERS", "map_concurrent")
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+MAX_WORKERS = 4
+
+
+def map_concurrent(
+    func: Callable[[T], R],
+    items: Sequence[T],
+    max_workers: int = MAX_WORKERS,
+) -> tuple[list[Optional[R]], dict[int, Exception]]:
+    """
+    Calls `func` on every item using a bounded thread pool.
+
+    `**Parameters**`
+    - `func` - The function to call on each item.
+    - `items` - The items to process.
+    - `max_workers` - The maximum number of concurrent calls. `Defaults` to `4`.
+
+    `**Returns**`
+    - `tuple` - The results in the order of `items` (`None` where a call failed)
+      and a dict mapping the index of every failed item to its exception.
+
+    """
+    results: list[Optional[R]] = [None] * len(items)
+    errors: dict[int, Exception] = {}
+    if len(items) <= 1 or max_workers <= 1:
+        for index, item in enumerate(items):
+            try:
+                results[index] = func(item)
+            except Exception as exc:
+                errors[index] = exc
+        return results, errors
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        futures = [executor.submit(func, item) for item in items]
+        for index, future in enumerate(futures):
+            try:
+                results[index] = future.result()
+            except Exception as exc:
+                errors[index] = exc
+    return results, errors
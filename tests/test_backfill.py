@@ -0,0 +1,73 @@
+import collections
+import threading
+from types import SimpleNamespace
+from typing import Any
+
+from pymino.ext import entities, socket
+
+
+def chat_message(number: int, chatId: str = "chat") -> dict[str, Any]:
+    return {
+        "threadId": chatId,
+        "messageId": f"m{number}",
+        "createdTime": f"2024-01-01T00:00:{number:02}Z",
+    }
+
+
+class _Community:
+    def __init__(self, newest: int) -> None:
+        self.newest = newest
+        self.calls: list[tuple[str, int, int]] = []
+
+    def iter_messages(self, chatId: str, size: int, limit: int, comId: int) -> list[entities.CMessage]:
+        self.calls.append((chatId, limit, comId))
+        return [entities.CMessage(chat_message(n, chatId)) for n in range(self.newest, 0, -1)][:limit]
+
+
+def client(newest: int = 0) -> Any:
+    frames: list[dict[str, Any]] = []
+    return SimpleNamespace(
+        backfill_limit=100,
+        frames=frames,
+        community=_Community(newest),
+        dispatcher=SimpleNamespace(handle=frames.append),
+        _chat_lock=threading.Lock(),
+        _chat_cursors=collections.OrderedDict(),
+    )
+
+
+def track(fake: Any, payload: dict[str, Any]) -> None:
+    socket.WSClient._track_chat(fake, payload)  # pyright: ignore[reportPrivateUsage]
+
+
+def test_the_newest_message_of_each_chat_is_tracked() -> None:
+    fake = client()
+    track(fake, {"ndcId": 1, "chatMessage": chat_message(5)})
+    track(fake, {"ndcId": 1, "chatMessage": chat_message(3)})
+    track(fake, {"ndcId": 1, "chatMessage": {"threadId": "chat"}})
+    assert fake._chat_cursors == {"chat": (1, "m5", "2024-01-01T00:00:05Z")}
+
+
+def test_only_the_most_recent_chats_are_tracked() -> None:
+    fake = client()
+    for number in range(300):
+        track(fake, {"ndcId": 1, "chatMessage": chat_message(1, f"chat{number}")})
+    assert len(fake._chat_cursors) == 256
+    assert next(iter(fake._chat_cursors)) == "chat44"
+
+
+def test_missed_messages_are_replayed_oldest_first() -> None:
+    fake = client(newest=8)
+    track(fake, {"ndcId": 1, "chatMessage": chat_message(5)})
+    socket.WSClient._backfill_chats(fake)  # pyright: ignore[reportPrivateUsage]
+    assert fake.community.calls == [("chat", 100, 1)]
+    assert [frame["o"]["chatMessage"]["messageId"] for frame in fake.frames] == ["m6", "m7", "m8"]
+    assert all(frame["t"] == entities.WsMessageTypes.CHAT_MESSAGE_DTO for frame in fake.frames)
+
+
+def test_backfill_can_be_disabled() -> None:
+    fake = client(newest=8)
+    fake.backfill_limit = 0
+    track(fake, {"ndcId": 1, "chatMessage": chat_message(5)})
+    socket.WSClient._backfill_chats(fake)  # pyright: ignore[reportPrivateUsage]
+    assert fake.community.calls == []
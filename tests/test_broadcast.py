@@ -0,0 +1,83 @@
+import logging
+import threading
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from pymino.ext import community, entities, utilities
+
+
+class _Send:
+    def __init__(self, failures: dict[str, int]) -> None:
+        self.failures = failures
+        self.calls: list[str] = []
+        self.lock = threading.Lock()
+
+    def __call__(self, chatId: str) -> str:
+        with self.lock:
+            self.calls.append(chatId)
+            left = self.failures.get(chatId, 0)
+            self.failures[chatId] = left - 1
+        if chatId == "forbidden":
+            raise entities.Forbidden
+        if left > 0:
+            raise entities.ServiceUnavailable
+        return chatId
+
+
+def test_duplicate_chats_are_sent_once() -> None:
+    send = _Send({})
+    report = utilities.broadcast(send, ["a", "b", "a"])
+    assert [result.chatId for result in report] == ["a", "b"]
+    assert sorted(send.calls) == ["a", "b"]
+
+
+def test_transient_errors_are_retried() -> None:
+    send = _Send({"a": 2, "b": 5})
+    report = utilities.broadcast(send, ["a", "b"], retries=2, backoff=0)
+    assert [result.chatId for result in report.succeeded] == ["a"]
+    assert [result.attempts for result in report] == [3, 3]
+    assert list(report.json()["failed"]) == ["b"]
+
+
+def test_other_errors_are_not_retried() -> None:
+    report = utilities.broadcast(_Send({}), ["forbidden"], backoff=0)
+    [result] = report.failed
+    assert result.attempts == 1
+    assert isinstance(result.error, entities.Forbidden)
+
+
+def test_progress_errors_do_not_stop_the_broadcast(caplog: pytest.LogCaptureFixture) -> None:
+    counts: list[tuple[int, int]] = []
+
+    def progress(done: int, total: int, result: utilities.BroadcastResult) -> None:
+        counts.append((done, total))
+        raise RuntimeError
+
+    with caplog.at_level(logging.ERROR, logger="pymino"):
+        report = utilities.broadcast(_Send({}), ["a", "b", "c"], progress=progress)
+    assert len(report.succeeded) == 3
+    assert sorted(counts) == [(1, 3), (2, 3), (3, 3)]
+    assert "progress callback" in caplog.text
+
+
+def test_every_chat_gets_its_own_message_body() -> None:
+    bodies: list[dict[str, Any]] = []
+
+    def handler(method: str, url: str, data: dict[str, Any]) -> dict[str, Any]:
+        bodies.append(data)
+        return {"message": {"content": data["content"]}}
+
+    fake: Any = SimpleNamespace(
+        community_id=1,
+        bot=SimpleNamespace(
+            request=SimpleNamespace(handler=handler),
+            rate_limiter=utilities.RateLimiter(rate=0),
+        ),
+    )
+    report = community.Community.broadcast(fake, "hello", ["a", "b"], mentioned="user")
+    assert len(report.succeeded) == 2
+    assert bodies[0] is not bodies[1]
+    assert all(body["content"] == "hello" for body in bodies)
+    assert bodies[0]["extensions"] == {"mentionedArray": [{"uid": "user"}]}
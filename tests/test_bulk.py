@@ -0,0 +1,70 @@
+import threading
+import time
+from typing import Optional
+
+from pymino.ext import utilities
+
+ITEMS = list(range(100))
+
+
+class _Listing:
+    def __init__(self, items: list[int] = ITEMS) -> None:
+        self.items = items
+        self.offsets: list[int] = []
+        self.active = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, start: int, size: int) -> list[int]:
+        with self.lock:
+            self.offsets.append(start)
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(0.01)
+        with self.lock:
+            self.active -= 1
+        return self.items[start : start + size]
+
+
+def test_windows_are_fetched_concurrently_in_order() -> None:
+    listing = _Listing()
+    assert list(utilities.bulk_fetch(listing, size=10, parallelism=4)) == ITEMS
+    assert listing.peak > 1
+
+
+def test_limit_stops_requesting_windows() -> None:
+    listing = _Listing()
+    assert list(utilities.bulk_fetch(listing, size=10, limit=25)) == ITEMS[:25]
+    assert sorted(listing.offsets) == [0, 10, 20]
+
+
+def test_start() -> None:
+    assert list(utilities.bulk_fetch(_Listing(), start=95, size=10)) == ITEMS[95:]
+
+
+def test_key_drops_items_repeated_across_windows() -> None:
+    shifting = [0, 1, 2, 2, 3, 4, 4, 5]
+    fetched = utilities.bulk_fetch(_Listing(shifting), size=2, key=lambda item: item, limit=5)
+    assert list(fetched) == [0, 1, 2, 3, 4]
+
+
+def test_rate_limiter_is_acquired_per_window() -> None:
+    acquired: list[float] = []
+
+    class Limiter(utilities.RateLimiter):
+        def acquire(self, tokens: float = 1.0, timeout: Optional[float] = None) -> bool:
+            acquired.append(tokens)
+            return super().acquire(tokens, timeout)
+
+    limiter = Limiter(rate=1000)
+    assert list(utilities.bulk_fetch(_Listing(), size=50, rate_limiter=limiter)) == ITEMS
+    assert len(acquired) >= 3
+
+
+def test_rate_limiter_buckets() -> None:
+    limiter = utilities.RateLimiter(rate=1, burst=2)
+    assert limiter.try_acquire()
+    assert limiter.try_acquire()
+    assert not limiter.try_acquire()
+    assert not limiter.acquire(timeout=0.01)
+    assert utilities.RateLimiter(rate=0).try_acquire(100)
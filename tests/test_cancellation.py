@@ -0,0 +1,67 @@
+import threading
+import time
+from typing import Any
+
+import pytest
+
+from pymino import Bot
+from pymino.ext import entities, utilities
+
+
+def command_message(content: str) -> entities.Message:
+    chat_message = {"content": content, "threadId": "chat", "messageId": content, "uid": "user"}
+    return entities.Message({"t": 1000, "o": {"ndcId": 1, "chatMessage": chat_message}})
+
+
+def test_tokens() -> None:
+    token = utilities.CancellationToken()
+    called: list[str] = []
+    token.add_callback(lambda: called.append("before"))
+    assert not token.wait(0.001)
+    token.raise_if_cancelled()
+    token.cancel("stop")
+    token.cancel("again")
+    token.add_callback(lambda: called.append("after"))
+    assert token.cancelled and token.wait(0)
+    assert token.reason == "stop"
+    assert called == ["before", "after"]
+    with pytest.raises(entities.CommandCancelled):
+        token.raise_if_cancelled()
+
+
+def test_the_watchdog_cancels_overdue_commands() -> None:
+    timed_out = threading.Event()
+    watchdog = utilities.TimeoutWatchdog(lambda record: timed_out.set())
+    slow, fast = utilities.CancellationToken(), utilities.CancellationToken()
+    slow_record = utilities.TimeoutRecord("slow", 0.05)
+    fast_record = utilities.TimeoutRecord("fast", 0.01)
+    watchdog.watch(slow, slow_record)
+    watchdog.watch(fast, fast_record)
+    watchdog.finish(fast_record, 0.001)
+    assert slow.wait(5)
+    assert timed_out.wait(5)
+    assert slow.reason == "timeout"
+    assert not fast.cancelled
+    assert [record["name"] for record in watchdog.report()] == ["slow"]
+
+
+def test_commands_are_cancelled_at_their_timeout() -> None:
+    bot = Bot(service_key="x")
+    results: list[Any] = []
+
+    @bot.command("wait", timeout=0.05)
+    def wait(ctx: Any) -> None:
+        results.append(ctx.token.wait(5))
+        ctx.token.raise_if_cancelled()
+
+    @bot.command("fail", timeout=0.05)
+    def fail(ctx: Any) -> None:
+        raise RuntimeError("fail")
+
+    bot.register_event("error")(results.append)
+    for content in ("!wait", "!fail"):
+        bot._handle_event("text_message", command_message(content))  # pyright: ignore[reportPrivateUsage]
+    time.sleep(0.1)
+    assert results[0] is True
+    assert [str(result) for result in results[1:]] == ["fail"]
+    assert [record["name"] for record in bot.command_timeouts.report()] == ["wait"]
@@ -0,0 +1,42 @@
+from typing import Any
+
+from pymino import Bot
+from pymino.ext import entities
+
+
+def command_message(content: str) -> entities.Message:
+    return entities.Message(
+        {
+            "t": 1000,
+            "o": {
+                "ndcId": 1,
+                "chatMessage": {
+                    "content": content,
+                    "threadId": "chat",
+                    "messageId": content,
+                    "uid": "user",
+                    "author": {"uid": "user"},
+                    "type": 0,
+                    "mediaType": 0,
+                },
+            },
+        }
+    )
+
+
+def test_command_errors_go_to_the_error_handlers() -> None:
+    bot = Bot(service_key="x")
+    errors: list[Exception] = []
+    bot.register_event("error")(errors.append)
+
+    @bot.command("fail")
+    def fail(ctx: Any) -> None:
+        raise RuntimeError("fail")
+
+    @bot.command("slow", timeout=5)
+    def slow(ctx: Any) -> None:
+        raise RuntimeError("slow")
+
+    for content in ("!fail", "!slow"):
+        bot._handle_event("text_message", command_message(content))  # pyright: ignore[reportPrivateUsage]
+    assert [str(error) for error in errors] == ["fail", "slow"]
@@ -0,0 +1,59 @@
+import time
+
+import pytest
+
+from pymino.ext.utilities import Backoff, ConnectionMonitor
+
+
+def test_backoff_grows_up_to_the_maximum() -> None:
+    backoff = Backoff(initial=1, maximum=5, multiplier=2, jitter=0)
+    assert [backoff.next() for _ in range(5)] == [1, 2, 4, 5, 5]
+    backoff.reset()
+    assert backoff.next() == 1
+
+
+def test_backoff_jitter_stays_below_the_delay() -> None:
+    backoff = Backoff(initial=4, multiplier=1, jitter=0.5)
+    assert all(2 <= backoff.next() <= 4 for _ in range(100))
+
+
+def test_unstable_connections_keep_backing_off() -> None:
+    monitor = ConnectionMonitor(Backoff(initial=1, jitter=0), stable_after=60)
+    delays: list[float] = []
+    for _ in range(3):
+        monitor.connecting()
+        monitor.connected()
+        delays.append(monitor.disconnected())
+    assert delays == [1, 2, 4]
+    assert monitor.disconnects == 3
+
+
+def test_stable_connections_reset_the_backoff() -> None:
+    monitor = ConnectionMonitor(Backoff(initial=1, jitter=0), stable_after=0.05)
+    monitor.failed(OSError("refused"))
+    monitor.failed(OSError("refused"))
+    monitor.connecting()
+    monitor.connected()
+    time.sleep(0.1)
+    assert monitor.disconnected() == 1
+
+
+def test_ready_follows_the_connection() -> None:
+    monitor = ConnectionMonitor()
+    assert not monitor.wait(0)
+    monitor.connecting()
+    monitor.connected()
+    assert monitor.wait(0)
+    monitor.disconnected(OSError("closed"))
+    assert not monitor.wait(0)
+    assert monitor.stats()["last_error"] == "OSError('closed')"
+
+
+def test_only_the_last_ping_is_timed() -> None:
+    monitor = ConnectionMonitor()
+    monitor.ping_sent(1)
+    assert monitor.pong(2) is None
+    latency = monitor.pong(1)
+    assert latency is not None and latency >= 0
+    assert monitor.pong(1) is None
+    assert monitor.stats()["ping"]["last"] == pytest.approx(latency)
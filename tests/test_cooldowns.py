@@ -0,0 +1,91 @@
+import time
+from pathlib import Path
+
+import pytest
+
+from pymino.ext.utilities import CooldownStore, SQLiteCooldownStore
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def store(request: pytest.FixtureRequest, tmp_path: Path) -> CooldownStore:
+    if request.param == "memory":
+        return CooldownStore()
+    store = SQLiteCooldownStore(str(tmp_path / "cooldowns.db"))
+    request.addfinalizer(store.close)
+    return store
+
+
+def test_uses_within_the_limit_pass(store: CooldownStore) -> None:
+    assert store.hit("key", limit=3, window=60) == 0
+    assert store.hit("key", limit=3, window=60) == 0
+    assert store.hit("key", limit=3, window=60) == 0
+    assert 59 < store.hit("key", limit=3, window=60) <= 60
+
+
+def test_peek_does_not_use_the_key(store: CooldownStore) -> None:
+    assert store.peek("key", limit=1, window=60) == 0
+    assert store.hit("key", limit=1, window=60) == 0
+    assert store.peek("key", limit=1, window=60) > 0
+    assert store.peek("other", limit=1, window=60) == 0
+
+
+def test_rejected_uses_are_not_recorded(store: CooldownStore) -> None:
+    assert store.hit("key", limit=1, window=0.2) == 0
+    for _ in range(5):
+        assert store.hit("key", limit=1, window=0.2) > 0
+    time.sleep(0.25)
+    assert store.hit("key", limit=1, window=0.2) == 0
+
+
+def test_the_window_slides(store: CooldownStore) -> None:
+    assert store.hit("key", limit=2, window=0.3) == 0
+    time.sleep(0.15)
+    assert store.hit("key", limit=2, window=0.3) == 0
+    retry_after = store.hit("key", limit=2, window=0.3)
+    assert 0 < retry_after <= 0.15
+    time.sleep(retry_after + 0.02)
+    assert store.hit("key", limit=2, window=0.3) == 0
+    assert store.hit("key", limit=2, window=0.3) > 0
+
+
+def test_keys_are_independent(store: CooldownStore) -> None:
+    assert store.hit("a", limit=1, window=60) == 0
+    assert store.hit("b", limit=1, window=60) == 0
+    assert store.hit("a", limit=1, window=60) > 0
+
+
+def test_reset(store: CooldownStore) -> None:
+    store.hit("a", limit=1, window=60)
+    store.hit("b", limit=1, window=60)
+    store.reset("a")
+    assert store.peek("a", limit=1, window=60) == 0
+    assert store.peek("b", limit=1, window=60) > 0
+    store.reset()
+    assert store.peek("b", limit=1, window=60) == 0
+
+
+def test_expired_keys_are_evicted() -> None:
+    store = CooldownStore()
+    store.hit("key", limit=1, window=0.05)
+    time.sleep(0.1)
+    store.hit("other", limit=1, window=60)
+    assert len(store) == 1
+
+
+def test_the_least_recent_key_is_evicted_at_maxsize() -> None:
+    store = CooldownStore(maxsize=2)
+    for key in ("a", "b", "c", "d"):
+        store.hit(key, limit=1, window=60)
+    assert store.peek("a", limit=1, window=60) == 0
+    assert store.peek("d", limit=1, window=60) > 0
+
+
+def test_sqlite_stores_share_a_file(tmp_path: Path) -> None:
+    path = str(tmp_path / "cooldowns.db")
+    first, second = SQLiteCooldownStore(path), SQLiteCooldownStore(path)
+    try:
+        assert first.hit("key", limit=1, window=60) == 0
+        assert second.hit("key", limit=1, window=60) > 0
+    finally:
+        first.close()
+        second.close()
@@ -0,0 +1,85 @@
+import pytest
+
+from pymino.ext.utilities import DEFAULT_ENDPOINTS, EndpointPool
+
+
+def _pool(*handshakes: float) -> EndpointPool:
+    pool = EndpointPool([str(i) for i in range(len(handshakes))], explore=0)
+    for url, handshake in zip(pool.endpoints, handshakes):
+        pool.succeeded(url, handshake)
+    return pool
+
+
+def test_unmeasured_endpoints_are_tried_first() -> None:
+    pool = EndpointPool(["a", "b"], explore=0)
+    pool.succeeded("a", 0.01)
+    assert pool.select() == "b"
+
+
+def test_the_fastest_handshake_is_selected() -> None:
+    assert _pool(0.3, 0.1, 0.2).select() == "1"
+
+
+def test_pings_are_compared_once_every_endpoint_has_one() -> None:
+    pool = _pool(0.3, 0.1)
+    pool.measured("0", 0.05)
+    assert pool.select() == "1"
+    pool.measured("1", 0.2)
+    assert pool.select() == "0"
+
+
+def test_failed_endpoints_are_skipped() -> None:
+    pool = _pool(0.1, 0.3)
+    pool.failed("0", OSError("refused"))
+    assert pool.select() == "1"
+    assert not pool.endpoints["0"].healthy
+
+
+def test_cooldowns_double_per_failure_in_a_row() -> None:
+    pool = _pool(0.1, 0.3)
+    pool.failed("0", OSError("refused"))
+    first = pool.endpoints["0"].down_until
+    pool.failed("0", OSError("refused"))
+    assert pool.endpoints["0"].down_until - first == pytest.approx(pool.cooldown, abs=1)
+    pool.succeeded("0", 0.1)
+    assert pool.endpoints["0"].healthy
+
+
+def test_the_first_to_recover_is_selected_when_all_are_down() -> None:
+    pool = _pool(0.1, 0.3)
+    pool.failed("0", OSError("refused"))
+    pool.failed("0", OSError("refused"))
+    pool.failed("1", OSError("refused"))
+    assert pool.select() == "1"
+
+
+def test_a_slow_ping_is_degraded_against_faster_pings() -> None:
+    pool = _pool(0.1, 0.1)
+    pool.measured("1", 0.05)
+    assert not pool.measured("0", 0.1)
+    assert pool.measured("0", 2.0)
+
+
+def test_a_slow_ping_is_degraded_against_its_own_baseline() -> None:
+    pool = _pool(0.05, 0.6)
+    assert not pool.measured("0", 0.05)
+    assert pool.measured("0", 2.0)
+
+
+def test_pings_below_the_floor_are_never_degraded() -> None:
+    pool = _pool(0.05, 0.6)
+    pool.measured("0", 0.01)
+    assert not pool.measured("0", 0.1)
+
+
+def test_handshakes_and_pings_are_averaged_apart() -> None:
+    pool = _pool(0.5)
+    pool.measured("0", 0.1)
+    pool.succeeded("0", 1.5)
+    endpoint = pool.endpoints["0"]
+    assert endpoint.handshake == pytest.approx(0.8)
+    assert endpoint.ping == pytest.approx(0.1)
+
+
+def test_no_urls_fall_back_to_the_default_endpoints() -> None:
+    assert list(EndpointPool([]).endpoints) == list(DEFAULT_ENDPOINTS)
@@ -0,0 +1,56 @@
+import asyncio
+import threading
+from collections.abc import Generator
+from typing import Any
+
+from pymino import Bot
+from pymino.ext import entities, utilities
+
+
+class _Awaitable:
+    def __await__(self) -> Generator[Any, None, str]:
+        yield from asyncio.sleep(0).__await__()
+        return "awaited"
+
+
+def test_the_loop_starts_on_first_submit() -> None:
+    loop = utilities.EventLoopThread()
+    assert not loop.running
+    assert loop.submit(asyncio.sleep(0, result="done")).result(5) == "done"
+    assert loop.running
+    assert loop.submit(_Awaitable()).result(5) == "awaited"
+    loop.stop()
+    assert not loop.running
+
+
+def test_the_loop_restarts_after_stop() -> None:
+    loop = utilities.EventLoopThread()
+    loop.submit(asyncio.sleep(0)).result(5)
+    loop.stop()
+    assert loop.submit(asyncio.sleep(0, result="again")).result(5) == "again"
+    loop.stop()
+
+
+def test_async_handlers_run_on_the_loop() -> None:
+    bot = Bot(service_key="x")
+    threads: list[str] = []
+    errors: list[Exception] = []
+    done = threading.Event()
+
+    async def handler(members: entities.OnlineMembers) -> None:
+        threads.append(threading.current_thread().name)
+        raise RuntimeError("boom")
+
+    def error(exc: Exception) -> None:
+        errors.append(exc)
+        done.set()
+
+    bot.register_event("user_online")(handler)
+    bot.register_event("error")(error)
+    bot._handle_event(  # pyright: ignore[reportPrivateUsage]
+        "user_online", entities.OnlineMembers({"ndcId": 1, "userProfileList": [{}]})
+    )
+    assert done.wait(5)
+    bot.event_loop.stop()
+    assert threads == ["pymino-event-loop"]
+    assert [str(error) for error in errors] == ["boom"]
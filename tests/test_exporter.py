@@ -0,0 +1,87 @@
+import json
+import sqlite3
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Literal
+
+import pytest
+
+from pymino.ext import entities, utilities
+
+Format = Literal["sqlite", "jsonl"]
+
+
+def history(newest: int) -> Iterator[entities.CMessage]:
+    """The messages of a chat, newest first, like `iter_messages`."""
+    for number in range(newest, 0, -1):
+        yield entities.CMessage(
+            {
+                "messageId": f"m{number}",
+                "createdTime": f"2024-01-01T00:{number // 60:02}:{number % 60:02}Z",
+                "content": str(number),
+            }
+        )
+
+
+def exported(exporter: utilities.ChatExporter, path: Path) -> list[str]:
+    if exporter.format == "sqlite":
+        db = sqlite3.connect(path / "archive.db")
+        rows = db.execute("SELECT messageId FROM messages WHERE chatId = 'chat'").fetchall()
+        db.close()
+        return [row[0] for row in rows]
+    with open(path / "chat.jsonl", encoding="utf-8") as file:
+        return [json.loads(line)["messageId"] for line in file]
+
+
+def open_exporter(path: Path, format: Format) -> utilities.ChatExporter:
+    return utilities.ChatExporter(
+        str(path / "archive.db") if format == "sqlite" else str(path),
+        format=format,
+        batch_size=4,
+    )
+
+
+@pytest.mark.parametrize("format", ["sqlite", "jsonl"])
+def test_only_new_messages_are_exported(tmp_path: Path, format: Format) -> None:
+    with open_exporter(tmp_path, format) as exporter:
+        assert exporter.export("chat", history(10)) == 10
+        assert exporter.checkpoint("chat") == ("m10", "2024-01-01T00:00:10Z")
+        assert exporter.export("chat", history(10)) == 0
+        assert exporter.export("chat", history(13)) == 3
+        assert sorted(exported(exporter, tmp_path)) == sorted(f"m{n}" for n in range(1, 14))
+
+
+@pytest.mark.parametrize("format", ["sqlite", "jsonl"])
+def test_limited_runs_fill_the_gap_before_moving_on(tmp_path: Path, format: Format) -> None:
+    with open_exporter(tmp_path, format) as exporter:
+        assert exporter.export("chat", history(12)) == 12
+    with open_exporter(tmp_path, format) as exporter:
+        assert exporter.export("chat", history(30), limit=5) == 5
+        assert exporter.checkpoint("chat") == ("m12", "2024-01-01T00:00:12Z")
+        # m31 to m33 arrive while the gap from m25 down to m13 is still open.
+        assert exporter.export("chat", history(33), limit=5) == 5
+        assert exporter.export("chat", history(33), limit=5) == 5
+        assert exporter.export("chat", history(33), limit=5) == 3
+        assert exporter.checkpoint("chat") == ("m30", "2024-01-01T00:00:30Z")
+        assert exporter.export("chat", history(33), limit=5) == 3
+        assert exporter.checkpoint("chat") == ("m33", "2024-01-01T00:00:33Z")
+        assert exporter.export("chat", history(33), limit=5) == 0
+        ids = exported(exporter, tmp_path)
+    assert sorted(ids) == sorted(f"m{n}" for n in range(1, 34))
+
+
+def test_failed_runs_leave_no_trace(tmp_path: Path) -> None:
+    def failing() -> Iterator[entities.CMessage]:
+        yield from history(3)
+        raise ConnectionError
+
+    with open_exporter(tmp_path, "jsonl") as exporter:
+        with pytest.raises(ConnectionError):
+            exporter.export("chat", failing())
+        assert exporter.checkpoint("chat") is None
+        assert list(tmp_path.iterdir()) == []
+
+
+def test_unsupported_format(tmp_path: Path) -> None:
+    with pytest.raises(ValueError):
+        utilities.ChatExporter(str(tmp_path), format="csv")  # pyright: ignore[reportArgumentType]
@@ -0,0 +1,45 @@
+from typing import Any
+
+from pymino.ext import utilities
+
+
+def message(**fields: Any) -> dict[str, Any]:
+    return {
+        "ndcId": 1,
+        "chatMessage": {
+            "threadId": "chat",
+            "uid": "user",
+            "author": {"role": 0},
+            **fields,
+        },
+    }
+
+
+def test_no_filters() -> None:
+    assert utilities.compile_filters() is None
+
+
+def test_single_filters() -> None:
+    predicate = utilities.compile_filters(comId=1)
+    assert predicate is not None
+    assert predicate(message())
+    assert not predicate({**message(), "ndcId": 2})
+
+    predicate = utilities.compile_filters(comId=[2, 3])
+    assert predicate is not None
+    assert not predicate(message())
+
+
+def test_every_filter_must_match() -> None:
+    predicate = utilities.compile_filters(chatIds=["chat"], userIds=["user"], roles=[100, 102])
+    assert predicate is not None
+    assert predicate(message(author={"role": 100}))
+    assert not predicate(message())
+    assert not predicate(message(uid="other", author={"role": 100}))
+
+
+def test_notifications_are_matched_by_their_payload() -> None:
+    predicate = utilities.compile_filters(comId=1, chatIds=["chat"])
+    assert predicate is not None
+    assert predicate({"payload": {"ndcId": 1, "tid": "chat"}})
+    assert not predicate({"payload": {"ndcId": 1, "tid": "other"}})
@@ -0,0 +1,50 @@
+import json
+from typing import Any
+
+from pymino.ext import dispatcher, entities, socket
+
+CHAT = entities.WsMessageTypes.CHAT_MESSAGE_DTO
+NOTIFICATION = entities.WsMessageTypes.PUSH_NOTIFICATION_DTO
+
+
+class _Client:
+    _interesting_frames = socket.WSClient._interesting_frames  # pyright: ignore[reportPrivateUsage]
+    _decode_websocket_message = socket.WSClient._decode_websocket_message  # pyright: ignore[reportPrivateUsage]
+
+    def __init__(self, *events: str) -> None:
+        self.dispatcher = dispatcher.MessageDispatcher()
+        self.dispatcher.register(CHAT, print)
+        self.dispatcher.register(NOTIFICATION, print)
+        self._events: dict[str, Any] = dict.fromkeys(events)
+        self._frame_types: tuple[Any, ...] = (None, None, frozenset())
+
+
+def frame(message_type: int) -> str:
+    return json.dumps({"t": message_type, "o": {"ndcId": 1}})
+
+
+def test_frames_with_a_handler_are_decoded() -> None:
+    client: Any = _Client()
+    assert client._decode_websocket_message(frame(CHAT)) == {"t": CHAT, "o": {"ndcId": 1}}
+    assert client._decode_websocket_message(frame(CHAT).encode()) is not None
+
+
+def test_frames_without_a_handler_are_skipped_before_decoding() -> None:
+    client: Any = _Client()
+    assert client._decode_websocket_message(frame(NOTIFICATION)) is None
+    assert client._decode_websocket_message(frame(304)) is None
+
+
+def test_the_filter_follows_new_events_and_handlers() -> None:
+    client: Any = _Client()
+    assert client._decode_websocket_message(frame(304)) is None
+    client.dispatcher.register(304, print)
+    assert client._decode_websocket_message(frame(304)) is not None
+    client._events["member_set_you_host"] = None
+    assert client._decode_websocket_message(frame(NOTIFICATION)) is not None
+
+
+def test_frames_without_a_type_are_decoded() -> None:
+    client: Any = _Client()
+    assert client._decode_websocket_message('{"o": {}}') == {"o": {}}
+    assert client._decode_websocket_message("not json") is None
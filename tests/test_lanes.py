@@ -0,0 +1,93 @@
+import threading
+import time
+
+from pymino.ext.utilities import Lane, LaneScheduler
+
+
+def _block(scheduler: LaneScheduler, lane: str) -> threading.Event:
+    """Holds one worker until the returned event is set."""
+    started, gate = threading.Event(), threading.Event()
+
+    def wait() -> None:
+        started.set()
+        gate.wait(5)
+
+    scheduler.submit(lane, wait)
+    assert started.wait(5)
+    return gate
+
+
+def test_higher_priority_lanes_are_served_first() -> None:
+    scheduler = LaneScheduler(workers=1)
+    order: list[str] = []
+    done = threading.Event()
+    gate = _block(scheduler, "passive")
+    scheduler.submit("passive", order.append, "passive")
+    scheduler.submit("moderation", order.append, "moderation")
+    scheduler.submit("command", order.append, "command")
+    scheduler.submit("passive", done.set)
+    gate.set()
+    assert done.wait(5)
+    assert order == ["command", "moderation", "passive"]
+
+
+def test_unknown_lanes_fall_back_to_the_lowest_priority() -> None:
+    scheduler = LaneScheduler(workers=1)
+    done = threading.Event()
+    assert scheduler.submit("unknown", done.set)
+    assert done.wait(5)
+    assert scheduler.lanes["passive"].submitted == 1
+
+
+def test_lanes_over_their_backlog_shed_events() -> None:
+    scheduler = LaneScheduler(workers=1, lanes=[Lane("passive", 0, max_backlog=2)])
+    gate = _block(scheduler, "passive")
+    results = [scheduler.submit("passive", lambda: None) for _ in range(4)]
+    gate.set()
+    assert results == [True, True, False, False]
+    assert scheduler.lanes["passive"].dropped == 2
+
+
+def test_sampling_keeps_a_share_of_shed_events() -> None:
+    lane = Lane("passive", 0, max_backlog=0, sample_rate=0.5)
+    assert [lane.admit() for _ in range(4)] == [False, True, False, True]
+
+
+def test_stale_events_are_dropped() -> None:
+    scheduler = LaneScheduler(workers=1, lanes=[Lane("passive", 0, max_age=0.01)])
+    calls: list[str] = []
+    done = threading.Event()
+    gate = _block(scheduler, "passive")
+    scheduler.submit("passive", calls.append, "stale")
+    time.sleep(0.05)
+    gate.set()
+    time.sleep(0.05)
+    scheduler.submit("passive", done.set)
+    assert done.wait(5)
+    assert calls == []
+    assert scheduler.lanes["passive"].dropped == 1
+
+
+def test_default_lanes_never_shed_chat_messages() -> None:
+    lanes = LaneScheduler().lanes
+    assert lanes["command"].max_backlog is None and lanes["command"].max_age is None
+    assert lanes["moderation"].max_backlog is None and lanes["moderation"].max_age is None
+
+
+def test_released_workers_are_replaced() -> None:
+    scheduler = LaneScheduler(workers=1)
+    reply = threading.Event()
+    waited: list[bool] = []
+    done = threading.Event()
+
+    def wait_for_reply() -> None:
+        scheduler.release(threading.get_ident())
+        waited.append(reply.wait(5))
+        done.set()
+
+    scheduler.submit("command", wait_for_reply)
+    time.sleep(0.05)
+    scheduler.submit("moderation", reply.set)
+    assert done.wait(5)
+    assert waited == [True]
+
@@ -0,0 +1,97 @@
+import logging
+import threading
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+
+from pymino import Bot
+from pymino.ext import entities, utilities
+
+
+@pytest.fixture
+def bot() -> Bot:
+    return Bot(service_key="x")
+
+
+def online(comId: int = 1) -> entities.OnlineMembers:
+    return entities.OnlineMembers({"ndcId": comId, "userProfileList": [{}]})
+
+
+def recorder(calls: list[Any], name: Any, result: Any = None) -> Callable[[Any], Any]:
+    def handler(members: Any) -> Any:
+        calls.append(name)
+        return result
+
+    return handler
+
+
+def test_handlers_run_by_priority_then_registration_order(bot: Bot) -> None:
+    calls: list[str] = []
+    for name, priority in (("low", -1), ("first", 0), ("high", 10), ("second", 0)):
+        bot.register_event("user_online", priority=priority)(recorder(calls, name))
+    bot._handle_event("user_online", online())  # pyright: ignore[reportPrivateUsage]
+    assert calls == ["high", "first", "second", "low"]
+
+
+def test_stop_propagation(bot: Bot) -> None:
+    calls: list[str] = []
+    stop = recorder(calls, "stop", utilities.STOP_PROPAGATION)
+    bot.register_event("user_online", priority=1)(stop)
+    bot.register_event("user_online")(recorder(calls, "skipped"))
+    bot._handle_event("user_online", online())  # pyright: ignore[reportPrivateUsage]
+    assert calls == ["stop"]
+
+
+def test_errors_are_isolated(bot: Bot, caplog: pytest.LogCaptureFixture) -> None:
+    calls: list[str] = []
+
+    def failing(members: entities.OnlineMembers) -> None:
+        raise RuntimeError("boom")
+
+    bot.register_event("user_online", priority=1)(failing)
+    bot.register_event("user_online")(recorder(calls, "ran"))
+    with caplog.at_level(logging.ERROR, logger="pymino"):
+        bot._handle_event("user_online", online())  # pyright: ignore[reportPrivateUsage]
+    assert calls == ["ran"]
+    assert "boom" in caplog.text
+
+
+def test_errors_go_to_the_error_handlers(bot: Bot) -> None:
+    errors: list[Exception] = []
+    bot.register_event("error")(errors.append)
+
+    def failing(members: entities.OnlineMembers) -> None:
+        raise RuntimeError("boom")
+
+    bot.register_event("user_online")(failing)
+    bot._handle_event("user_online", online())  # pyright: ignore[reportPrivateUsage]
+    assert [str(error) for error in errors] == ["boom"]
+
+
+def test_filters_and_concurrent_handlers(bot: Bot) -> None:
+    done = threading.Event()
+    calls: list[int] = []
+
+    def concurrent(members: entities.OnlineMembers) -> None:
+        done.set()
+
+    bot.register_event("user_online", comId=2)(recorder(calls, 2))
+    bot.register_event("user_online", concurrent=True)(concurrent)
+    bot._handle_event("user_online", online(comId=1))  # pyright: ignore[reportPrivateUsage]
+    assert done.wait(5)
+    assert calls == []
+
+
+def test_middleware_wraps_the_handlers(bot: Bot) -> None:
+    calls: list[str] = []
+
+    @bot.middleware()
+    def around(event: str, data: Any, handler: Callable[[], None]) -> None:
+        calls.append(f"before {event}")
+        handler()
+        calls.append("after")
+
+    bot.register_event("user_online")(recorder(calls, "handler"))
+    bot._handle_event("user_online", online())  # pyright: ignore[reportPrivateUsage]
+    assert calls == ["before user_online", "handler", "after"]
@@ -0,0 +1,100 @@
+import hashlib
+import http.server
+import io
+import mmap
+import threading
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from pymino.ext import community, entities
+
+
+@pytest.fixture
+def server() -> Iterator[str]:
+    class Handler(http.server.BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            size = int(self.path.strip("/"))
+            self.send_response(200)
+            if size % 2 == 0:
+                self.send_header("Content-Length", str(size))
+            self.end_headers()
+            self.wfile.write(b"x" * size)
+
+        def log_message(self, format: str, *args: Any) -> None:
+            pass
+
+    httpd = http.server.HTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+
+
+def test_bytes() -> None:
+    with entities.MediaSource.open(b"image") as source:
+        assert source.read() == b"image"
+        assert source.digest() == hashlib.sha256(b"image").hexdigest()
+
+
+def test_files_are_memory_mapped(tmp_path: Path) -> None:
+    path = tmp_path / "image.jpg"
+    path.write_bytes(b"image" * 1000)
+    with entities.MediaSource.open(str(path)) as source:
+        assert isinstance(source.view(), mmap.mmap)
+        assert source.digest("md5") == hashlib.md5(b"image" * 1000).hexdigest()
+        assert source.read() == b"image" * 1000
+    with pytest.raises(ValueError):
+        source.read()
+
+
+def test_empty_files(tmp_path: Path) -> None:
+    path = tmp_path / "empty.jpg"
+    path.write_bytes(b"")
+    with entities.MediaSource.open(str(path)) as source:
+        assert len(source) == 0
+
+
+def test_file_objects_are_read_in_chunks() -> None:
+    data = bytes(range(256)) * 1000
+    assert entities.read_media(io.BytesIO(data)) == data
+
+
+def test_invalid_media() -> None:
+    with pytest.raises(entities.InvalidImage):
+        entities.MediaSource.open("no such file")
+    with pytest.raises(entities.InvalidImage):
+        entities.MediaSource.open(io.StringIO("text"))  # pyright: ignore[reportArgumentType]
+
+
+def test_media_over_the_size_limit() -> None:
+    with pytest.raises(entities.FileTooLarge):
+        entities.MediaSource.open(b"x" * 11, max_size=10)
+    with pytest.raises(entities.FileTooLarge):
+        entities.MediaSource.open(io.BytesIO(b"x" * 11), max_size=10)
+
+
+def test_urls_are_streamed_with_a_size_limit(server: str) -> None:
+    with entities.MediaSource.open(f"{server}/10", max_size=10) as source:
+        assert source.read() == b"x" * 10
+    with pytest.raises(entities.FileTooLarge):
+        entities.MediaSource.open(f"{server}/12", max_size=10)
+    with pytest.raises(entities.FileTooLarge):
+        entities.MediaSource.open(f"{server}/11", max_size=10)
+
+
+def test_community_uploads_are_not_read_first() -> None:
+    uploaded: list[Any] = []
+
+    class Community:
+        def upload_media(self, media: Any, content_type: str) -> str:
+            uploaded.append(media)
+            return "value"
+
+    media = io.BytesIO(b"image")
+    handle: Any = community.Community.__handle_media__
+    assert handle(Community(), media, "image/jpg") == "value"
+    assert uploaded == [media]
+    assert media.tell() == 0
+    assert handle(Community(), b"image") == "aW1hZ2U="
@@ -0,0 +1,65 @@
+import time
+from pathlib import Path
+from typing import Any
+
+from pymino.ext import entities, global_client
+from pymino.ext.utilities import MediaCache
+
+
+def test_keys_depend_on_content_and_type() -> None:
+    cache = MediaCache()
+    with entities.MediaSource.open(b"image") as source:
+        assert cache.key(source, "image/jpg") == cache.key(b"image", "image/jpg")
+    assert cache.key(b"image", "image/jpg") != cache.key(b"image", "image/png")
+    assert cache.key(b"image", "image/jpg") != cache.key(b"other", "image/jpg")
+
+
+def test_uploads_expire_after_the_ttl() -> None:
+    cache = MediaCache(ttl=0.05)
+    cache.set("key", "value")
+    assert cache.get("key") == "value"
+    time.sleep(0.1)
+    assert cache.get("key") is None
+
+
+def test_the_least_recently_used_upload_is_evicted() -> None:
+    cache = MediaCache(max_entries=2)
+    cache.set("a", "1")
+    cache.set("b", "2")
+    cache.get("a")
+    cache.set("c", "3")
+    assert (cache.get("a"), cache.get("b"), cache.get("c")) == ("1", None, "3")
+
+
+def test_uploads_persist_on_disk(tmp_path: Path) -> None:
+    MediaCache(str(tmp_path)).set("key", "value")
+    cache = MediaCache(str(tmp_path))
+    assert len(cache) == 0
+    assert cache.get("key") == "value"
+    cache.clear()
+    assert MediaCache(str(tmp_path)).get("key") is None
+
+
+class _Request:
+    def __init__(self) -> None:
+        self.uploads: list[bytes] = []
+
+    def handler(self, method: str, url: str, data: bytes, content_type: str) -> dict[str, Any]:
+        self.uploads.append(data)
+        return {"mediaValue": f"media-{len(self.uploads)}"}
+
+
+class _Client:
+    def __init__(self) -> None:
+        self.request = _Request()
+        self.media_cache = MediaCache()
+        self.is_authenticated = True
+
+
+def test_the_same_content_is_uploaded_once() -> None:
+    client: Any = _Client()
+    upload = global_client.Global.upload_media
+    assert upload(client, b"image") == "media-1"
+    assert upload(client, b"image") == "media-1"
+    assert upload(client, b"image", "image/png") == "media-2"
+    assert client.request.uploads == [b"image", b"image"]
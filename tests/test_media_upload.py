@@ -0,0 +1,59 @@
+import threading
+import time
+from typing import Any, Optional
+
+import pytest
+
+from pymino.ext import community, entities, utilities
+
+
+class _Community:
+    def __init__(self) -> None:
+        self.active = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def __handle_media__(self, media: bytes, content_type: Optional[str] = None) -> str:
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(0.01 * (5 - len(media)))
+        with self.lock:
+            self.active -= 1
+        if media == b"bad":
+            raise entities.InvalidImage
+        return media.decode()
+
+
+upload: Any = community.Community.__upload_media_list__
+
+
+def test_map_concurrent_keeps_the_input_order() -> None:
+    results, errors = utilities.map_concurrent(lambda n: n * 2, [3, 2, 1, 0])
+    assert results == [6, 4, 2, 0]
+    assert errors == {}
+
+
+def test_map_concurrent_collects_errors_by_index() -> None:
+    results, errors = utilities.map_concurrent(lambda n: 1 // n, [1, 0, 1])
+    assert results == [1, None, 1]
+    assert list(errors) == [1]
+    assert isinstance(errors[1], ZeroDivisionError)
+
+
+def test_uploads_run_concurrently_in_order() -> None:
+    fake = _Community()
+    assert upload(fake, [b"a", b"bb", b"ccc", b"dddd"]) == ["a", "bb", "ccc", "dddd"]
+    assert fake.peak > 1
+
+
+def test_a_single_media_raises_its_own_error() -> None:
+    with pytest.raises(entities.InvalidImage):
+        upload(_Community(), [b"bad"])
+
+
+def test_a_batch_raises_media_upload_failed() -> None:
+    with pytest.raises(entities.MediaUploadFailed) as info:
+        upload(_Community(), [b"a", b"bad", b"c"])
+    assert info.value.results == ["a", None, "c"]
+    assert list(info.value.errors) == [1]
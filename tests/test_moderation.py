@@ -0,0 +1,74 @@
+import logging
+from typing import Any
+
+import pytest
+
+from pymino.ext import entities, utilities
+
+
+class _Flaky:
+    def __init__(self, failures: int) -> None:
+        self.failures = failures
+        self.calls: list[tuple[Any, ...]] = []
+
+    def __call__(self, *args: Any, **kwargs: Any) -> str:
+        self.calls.append((args, kwargs))
+        if self.failures:
+            self.failures -= 1
+            raise entities.BadGateway
+        return "ok"
+
+
+def moderator(**handlers: Any) -> utilities.BulkModerator:
+    return utilities.BulkModerator(handlers, rates={name: 0 for name in handlers}, backoff=0)
+
+
+def test_targets_are_passed_by_shape() -> None:
+    ban = _Flaky(0)
+    report = moderator(ban=ban).run(
+        [("ban", "user"), ("ban", ("user", "reason")), ("ban", {"userId": "user"})]
+    )
+    assert len(report.succeeded) == 3
+    expected: list[tuple[Any, ...]] = [
+        (("user",), {}),
+        (("user", "reason"), {}),
+        ((), {"userId": "user"}),
+    ]
+    assert sorted(ban.calls, key=repr) == sorted(expected, key=repr)
+
+
+def test_transient_errors_are_retried() -> None:
+    report = moderator(kick=_Flaky(2)).run([("kick", "user")])
+    [result] = report.results
+    assert result.ok
+    assert result.attempts == 3
+
+
+def test_failures_are_reported_in_input_order() -> None:
+    def warn(userId: str) -> None:
+        if userId == "b":
+            raise entities.Forbidden
+
+    report = moderator(warn=warn, kick=_Flaky(10)).run(
+        [("warn", "a"), ("warn", "b"), ("kick", "c"), ("mute", "d")]
+    )
+    assert [result.target for result in report] == ["a", "b", "c", "d"]
+    assert [result.target for result in report.failed] == ["b", "c", "d"]
+    assert report.results[1].attempts == 1
+    assert report.results[2].attempts == 4
+    assert isinstance(report.results[3].error, ValueError)
+    assert report.json()["succeeded"] == 1
+
+
+def test_progress_errors_do_not_stop_the_run(caplog: pytest.LogCaptureFixture) -> None:
+    seen: list[str] = []
+
+    def progress(result: utilities.ModerationResult) -> None:
+        seen.append(result.target)  # pyright: ignore[reportArgumentType]
+        raise RuntimeError
+
+    with caplog.at_level(logging.ERROR, logger="pymino"):
+        report = moderator(ban=_Flaky(0)).run([("ban", "a"), ("ban", "b")], progress)
+    assert len(report.succeeded) == 2
+    assert sorted(seen) == ["a", "b"]
+    assert "progress callback" in caplog.text
@@ -0,0 +1,124 @@
+import threading
+import time
+from types import SimpleNamespace
+from typing import Any
+
+from pymino.ext import context, entities
+from pymino.ext.utilities import OutboundQueue
+
+
+def _block(outbound: OutboundQueue, key: str) -> threading.Event:
+    """Holds the worker of `key` until the returned event is set."""
+    started, gate = threading.Event(), threading.Event()
+
+    def wait() -> None:
+        started.set()
+        gate.wait(5)
+
+    outbound.submit(key, wait)
+    assert started.wait(5)
+    return gate
+
+
+def test_calls_of_a_key_run_in_order() -> None:
+    outbound = OutboundQueue(workers=4)
+    calls: list[int] = []
+    futures = [outbound.submit("chat", calls.append, i) for i in range(50)]
+    for future in futures:
+        future.result(5)
+    assert calls == list(range(50))
+
+
+def test_keys_run_in_parallel() -> None:
+    outbound = OutboundQueue(workers=2)
+    gate = _block(outbound, "slow")
+    assert outbound.submit("fast", lambda: "done").result(5) == "done"
+    gate.set()
+
+
+def test_reentrant_submit_runs_inline() -> None:
+    outbound = OutboundQueue(workers=1)
+
+    def outer() -> str:
+        return outbound.submit("chat", lambda: "inner").result(5)
+
+    assert outbound.submit("chat", outer).result(5) == "inner"
+
+
+def test_texts_are_coalesced() -> None:
+    outbound = OutboundQueue(coalesce_window=0.05)
+    sent: list[str] = []
+
+    def send(text: str) -> int:
+        sent.append(text)
+        return len(sent)
+
+    gate = _block(outbound, "chat")
+    futures = [outbound.submit_text("chat", send, text) for text in ("a", "b", "c")]
+    gate.set()
+    assert [future.result(5) for future in futures] == [1, 1, 1]
+    assert sent == ["a\nb\nc"]
+    assert outbound.stats()["coalesced"] == 2
+
+
+def test_coalescing_respects_the_limit() -> None:
+    outbound = OutboundQueue(coalesce_window=0.05, coalesce_limit=3)
+    sent: list[str] = []
+    gate = _block(outbound, "chat")
+    futures = [outbound.submit_text("chat", sent.append, text) for text in ("a", "b", "c")]
+    gate.set()
+    for future in futures:
+        future.result(5)
+    assert sent == ["a\nb", "c"]
+
+
+def test_plain_calls_are_never_coalesced() -> None:
+    outbound = OutboundQueue(coalesce_window=0.05)
+    sent: list[str] = []
+    gate = _block(outbound, "chat")
+    first = outbound.submit_text("chat", sent.append, "a")
+    second = outbound.submit("chat", sent.append, "b")
+    gate.set()
+    first.result(5)
+    second.result(5)
+    assert sent == ["a", "b"]
+
+
+def test_cancelled_calls_are_skipped() -> None:
+    outbound = OutboundQueue()
+    calls: list[int] = []
+    gate = _block(outbound, "chat")
+    cancelled = outbound.submit("chat", calls.append, 1)
+    assert cancelled.cancel()
+    kept = outbound.submit("chat", calls.append, 2)
+    gate.set()
+    kept.result(5)
+    time.sleep(0.01)
+    assert calls == [2]
+    assert outbound.pending("chat") == 0
+
+
+def test_context_sends_return_futures_in_order() -> None:
+    posted: list[str] = []
+
+    def handler(method: str, url: str, data: dict[str, Any]) -> dict[str, Any]:
+        posted.append(data["content"])
+        return {"message": {"content": data["content"], "threadId": "chat"}}
+
+    def typing(*args: Any, **kwargs: Any) -> None:
+        pass
+
+    bot: Any = SimpleNamespace(
+        outbound=OutboundQueue(),
+        request=SimpleNamespace(handler=handler),
+        websocket_writer=SimpleNamespace(typing=typing),
+        userId="bot",
+    )
+    message = entities.Message(
+        {"o": {"ndcId": 1, "chatMessage": {"threadId": "chat", "messageId": "m"}}}
+    )
+    ctx = context.Context(message, bot)
+    futures = [ctx.send_nowait(str(number)) for number in range(10)]
+    futures.append(ctx.reply_nowait("reply"))
+    assert [future.result(5).content for future in futures] == [*map(str, range(10)), "reply"]
+    assert posted == [*map(str, range(10)), "reply"]
@@ -0,0 +1,56 @@
+from typing import Optional
+
+from pymino.ext import utilities
+
+ITEMS = list(range(60))
+
+
+def fetch_offset(start: int, size: int) -> list[int]:
+    return ITEMS[start : start + size]
+
+
+def fetch_token(token: Optional[str], size: int) -> tuple[list[int], Optional[str]]:
+    start = int(token or 0)
+    end = start + size
+    return ITEMS[start:end], str(end) if end < len(ITEMS) else None
+
+
+def test_offsets_are_paged_until_a_short_page() -> None:
+    for prefetch in (True, False):
+        pages = utilities.Paginator[int].from_offset(fetch_offset, size=25, prefetch=prefetch)
+        assert list(pages) == ITEMS
+        assert pages.done
+
+
+def test_tokens_are_paged_until_there_is_no_next_token() -> None:
+    pages = utilities.Paginator[int].from_token(fetch_token, size=25)
+    assert list(pages) == ITEMS
+    assert pages.cursor is None
+
+
+def test_limit() -> None:
+    assert list(utilities.Paginator[int].from_offset(fetch_offset, limit=30)) == ITEMS[:30]
+    assert list(utilities.Paginator[int].from_token(fetch_token, limit=5)) == ITEMS[:5]
+
+
+def test_offsets_resume_in_the_middle_of_a_page() -> None:
+    pages = utilities.Paginator[int].from_offset(fetch_offset, size=25)
+    seen: list[int] = []
+    for item in pages:
+        seen.append(item)
+        if item == 31:
+            break
+    assert pages.cursor == 32
+    resumed = utilities.Paginator[int].from_offset(fetch_offset, start=pages.cursor)
+    assert seen + list(resumed) == ITEMS
+
+
+def test_tokens_resume_at_the_next_page() -> None:
+    pages = utilities.Paginator[int].from_token(fetch_token, size=25, limit=25)
+    assert list(pages) == ITEMS[:25]
+    assert pages.cursor == "25"
+    assert list(utilities.Paginator[int].from_token(fetch_token, pages.cursor)) == ITEMS[25:]
+
+
+def test_empty_pages_end_the_iteration() -> None:
+    assert list(utilities.Paginator[int].from_token(lambda token, size: ([], "next"))) == []
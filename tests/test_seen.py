@@ -0,0 +1,37 @@
+import time
+
+from pymino.ext import utilities
+
+
+def test_duplicates_are_rejected() -> None:
+    seen = utilities.SeenSet()
+    assert seen.add("a")
+    assert not seen.add("a")
+    assert seen.add(("notification", "a"))
+    assert "a" in seen
+    assert "b" not in seen
+
+
+def test_the_oldest_keys_are_evicted() -> None:
+    seen = utilities.SeenSet(maxsize=3)
+    for key in "abcd":
+        assert seen.add(key)
+    assert len(seen) == 3
+    assert "a" not in seen
+    assert seen.add("a")
+
+
+def test_keys_expire() -> None:
+    seen = utilities.SeenSet(ttl=0.01)
+    assert seen.add("a")
+    time.sleep(0.02)
+    assert "a" not in seen
+    assert seen.add("a")
+
+
+def test_clear() -> None:
+    seen = utilities.SeenSet()
+    seen.add("a")
+    seen.clear()
+    assert len(seen) == 0
+    assert seen.add("a")
@@ -0,0 +1,89 @@
+import threading
+import time
+from typing import Optional
+
+from pymino.ext.utilities import SessionManager
+
+
+class _Bot:
+    def __init__(self, fail: bool = False) -> None:
+        self.sid: Optional[str] = "old"
+        self.fail = fail
+        self.logins = 0
+        self.release = threading.Event()
+        self.release.set()
+
+    def refresh_login(self) -> None:
+        self.logins += 1
+        self.release.wait(5)
+        if self.fail:
+            raise RuntimeError("rejected")
+        self.sid = f"new-{self.logins}"
+
+
+class _Request:
+    def __init__(self, bot: _Bot) -> None:
+        self.bot = bot
+        self.email: Optional[str] = "email"
+        self.password: Optional[str] = "password"
+
+
+def _manager(bot: _Bot) -> SessionManager:
+    return SessionManager(_Request(bot))  # pyright: ignore[reportArgumentType]
+
+
+def test_refresh_logs_in_again() -> None:
+    bot = _Bot()
+    assert _manager(bot).refresh("old")
+    assert (bot.logins, bot.sid) == (1, "new-1")
+
+
+def test_concurrent_refreshes_share_one_login() -> None:
+    bot = _Bot()
+    bot.release.clear()
+    manager = _manager(bot)
+    results: list[bool] = []
+    threads = [
+        threading.Thread(target=lambda: results.append(manager.refresh("old")))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.05)
+    assert manager.refreshing
+    bot.release.set()
+    for thread in threads:
+        thread.join(5)
+    assert results == [True] * 8
+    assert bot.logins == 1
+
+
+def test_an_already_replaced_session_is_not_refreshed() -> None:
+    bot = _Bot()
+    bot.sid = "replaced"
+    assert _manager(bot).refresh("old")
+    assert bot.logins == 0
+
+
+def test_a_failed_refresh_keeps_the_session() -> None:
+    bot = _Bot(fail=True)
+    manager = _manager(bot)
+    assert not manager.refresh("old")
+    assert bot.sid == "old"
+    assert not manager.refreshing
+
+
+def test_refreshing_needs_credentials() -> None:
+    bot = _Bot()
+    manager = _manager(bot)
+    assert manager.can_refresh
+    manager.request.password = None
+    assert not manager.can_refresh
+
+
+def test_an_invalid_sid_has_no_expire_time() -> None:
+    bot = _Bot()
+    bot.sid = "not a sid"
+    manager = _manager(bot)
+    assert manager.expire_time() is None
+    assert not manager.expired()
@@ -0,0 +1,80 @@
+import logging
+import threading
+import time
+
+import pytest
+
+from pymino.ext import utilities
+
+
+def test_calls_errors_and_percentiles() -> None:
+    stats = utilities.HandlerStats(slow_threshold=None)
+    for elapsed in range(1, 101):
+        stats.record("handler", elapsed / 1000, error=elapsed % 10 == 0)
+    [row] = stats.report()
+    assert row["calls"] == 100
+    assert row["errors"] == 10
+    assert row["max"] == 0.1
+    assert row["p50"] == 0.051
+    assert row["p99"] == 0.1
+
+
+def test_report_is_sorted() -> None:
+    stats = utilities.HandlerStats()
+    stats.record("fast", 0.001)
+    stats.record("slow", 0.01)
+    stats.record("fast", 0.001)
+    assert [row["name"] for row in stats.report()] == ["slow", "fast"]
+    assert [row["name"] for row in stats.report(sort_by="calls")] == ["fast", "slow"]
+    stats.reset()
+    assert len(stats) == 0
+
+
+def test_measure_counts_exceptions() -> None:
+    stats = utilities.HandlerStats()
+    with stats.measure("handler"):
+        pass
+    with pytest.raises(ValueError):
+        with stats.measure("handler"):
+            raise ValueError
+    [row] = stats.report()
+    assert (row["calls"], row["errors"]) == (2, 1)
+
+
+def test_slow_calls_are_logged(caplog: pytest.LogCaptureFixture) -> None:
+    stats = utilities.HandlerStats(slow_threshold=0.5)
+    with caplog.at_level(logging.WARNING, logger="pymino"):
+        stats.record("handler", 0.1)
+        stats.record("handler", 0.6)
+    assert caplog.text.count("Slow handler handler") == 1
+
+
+def test_disabled_stats_record_nothing() -> None:
+    stats = utilities.HandlerStats()
+    stats.enabled = False
+    stats.record("handler", 0.1)
+    assert stats.report() == []
+
+
+def busy(stop: threading.Event) -> None:
+    while not stop.is_set():
+        sum(range(100))
+
+
+def test_profiler_samples_other_threads() -> None:
+    stop = threading.Event()
+    worker = threading.Thread(target=busy, args=(stop,))
+    worker.start()
+    profiler = utilities.SamplingProfiler(interval=0.001, depth=3)
+    profiler.start()
+    time.sleep(0.2)
+    profiler.stop()
+    stop.set()
+    worker.join()
+    assert not profiler.running
+    assert profiler.samples > 0
+    assert any(
+        any(frame.endswith(":busy") for frame in row["stack"]) for row in profiler.report()
+    )
+    profiler.reset()
+    assert profiler.report() == []
@@ -0,0 +1,56 @@
+import re
+
+from pymino.ext.utilities import TriggerEngine
+
+
+def test_keywords_match_substrings_by_default() -> None:
+    engine: TriggerEngine[str] = TriggerEngine()
+    engine.add_keywords(["cat"], "cat")
+    assert engine.match("Concatenate") == {"cat": {"keywords": ["cat"]}}
+
+
+def test_whole_word_keywords() -> None:
+    engine: TriggerEngine[str] = TriggerEngine()
+    engine.add_keywords(["cat"], "cat", whole_word=True)
+    assert "cat" in engine.match("a cat!")
+    assert "cat" in engine.match("CAT")
+    assert "cat" in engine.match("cat")
+    assert engine.match("concatenate") == {}
+    assert engine.match("cats") == {}
+    assert engine.match("cat_food") == {}
+
+
+def test_whole_word_keywords_after_text_that_grows_when_lowered() -> None:
+    engine: TriggerEngine[str] = TriggerEngine()
+    engine.add_keywords(["cat"], "cat", whole_word=True)
+    assert engine.match("İcat") == {}
+    assert "cat" in engine.match("İ cat")
+
+
+def test_whole_word_keywords_next_to_combining_marks() -> None:
+    engine: TriggerEngine[str] = TriggerEngine()
+    engine.add_keywords(["cafe"], "cafe", whole_word=True)
+    assert engine.match("café") == {}
+
+
+def test_case_sensitive_keywords() -> None:
+    engine: TriggerEngine[str] = TriggerEngine()
+    engine.add_keywords(["NSFW"], "nsfw", case_sensitive=True, whole_word=True)
+    assert "nsfw" in engine.match("this is NSFW")
+    assert engine.match("this is nsfw") == {}
+
+
+def test_every_keyword_of_a_value_is_reported_once() -> None:
+    engine: TriggerEngine[str] = TriggerEngine()
+    engine.add_keywords(["spam", "scam"], "bad")
+    assert engine.match("spam scam spam") == {"bad": {"keywords": ["spam", "scam"]}}
+
+
+def test_patterns() -> None:
+    engine: TriggerEngine[str] = TriggerEngine()
+    engine.add_pattern(r"https?://\S+", "link")
+    engine.add_pattern(re.compile(r"\d{4}"), "year")
+    triggered = engine.match("see http://example.com in 2024")
+    assert triggered["link"]["match"].group() == "http://example.com"
+    assert triggered["year"]["match"].group() == "2024"
+    assert len(engine) == 2
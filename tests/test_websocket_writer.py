@@ -0,0 +1,97 @@
+import threading
+from typing import Union
+
+from pymino.ext.utilities import WebsocketWriter
+
+
+class _Socket:
+    """Records written frames, holding the writer on `"gate"` until `release` is set."""
+
+    def __init__(self) -> None:
+        self.frames: list[Union[bytes, str]] = []
+        self.blocked = threading.Event()
+        self.release = threading.Event()
+        self.done = threading.Event()
+
+    def write(self, data: Union[bytes, str]) -> bool:
+        if data == "gate":
+            self.blocked.set()
+            self.release.wait(5)
+        elif data == "done":
+            self.done.set()
+        else:
+            self.frames.append(data)
+        return True
+
+
+def _flush(writer: WebsocketWriter, socket: _Socket) -> None:
+    writer.send("done")
+    assert socket.done.wait(5)
+    socket.done.clear()
+
+
+def test_payloads_are_encoded_once() -> None:
+    socket = _Socket()
+    writer = WebsocketWriter(socket.write)
+    writer.send({"t": 116})
+    writer.send(b"raw")
+    _flush(writer, socket)
+    assert socket.frames == ['{"t":116}', b"raw"]
+    assert writer.stats()["sent"] == 3
+
+
+def test_nested_typing_sends_one_start_and_one_stop() -> None:
+    socket = _Socket()
+    writer = WebsocketWriter(socket.write)
+    writer.typing("chat", "start", True)
+    _flush(writer, socket)
+    writer.typing("chat", "start", True)
+    writer.typing("chat", "stop", False)
+    _flush(writer, socket)
+    assert socket.frames == ["start"]
+    writer.typing("chat", "stop", False)
+    _flush(writer, socket)
+    assert socket.frames == ["start", "stop"]
+    assert writer.coalesced == 2
+
+
+def test_unsent_start_is_dropped_with_its_stop() -> None:
+    socket = _Socket()
+    writer = WebsocketWriter(socket.write)
+    writer.send("gate")
+    assert socket.blocked.wait(5)
+    writer.typing("chat", "start", True)
+    writer.typing("chat", "start", True)
+    writer.typing("chat", "stop", False)
+    writer.typing("chat", "stop", False)
+    socket.release.set()
+    _flush(writer, socket)
+    assert socket.frames == []
+    assert writer.coalesced == 4
+
+
+def test_typing_is_counted_per_chat() -> None:
+    socket = _Socket()
+    writer = WebsocketWriter(socket.write)
+    writer.typing("a", "start a", True)
+    writer.typing("b", "start b", True)
+    _flush(writer, socket)
+    writer.typing("a", "stop a", False)
+    _flush(writer, socket)
+    assert socket.frames == ["start a", "start b", "stop a"]
+
+
+def test_failed_writes_are_counted() -> None:
+    def write(data: Union[bytes, str]) -> bool:
+        if data == "error":
+            raise OSError("closed")
+        if data == "done":
+            done.set()
+        return data != "dropped"
+
+    done = threading.Event()
+    writer = WebsocketWriter(write)
+    for frame in ("error", "dropped", "done"):
+        writer.send(frame)
+    assert done.wait(5)
+    assert (writer.errors, writer.dropped, writer.sent) == (1, 1, 1)